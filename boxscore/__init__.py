@@ -1,2 +1,24 @@
+import boxscore.bootstrap
 import boxscore.boxscore
-import boxscore.boxscoreschema
\ No newline at end of file
+import boxscore.boxscoreschema
+import boxscore.cluster
+import boxscore.dates
+import boxscore.export
+import boxscore.index
+import boxscore.ingest
+import boxscore.joint
+import boxscore.loader
+import boxscore.massey
+import boxscore.matchup
+import boxscore.models
+import boxscore.plotting
+import boxscore.projection
+import boxscore.rating
+import boxscore.regression
+import boxscore.sampler
+import boxscore.shared
+import boxscore.skill
+import boxscore.storage
+import boxscore.table
+import boxscore.team
+import boxscore.workspace
\ No newline at end of file
@@ -0,0 +1,320 @@
+import numpy
+from boxscore.regression import fit_polynomial, \
+                                evaluate_polynomial, \
+                                format_polynomial
+from boxscore.shared import SharedDataset
+from boxscore.skill import SKILL_DIFF_BINS, \
+                           get_skill_diff_bins, \
+                           normalize_skill_diffs
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Type, Tuple, List
+
+# The degrees of the mean & std score regression models
+MEAN_MODEL_DEGREE = 1
+STD_MODEL_DEGREE = 2
+
+def get_norm_diffs() -> numpy.ndarray:
+    """
+    Returns the normalized skill differential of each bin
+
+    Args:
+    None
+
+    Returns:
+    numpy.ndarray: The normalized skill differentials
+    """
+    return normalize_skill_diffs(numpy.arange(SKILL_DIFF_BINS))
+
+def get_skill_diff_games(
+        games: List[Dict[str, Any]], away: bool = False
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Extracts the skill differential bin & score of one side of each game
+
+    Args:
+    games (list): The labeled box score dicts
+    away (bool): Whether to extract the away side rather than the home side
+
+    Returns:
+    numpy.ndarray: The skill differential bin of each game
+    numpy.ndarray: The score of each game
+    """
+    offense, defense, score = "home_offense", "away_defense", "home_score"
+    if away:
+        offense, defense, score = "away_offense", "home_defense", "away_score"
+    bins = get_skill_diff_bins(
+        [ g[offense] for g in games ], [ g[defense] for g in games ]
+    )
+    scores = numpy.array([ g[score] for g in games ])
+    return bins.astype(numpy.int8), scores.astype(numpy.int16)
+
+def summarize_bins(
+        weights: numpy.ndarray, bins: numpy.ndarray, scores: numpy.ndarray
+    ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """
+    Computes the count, mean & sample std of the scores in each skill
+    differential bin for a batch of game weightings at once
+
+    Args:
+    weights (numpy.ndarray): The weight of each game per replicate, (R, n)
+    bins (numpy.ndarray): The skill differential bin of each game
+    scores (numpy.ndarray): The score of each game
+
+    Returns:
+    numpy.ndarray: The count of each bin per replicate, (R, bins)
+    numpy.ndarray: The mean score of each bin per replicate, (R, bins)
+    numpy.ndarray: The std score of each bin per replicate, (R, bins)
+    """
+    scores = scores.astype(float)
+    onehot = numpy.zeros((len(bins), SKILL_DIFF_BINS))
+    onehot[numpy.arange(len(bins)), bins] = 1.0
+    moments = numpy.hstack([
+        onehot, onehot * scores[:, None], onehot * (scores ** 2)[:, None]
+    ])
+    count, total, total_sq = numpy.split(
+        weights.astype(float) @ moments, 3, axis=-1
+    )
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        std = numpy.sqrt(
+            numpy.maximum(total_sq - total * mean, 0.0) / (count - 1)
+        )
+    mean[count < 1] = numpy.nan
+    std[count < 2] = numpy.nan
+    return count, mean, std
+
+def fit_score_models(
+        weights: numpy.ndarray, bins: numpy.ndarray, scores: numpy.ndarray
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Fits the mean & std score regression models over the bin summaries of
+    a batch of game weightings in closed form
+
+    Args:
+    weights (numpy.ndarray): The weight of each game per replicate, (R, n)
+    bins (numpy.ndarray): The skill differential bin of each game
+    scores (numpy.ndarray): The score of each game
+
+    Returns:
+    numpy.ndarray: The mean model coefficients per replicate
+    numpy.ndarray: The std model coefficients per replicate
+    """
+    _, mean, std = summarize_bins(weights, bins, scores)
+    x = get_norm_diffs()
+    mean_coef = fit_polynomial(x, mean, MEAN_MODEL_DEGREE)
+    std_coef = fit_polynomial(x, std, STD_MODEL_DEGREE)
+    return mean_coef, std_coef
+
+def run_replicates(
+        bins: numpy.ndarray,
+        scores: numpy.ndarray,
+        n_replicates: int,
+        seed: numpy.random.SeedSequence
+    ) -> Dict[str, numpy.ndarray]:
+    """
+    Runs a batch of bootstrap replicates, resampling games with replacement
+    and scoring each replicate's fit on its out-of-bag games
+
+    Args:
+    bins (numpy.ndarray): The skill differential bin of each game
+    scores (numpy.ndarray): The score of each game
+    n_replicates (int): The number of replicates to run
+    seed (numpy.random.SeedSequence): The seed for this batch
+
+    Returns:
+    dict: The coefficients & out-of-bag errors of each replicate
+    """
+    rng = numpy.random.default_rng(seed)
+    n = len(bins)
+    weights = rng.multinomial(n, numpy.full(n, 1.0 / n), size=n_replicates)
+    mean_coef, std_coef = fit_score_models(weights, bins, scores)
+
+    # Score the mean model per game & the std model per bin out-of-bag
+    x = get_norm_diffs()
+    oob = (weights == 0).astype(float)
+    predicted = evaluate_polynomial(mean_coef, x)[:, bins]
+    errors = (predicted - scores[None, :]) ** 2
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        mean_rmse = numpy.sqrt((errors * oob).sum(axis=1) / oob.sum(axis=1))
+    _, _, oob_std = summarize_bins(oob, bins, scores)
+    std_errors = (evaluate_polynomial(std_coef, x) - oob_std) ** 2
+    std_rmse = numpy.sqrt(numpy.nanmean(std_errors, axis=1))
+    return {
+        "mean_coef": mean_coef,
+        "std_coef": std_coef,
+        "mean_rmse": mean_rmse,
+        "std_rmse": std_rmse
+    }
+
+def run_shared_replicates(
+        handle: Dict[str, Any],
+        n_replicates: int,
+        seed: numpy.random.SeedSequence
+    ) -> Dict[str, numpy.ndarray]:
+    """
+    Runs a batch of bootstrap replicates over games published in a shared
+    dataset, so that workers read the games in place
+
+    Args:
+    handle (dict): The handle of the shared bins & scores
+    n_replicates (int): The number of replicates to run
+    seed (numpy.random.SeedSequence): The seed for this batch
+
+    Returns:
+    dict: The coefficients & out-of-bag errors of each replicate
+    """
+    games = SharedDataset.attach(handle)
+    return run_replicates(
+        games["bins"], games["scores"], n_replicates, seed
+    )
+
+class BootstrapResult:
+    def __init__(
+            self,
+            estimates: Dict[str, numpy.ndarray],
+            replicates: Dict[str, numpy.ndarray],
+            confidence: float
+        ) -> Type["BootstrapResult"]:
+        """
+        Constructor for the BootstrapResult class
+
+        Args:
+        estimates (dict): The coefficients fit on the full data
+        replicates (dict): The coefficients & errors of each replicate
+        confidence (float): The confidence level of the intervals
+
+        Returns:
+        BootstrapResult: The initialized BootstrapResult
+        """
+        self.estimates = estimates
+        self.replicates = replicates
+        self.confidence = confidence
+
+    def get_interval(self, name: str) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the percentile confidence interval of a replicated quantity
+
+        Args:
+        name (str): The replicated quantity, e.g. mean_coef
+
+        Returns:
+        numpy.ndarray: The lower bound
+        numpy.ndarray: The upper bound
+        """
+        alpha = (1.0 - self.confidence) / 2.0
+        values = self.replicates[name]
+        lower = numpy.nanquantile(values, alpha, axis=0)
+        upper = numpy.nanquantile(values, 1.0 - alpha, axis=0)
+        return lower, upper
+
+    def __str__(self) -> str:
+        """
+        Serializes the BootstrapResult instance as a string
+
+        Args:
+        None
+
+        Returns:
+        str: The string-serialized BootstrapResult
+        """
+        n_replicates = len(self.replicates["mean_coef"])
+        lines = [ f"Replicates: {n_replicates}" ]
+        for name, label in [("mean_coef", "Mean"), ("std_coef", "Std")]:
+            lower, upper = self.get_interval(name)
+            lines.append(
+                f"\n{label} model: {format_polynomial(self.estimates[name])}"
+            )
+            for power, (lo, hi) in enumerate(zip(lower, upper)):
+                lines.append(
+                    f"  x^{power} {self.confidence:.0%} CI: " + \
+                    f"[{lo:.8f}, {hi:.8f}]"
+                )
+        for name, label in [("mean_rmse", "Mean"), ("std_rmse", "Std")]:
+            lower, upper = self.get_interval(name)
+            lines.append(
+                f"\n{label} model out-of-bag RMSE: " + \
+                f"{numpy.nanmean(self.replicates[name]):.4f} " + \
+                f"[{lower:.4f}, {upper:.4f}]"
+            )
+        return "\n".join(lines)
+
+    def __json__(self) -> Dict[str, Any]:
+        """
+        Serializes the BootstrapResult instance as a JSON dict
+
+        Args:
+        None
+
+        Returns:
+        dict: The JSON-serialized BootstrapResult
+        """
+        obj = {
+            "replicates": len(self.replicates["mean_coef"]),
+            "confidence": self.confidence
+        }
+        for name in self.replicates.keys():
+            lower, upper = self.get_interval(name)
+            obj[name] = {
+                "lower": numpy.atleast_1d(lower).tolist(),
+                "upper": numpy.atleast_1d(upper).tolist()
+            }
+            if name in self.estimates:
+                obj[name]["estimate"] = self.estimates[name].tolist()
+            else:
+                obj[name]["mean"] = float(
+                    numpy.nanmean(self.replicates[name])
+                )
+        return obj
+
+def bootstrap_score_models(
+        bins: numpy.ndarray,
+        scores: numpy.ndarray,
+        n_replicates: int = 2000,
+        n_workers: int = None,
+        confidence: float = 0.95,
+        seed: int = 0,
+        chunk_size: int = 100
+    ) -> BootstrapResult:
+    """
+    Bootstraps the mean & std score regression models by resampling games,
+    spreading batches of replicates across a process pool
+
+    Args:
+    bins (numpy.ndarray): The skill differential bin of each game
+    scores (numpy.ndarray): The score of each game
+    n_replicates (int): The number of replicates to run
+    n_workers (int): The number of worker processes, defaults to the CPUs
+    confidence (float): The confidence level of the intervals
+    seed (int): The random seed
+    chunk_size (int): The number of replicates per batch
+
+    Returns:
+    BootstrapResult: The coefficient intervals & out-of-bag errors
+    """
+    if n_replicates < 1:
+        raise ValueError(
+            f"Bootstrapping requires at least 1 replicate, got {n_replicates}"
+        )
+    mean_coef, std_coef = fit_score_models(
+        numpy.ones((1, len(bins))), bins, scores
+    )
+    estimates = { "mean_coef": mean_coef[0], "std_coef": std_coef[0] }
+
+    # Give each batch an independent seed so results don't depend on workers
+    sizes = [ chunk_size ] * (n_replicates // chunk_size)
+    if n_replicates % chunk_size:
+        sizes.append(n_replicates % chunk_size)
+    seeds = numpy.random.SeedSequence(seed).spawn(len(sizes))
+    with SharedDataset({ "bins": bins, "scores": scores }) as games, \
+            ProcessPoolExecutor(max_workers=n_workers) as executor:
+        batches = list(executor.map(
+            run_shared_replicates,
+            [ games.get_handle() ] * len(sizes),
+            sizes,
+            seeds
+        ))
+    replicates = {
+        name: numpy.concatenate([ batch[name] for batch in batches ])
+        for name in batches[0].keys()
+    }
+    return BootstrapResult(estimates, replicates, confidence)
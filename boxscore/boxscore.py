@@ -1,6 +1,14 @@
+import hashlib
 import json
-import pandas
-from boxscore.boxscoreschema import BOX_SCORE_SCHEMA, BOX_SCORE_LIST_SCHEMA
+import math
+import numpy
+from boxscore.boxscoreschema import BOX_SCORE_SCHEMA, \
+                                   BOX_SCORE_LIST_SCHEMA, \
+                                   LABELED_BOX_SCORE_SCHEMA, \
+                                   LABELED_BOX_SCORE_LIST_SCHEMA, \
+                                   LABELED_TIER_FIELDS
+from boxscore.dates import parse_dates
+from boxscore.team import format_team_season
 from jsonschema import validate, ValidationError
 from typing import Dict, Any, Type, Tuple, List
 
@@ -33,6 +41,40 @@ class BoxScore:
             return False, str(ve)
         return True, ""
 
+    @staticmethod
+    def get_key_static(score_obj: Dict[str, Any]) -> str:
+        """
+        Returns the identity of a game, its date and teams, normalized so
+        that re-scraped copies of the same game share a key
+
+        Args:
+        score_obj (dict): The box score JSON loaded into a dict
+
+        Returns:
+        str: The game's key, e.g. "09/10/2023|Chicago Bears|Green Bay Packers"
+        """
+        return "|".join([
+            " ".join(str(score_obj.get(field)).split())
+            for field in [ "date", "home_team", "away_team" ]
+        ])
+
+    @staticmethod
+    def hash_static(score_obj: Dict[str, Any]) -> str:
+        """
+        Returns a stable content hash of a game's normalized date, teams and
+        scores, which changes if and only if one of them does
+
+        Args:
+        score_obj (dict): The box score JSON loaded into a dict
+
+        Returns:
+        str: The hex digest of the game's content
+        """
+        content = BoxScore.get_key_static(score_obj) + \
+            f"|{int(score_obj.get('home_score'))}" + \
+            f"|{int(score_obj.get('away_score'))}"
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
     def __init__(self, score_obj: Dict[str, Any]) -> Type["BoxScore"]:
         """
         Constructor for the BoxScore class
@@ -48,6 +90,30 @@ class BoxScore:
             raise ValidationError(err)
         self.score_obj = score_obj
 
+    def get_key(self) -> str:
+        """
+        Returns the identity of the game, its normalized date and teams
+
+        Args:
+        None
+
+        Returns:
+        str: The game's key
+        """
+        return BoxScore.get_key_static(self.score_obj)
+
+    def get_hash(self) -> str:
+        """
+        Returns the stable content hash of the game
+
+        Args:
+        None
+
+        Returns:
+        str: The hex digest of the game's content
+        """
+        return BoxScore.hash_static(self.score_obj)
+
     def get_date_str(self) -> str:
         """
         Returns the date of the game as a string
@@ -135,6 +201,137 @@ class BoxScore:
         return self.score_obj
 
 class LabeledBoxScore(BoxScore):
+    @staticmethod
+    def validate_static(score_obj: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Validates labeled box score JSON loaded into a dict
+
+        Args:
+        score_obj (dict): The labeled box score JSON loaded into a dict
+
+        Returns:
+        bool: Whether the labeled box score JSON was valid
+        str: The error message if the labeled box score JSON was invalid
+        """
+        try:
+            validate(
+                instance=score_obj,
+                schema=LABELED_BOX_SCORE_SCHEMA
+            )
+        except ValidationError as ve:
+            return False, str(ve)
+        return True, ""
+
+    @staticmethod
+    def validate_list_static(
+            score_list: List[Dict[str, Any]]
+        ) -> Tuple[bool, str]:
+        """
+        Validates a list of labeled box score dicts in a single pass
+
+        Args:
+        score_list (list): The list of labeled box score dicts
+
+        Returns:
+        bool: Whether the labeled box score list was valid
+        str: The error message if the labeled box score list was invalid
+        """
+        try:
+            validate(
+                instance=score_list,
+                schema=LABELED_BOX_SCORE_LIST_SCHEMA
+            )
+        except ValidationError as ve:
+            return False, str(ve)
+        return True, ""
+
+    @staticmethod
+    def from_json(
+            score_obj: Dict[str, Any], check_schema: bool = True
+        ) -> Type["LabeledBoxScore"]:
+        """
+        Loads a LabeledBoxScore from its JSON dict, wrapping the dict rather
+        than copying it
+
+        Args:
+        score_obj (dict): The labeled box score JSON loaded into a dict
+        check_schema (bool): Whether to validate the dict, which may be
+            skipped if it was validated as part of a list
+
+        Returns:
+        LabeledBoxScore: The loaded LabeledBoxScore
+        """
+        if check_schema:
+            valid, err = LabeledBoxScore.validate_static(score_obj)
+            if not valid:
+                raise ValidationError(err)
+        score = LabeledBoxScore.__new__(LabeledBoxScore)
+        score.score_obj = score_obj
+        return score
+
+    @staticmethod
+    def from_json_list(
+            score_list: List[Dict[str, Any]]
+        ) -> List["LabeledBoxScore"]:
+        """
+        Loads a list of LabeledBoxScores from their JSON dicts, validating
+        the whole list once
+
+        Args:
+        score_list (list): The labeled box score dicts
+
+        Returns:
+        list: The loaded LabeledBoxScores
+        """
+        valid, err = LabeledBoxScore.validate_list_static(score_list)
+        if not valid:
+            raise ValidationError(err)
+        return [
+            LabeledBoxScore.from_json(score_obj, check_schema=False)
+            for score_obj in score_list
+        ]
+
+    @staticmethod
+    def get_columns_static(
+            score_list: List[Dict[str, Any]]
+        ) -> Dict[str, numpy.ndarray]:
+        """
+        Extracts the scores & tiers of labeled box score dicts as columnar
+        arrays, without constructing LabeledBoxScores
+
+        Args:
+        score_list (list): The labeled box score dicts
+
+        Returns:
+        dict: The home_score, away_score & tier columns
+        """
+        fields = [ "home_score", "away_score" ] + LABELED_TIER_FIELDS
+        values = numpy.array([
+            [ score_obj[field] for field in fields ]
+            for score_obj in score_list
+        ], dtype=numpy.int32).reshape(-1, len(fields))
+        return { field: values[:, i] for i, field in enumerate(fields) }
+
+    @staticmethod
+    def hash_static(score_obj: Dict[str, Any]) -> str:
+        """
+        Returns a stable content hash of a labeled game, which also changes
+        if any of its tiers are relabeled
+
+        Args:
+        score_obj (dict): The labeled box score JSON loaded into a dict
+
+        Returns:
+        str: The hex digest of the labeled game's content
+        """
+        content = BoxScore.hash_static(score_obj) + "|" + "|".join([
+            str(int(score_obj.get(field)))
+            for field in [
+                "home_offense", "home_defense", "away_offense", "away_defense"
+            ]
+        ])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
     def __init__(
             self,
             score_obj: Dict[str, Any],
@@ -144,19 +341,91 @@ class LabeledBoxScore(BoxScore):
             away_defense: int
         ) -> Type["LabeledBoxScore"]:
         """
-        Constructor for the LabeledBoxScore class
+        Constructor for the LabeledBoxScore class, which labels a box score
+        with each side's tiers
 
         Args:
-        None
+        score_obj (dict): The box score JSON loaded into a dict
+        home_offense (int): The home offense tier
+        home_defense (int): The home defense tier
+        away_offense (int): The away offense tier
+        away_defense (int): The away defense tier
 
         Returns:
         LabeledBoxScore: The labeled box score
         """
         super().__init__(score_obj)
-        self.home_offense = home_offense
-        self.home_defense = home_defense
-        self.away_offense = away_offense
-        self.away_defense = away_defense
+        self.score_obj = {
+            **score_obj,
+            "home_offense": home_offense,
+            "home_defense": home_defense,
+            "away_offense": away_offense,
+            "away_defense": away_defense
+        }
+
+    @property
+    def home_offense(self) -> int:
+        """
+        Returns the home offense tier
+
+        Args:
+        None
+
+        Returns:
+        int: The home offense tier
+        """
+        return int(self.score_obj["home_offense"])
+
+    @property
+    def home_defense(self) -> int:
+        """
+        Returns the home defense tier
+
+        Args:
+        None
+
+        Returns:
+        int: The home defense tier
+        """
+        return int(self.score_obj["home_defense"])
+
+    @property
+    def away_offense(self) -> int:
+        """
+        Returns the away offense tier
+
+        Args:
+        None
+
+        Returns:
+        int: The away offense tier
+        """
+        return int(self.score_obj["away_offense"])
+
+    @property
+    def away_defense(self) -> int:
+        """
+        Returns the away defense tier
+
+        Args:
+        None
+
+        Returns:
+        int: The away defense tier
+        """
+        return int(self.score_obj["away_defense"])
+
+    def get_hash(self) -> str:
+        """
+        Returns the stable content hash of the labeled game
+
+        Args:
+        None
+
+        Returns:
+        str: The hex digest of the labeled game's content
+        """
+        return LabeledBoxScore.hash_static(self.score_obj)
 
     def __str__(self) -> str:
         """
@@ -184,14 +453,7 @@ class LabeledBoxScore(BoxScore):
         Returns
         dict: The JSON-serialized BoxScore
         """
-        obj = self.score_obj
-        obj.update({
-            "home_offense": self.home_offense,
-            "home_defense": self.home_defense,
-            "away_offense": self.away_offense,
-            "away_defense": self.away_defense
-        })
-        return obj
+        return self.score_obj
 
 class BoxScoreList:
     @staticmethod
@@ -233,6 +495,168 @@ class BoxScoreList:
         self.score_list = []
         for score in score_list:
             self.score_list.append(BoxScore(score))
+        self.columns = None
+        self.teams = None
+
+    @staticmethod
+    def from_box_scores(
+            box_scores: List[BoxScore],
+            columns: Dict[str, numpy.ndarray] = None,
+            teams: numpy.ndarray = None
+        ) -> Type["BoxScoreList"]:
+        """
+        Wraps already validated BoxScores in a BoxScoreList, sharing them
+        rather than copying or revalidating them
+
+        Args:
+        box_scores (list): The BoxScores
+        columns (dict): The box scores' columns, if already extracted
+        teams (numpy.ndarray): The sorted team names the columns refer to
+
+        Returns:
+        BoxScoreList: The BoxScoreList sharing the given BoxScores
+        """
+        scores = BoxScoreList.__new__(BoxScoreList)
+        scores.score_list = box_scores
+        scores.columns = columns
+        scores.teams = teams
+        return scores
+
+    def get_columns(self) -> Dict[str, numpy.ndarray]:
+        """
+        Returns the box scores as columnar arrays, extracting them on first
+        use. Teams are stored as indices into the sorted team names.
+
+        Args:
+        None
+
+        Returns:
+        dict: The date, home_id, away_id, home_score & away_score columns
+        """
+        if self.columns is None:
+            n = len(self.score_list)
+            names = numpy.array(
+                [ score.get_home_team() for score in self.score_list ] + \
+                [ score.get_away_team() for score in self.score_list ],
+                dtype=object
+            )
+            self.teams, team_ids = numpy.unique(names, return_inverse=True)
+            self.columns = {
+                "date": parse_dates([
+                    score.get_date_str() for score in self.score_list
+                ]),
+                "home_id": team_ids[:n],
+                "away_id": team_ids[n:],
+                "home_score": numpy.array([
+                    score.get_home_score() for score in self.score_list
+                ], dtype=numpy.int32),
+                "away_score": numpy.array([
+                    score.get_away_score() for score in self.score_list
+                ], dtype=numpy.int32)
+            }
+        return self.columns
+
+    def get_team_id(self, team: str) -> int:
+        """
+        Returns the column index of a team, or -1 if it played no games
+
+        Args:
+        team (str): The team name
+
+        Returns:
+        int: The team's index into the sorted team names
+        """
+        self.get_columns()
+        i = int(numpy.searchsorted(self.teams, team))
+        if i < len(self.teams) and self.teams[i] == team:
+            return i
+        return -1
+
+    def get_mask(
+            self,
+            team: str = None,
+            opponent: str = None,
+            date_between: Tuple[str, str] = None,
+            min_total: int = None,
+            margin_gt: int = None,
+            tie: bool = None
+        ) -> numpy.ndarray:
+        """
+        Compiles query predicates into a boolean mask over the box scores.
+        Every given predicate must hold.
+
+        Args:
+        team (str): A team which played in the game
+        opponent (str): The team's opponent, or if no team is given, another
+            team which played in the game
+        date_between (tuple): The inclusive first & last dates, formatted as
+            MM/DD/YYYY, either of which may be None to leave it open
+        min_total (int): The minimum combined score
+        margin_gt (int): The margin of victory must exceed this
+        tie (bool): Whether the game must, or must not, have been a tie
+
+        Returns:
+        numpy.ndarray: Whether each box score matches the query
+        """
+        columns = self.get_columns()
+        home_id, away_id = columns["home_id"], columns["away_id"]
+        home_score, away_score = columns["home_score"], columns["away_score"]
+        mask = numpy.ones(len(self.score_list), dtype=bool)
+        if team is not None and opponent is not None:
+            team_id = self.get_team_id(team)
+            opponent_id = self.get_team_id(opponent)
+            mask &= ((home_id == team_id) & (away_id == opponent_id)) | \
+                ((away_id == team_id) & (home_id == opponent_id))
+        elif team is not None or opponent is not None:
+            team_id = self.get_team_id(team if team is not None else opponent)
+            mask &= (home_id == team_id) | (away_id == team_id)
+        if date_between is not None:
+            start, end = date_between
+            if start is not None:
+                mask &= columns["date"] >= parse_dates([ start ])[0]
+            if end is not None:
+                mask &= columns["date"] <= parse_dates([ end ])[0]
+        if min_total is not None:
+            mask &= home_score + away_score >= min_total
+        if margin_gt is not None:
+            mask &= numpy.abs(home_score - away_score) > margin_gt
+        if tie is not None:
+            mask &= (home_score == away_score) == tie
+        return mask
+
+    def where(self, **predicates: Any) -> Type["BoxScoreList"]:
+        """
+        Queries the box scores, e.g. where(team="Chicago Bears", tie=True),
+        returning a view which shares the matching BoxScores & column slices
+        rather than copying or revalidating them. See get_mask for the
+        supported predicates.
+
+        Args:
+        predicates (Any): The query predicates
+
+        Returns:
+        BoxScoreList: The matching box scores, in their original order
+        """
+        return self.take(self.get_mask(**predicates))
+
+    def take(self, mask: numpy.ndarray) -> Type["BoxScoreList"]:
+        """
+        Returns a view of the box scores selected by a mask, e.g. one from
+        get_mask, sharing the selected BoxScores & column slices
+
+        Args:
+        mask (numpy.ndarray): Whether to keep each box score
+
+        Returns:
+        BoxScoreList: The selected box scores, in their original order
+        """
+        index = numpy.flatnonzero(mask)
+        columns = self.get_columns()
+        return BoxScoreList.from_box_scores(
+            [ self.score_list[i] for i in index ],
+            { name: values[index] for name, values in columns.items() },
+            self.teams
+        )
 
     def to_box_score_season(self, year: int) -> Type["BoxScoreSeason"]:
         """
@@ -244,10 +668,7 @@ class BoxScoreList:
         Returns:
         BoxScoreSeason: The loaded BoxScoreSeason
         """
-        season = BoxScoreSeason(year)
-        for score in self.score_list:
-            season.add_game(score)
-        return season
+        return BoxScoreSeason.from_box_score_list(self, year)
 
     def get_team_scores(self, team: str) -> List[int]:
         """
@@ -259,38 +680,37 @@ class BoxScoreList:
         Returns:
         list: The team's scores from the list
         """
-        scores = []
-        for score in self.score_list:
-            if team == score.get_home_team():
-                scores.append({
-                    "offense": score.get_home_score(),
-                    "defense": score.get_away_score()
-                })
-            elif team == score.get_away_team():
-                scores.append({
-                    "offense": score.get_away_score(),
-                    "defense": score.get_home_score()
-                })
-        return scores
+        columns = self.get_columns()
+        team_id = self.get_team_id(team)
+        home = columns["home_id"] == team_id
+        index = numpy.flatnonzero(home | (columns["away_id"] == team_id))
+        home = home[index]
+        home_score = columns["home_score"][index]
+        away_score = columns["away_score"][index]
+        offense = numpy.where(home, home_score, away_score)
+        defense = numpy.where(home, away_score, home_score)
+        return [
+            { "offense": int(o), "defense": int(d) }
+            for o, d in zip(offense, defense)
+        ]
 
     def summarize_team_scores(
             self, team: str
         ) -> Type["BoxScoreSummary"]:
         """
         For a given team, this function summarizes the boxplot metrics for
-        all of the box scores in the box score list, and returns it as a
-        pandas series
+        all of the box scores in the box score list
 
         Args:
         team (str): The team name
 
         Returns:
-        pandas.Series: The boxplot metrics of the team's offensive scores
-        pandas.Series: The boxplot metrics of the team's defensive scores
+        BoxScoreSummary: The boxplot metrics of the team's offensive and
+            defensive scores
         """
-        dataframe = pandas.read_json(json.dumps(self.get_team_scores(team)))
-        offense = dataframe["offense"].describe()
-        defense = dataframe["defense"].describe()
+        scores = self.get_team_scores(team)
+        offense = ScoreSummary.from_scores([ s["offense"] for s in scores ])
+        defense = ScoreSummary.from_scores([ s["defense"] for s in scores ])
         return BoxScoreSummary(team, offense, defense)
 
     def __str__(self) -> str:
@@ -320,9 +740,31 @@ class BoxScoreList:
         return json.loads(json.dumps(self.score_list))
 
 class BoxScoreSeason:
+    @staticmethod
+    def from_box_score_list(
+            scores: BoxScoreList, year: int
+        ) -> Type["BoxScoreSeason"]:
+        """
+        Wraps a BoxScoreList as a BoxScoreSeason, sharing its BoxScores and
+        columns rather than copying them
+
+        Args:
+        scores (BoxScoreList): The season's box scores
+        year (int): The year the season occurred
+
+        Returns:
+        BoxScoreSeason: The BoxScoreSeason sharing the given box scores
+        """
+        season = BoxScoreSeason(year)
+        season.box_scores = scores.score_list
+        season.scores = scores
+        return season
+
     def __init__(self, year: int) -> Type["BoxScoreSeason"]:
         """
-        Constructor for the BoxScoreSeason class
+        Constructor for the BoxScoreSeason class, which holds each game once
+        and indexes each team's games by position, like a CSR matrix: the
+        games of team i are game_index[offsets[i]:offsets[i + 1]]
 
         Args:
         year (int): The year the season occurred
@@ -331,7 +773,10 @@ class BoxScoreSeason:
         BoxScoreSeason: The initialized BoxScoreSeason
         """
         self.year = year
-        self.season = {}
+        self.box_scores = []
+        self.scores = None
+        self.offsets = None
+        self.game_index = None
 
     def add_game(self, score: Type["BoxScore"]) -> None:
         """
@@ -343,19 +788,90 @@ class BoxScoreSeason:
         Returns:
         None
         """
-        home_team = score.get_home_team()
-        away_team = score.get_away_team()
-        if home_team not in self.season.keys():
-            self.season[home_team] = []
-        if away_team not in self.season.keys():
-            self.season[away_team] = []
-        score_dict = score.__json__()
-        self.season[home_team].append(score_dict)
-        self.season[away_team].append(score_dict)
+        self.box_scores.append(score)
+        self.scores = None
+        self.offsets = None
+        self.game_index = None
+
+    def get_box_score_list(self) -> BoxScoreList:
+        """
+        Returns the season's box scores as a BoxScoreList, sharing them
+
+        Args:
+        None
+
+        Returns:
+        BoxScoreList: The season's box scores, in the order they were added
+        """
+        if self.scores is None:
+            self.scores = BoxScoreList.from_box_scores(self.box_scores)
+        return self.scores
+
+    def get_adjacency(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the team to game index adjacency, building it on first use
+        from the game columns in one sort. Teams are indexed like the
+        BoxScoreList's sorted team names.
+
+        Args:
+        None
+
+        Returns:
+        numpy.ndarray: The offsets of each team's games, one per team plus
+            one
+        numpy.ndarray: The game indices of every team, each team's in order
+        """
+        if self.offsets is None:
+            scores = self.get_box_score_list()
+            columns = scores.get_columns()
+            n = len(self.box_scores)
+            teams = numpy.concatenate([
+                columns["home_id"], columns["away_id"]
+            ])
+            games = numpy.tile(numpy.arange(n), 2)
+            self.game_index = games[numpy.lexsort((games, teams))]
+            n_teams = len(scores.teams)
+            self.offsets = numpy.zeros(n_teams + 1, dtype=numpy.int64)
+            numpy.cumsum(
+                numpy.bincount(teams, minlength=n_teams),
+                out=self.offsets[1:]
+            )
+        return self.offsets, self.game_index
+
+    def get_team_game_index(self, team: str) -> numpy.ndarray:
+        """
+        Returns the positions of a team's games, as a view into the
+        adjacency rather than a copy
+
+        Args:
+        team (str): The team name
+
+        Returns:
+        numpy.ndarray: The indices of the team's games, in order
+        """
+        offsets, game_index = self.get_adjacency()
+        team_id = self.get_box_score_list().get_team_id(team)
+        if team_id < 0:
+            raise KeyError(f"Team not found: {team}")
+        return game_index[offsets[team_id]:offsets[team_id + 1]]
+
+    def where(self, **predicates: Any) -> Type["BoxScoreList"]:
+        """
+        Queries the season's box scores, each game appearing once. See
+        BoxScoreList.get_mask for the supported predicates.
+
+        Args:
+        predicates (Any): The query predicates
+
+        Returns:
+        BoxScoreList: The matching box scores, in the order they were added
+        """
+        return self.get_box_score_list().where(**predicates)
 
     def get_teams(self) -> List[str]:
         """
-        Returns the list of teams who participated in the season
+        Returns the list of teams who participated in the season, in the
+        order they first appear
 
         Args:
         None
@@ -363,55 +879,245 @@ class BoxScoreSeason:
         Returns:
         list: The list of team names who participated in the season
         """
-        return [ str(key) for key in self.season.keys() ]
+        offsets, game_index = self.get_adjacency()
+        scores = self.get_box_score_list()
+        first = game_index[offsets[:-1]]
+        away = scores.get_columns()["home_id"][first] != \
+            numpy.arange(len(first))
+        order = numpy.argsort(2 * first + away, kind="stable")
+        return [ str(scores.teams[i]) for i in order ]
 
     def get_team_box_scores(self, team: str) -> Type["BoxScoreList"]:
         """
-        For a given team, this returns that team's box scores for this season
+        For a given team, this returns that team's box scores for this
+        season, sharing the season's BoxScores rather than revalidating them
 
         Args:
         team (str): The team name
 
         Returns:
-        list: The list of the team's box scores
-        """
-        team_scores = self.season.get(team)
-        if team_scores == None:
-            raise KeyError(f"Team not found: {team}")
-        return BoxScoreList(team_scores)
+        BoxScoreList: The team's box scores
+        """
+        index = self.get_team_game_index(team)
+        scores = self.get_box_score_list()
+        return BoxScoreList.from_box_scores(
+            [ self.box_scores[i] for i in index ],
+            { name: values[index] for name, values in scores.columns.items() },
+            scores.teams
+        )
 
-    def summarize(self) -> Dict[str, Any]:
+    def summarize(self) -> Type["BoxScoreSummaryList"]:
         """
-        Returns the box plot metrics as a dict of pandas Series for the season
-        of box scores for each team, in terms of the team's offense and
-        defense.
+        Returns the box plot metrics for the season of box scores for each
+        team, in terms of the team's offense and defense.
 
         Args:
         None
 
         Returns:
-        dict: The mapping of team names to their summarized offense and defense
+        BoxScoreSummaryList: The summarized offense and defense of each team
         """
         summary = BoxScoreSummaryList()
         for team in self.get_teams():
             team_box_scores = self.get_team_box_scores(team)
             team_summary = team_box_scores.summarize_team_scores(team)
-            team_summary.team = f"{self.year} {team_summary.team}"
+            team_summary.team = format_team_season(
+                self.year, team_summary.team
+            )
             summary.add_summary(team_summary)
         return summary
 
+# The boxplot metrics of a score summary, as named by pandas.describe
+SCORE_SUMMARY_FIELDS = [
+    ("count", "count"),
+    ("mean", "mean"),
+    ("std", "std"),
+    ("min", "min"),
+    ("q25", "25%"),
+    ("q50", "50%"),
+    ("q75", "75%"),
+    ("max", "max")
+]
+
+# The number of decimal places score summaries are serialized with
+SCORE_SUMMARY_PRECISION = 10
+
+class ScoreSummary:
+    __slots__ = [ field for field, _ in SCORE_SUMMARY_FIELDS ]
+
+    @staticmethod
+    def from_scores(scores: List[int]) -> Type["ScoreSummary"]:
+        """
+        Computes the boxplot metrics of a list of scores, matching
+        pandas.Series.describe
+
+        Args:
+        scores (list): The scores
+
+        Returns:
+        ScoreSummary: The boxplot metrics of the scores
+        """
+        values = numpy.asarray(scores, dtype=float)
+        if len(values) == 0:
+            return ScoreSummary(0.0, *([ math.nan ] * 7))
+        q25, q50, q75 = numpy.percentile(values, [ 25, 50, 75 ])
+        std = float(values.std(ddof=1)) if len(values) > 1 else math.nan
+        return ScoreSummary(
+            float(len(values)),
+            float(values.mean()),
+            std,
+            float(values.min()),
+            float(q25),
+            float(q50),
+            float(q75),
+            float(values.max())
+        )
+
+    @staticmethod
+    def get_count_percentiles(
+            counts: numpy.ndarray, percentiles: List[float]
+        ) -> numpy.ndarray:
+        """
+        Computes percentiles of integer scores from their histogram, with
+        the same linear interpolation as numpy.percentile over the scores
+
+        Args:
+        counts (numpy.ndarray): The number of times each score occurred,
+            indexed by score
+        percentiles (list): The percentiles, from 0 to 100
+
+        Returns:
+        numpy.ndarray: The score at each percentile
+        """
+        cumulative = numpy.cumsum(counts)
+        position = numpy.asarray(percentiles) / 100 * (cumulative[-1] - 1)
+        lower = numpy.floor(position)
+        lower_score = numpy.searchsorted(cumulative, lower, side="right")
+        upper_score = numpy.searchsorted(cumulative, lower + 1, side="right")
+        upper_score = numpy.minimum(upper_score, len(counts) - 1)
+        return lower_score + (position - lower) * (upper_score - lower_score)
+
+    @staticmethod
+    def from_counts(counts: numpy.ndarray) -> Type["ScoreSummary"]:
+        """
+        Computes the boxplot metrics of integer scores from their histogram,
+        matching ScoreSummary.from_scores in O(distinct scores), so that
+        histograms of any number of games can be summarized or merged by
+        adding them
+
+        Args:
+        counts (numpy.ndarray): The number of times each score occurred,
+            indexed by score
+
+        Returns:
+        ScoreSummary: The boxplot metrics of the scores
+        """
+        counts = numpy.asarray(counts, dtype=float)
+        n = counts.sum()
+        if n == 0:
+            return ScoreSummary(0.0, *([ math.nan ] * 7))
+        scores = numpy.arange(len(counts))
+        mean = float(counts @ scores / n)
+        std = float(numpy.sqrt(
+            counts @ (scores - mean) ** 2 / (n - 1)
+        )) if n > 1 else math.nan
+        observed = numpy.flatnonzero(counts)
+        q25, q50, q75 = ScoreSummary.get_count_percentiles(
+            counts, [ 25, 50, 75 ]
+        )
+        return ScoreSummary(
+            float(n),
+            mean,
+            std,
+            float(observed[0]),
+            float(q25),
+            float(q50),
+            float(q75),
+            float(observed[-1])
+        )
+
+    def __init__(
+            self,
+            count: float,
+            mean: float,
+            std: float,
+            min: float,
+            q25: float,
+            q50: float,
+            q75: float,
+            max: float
+        ) -> Type["ScoreSummary"]:
+        """
+        Constructor for the ScoreSummary class, a compact record of the
+        boxplot metrics of a set of scores
+
+        Args:
+        count (float): The number of scores
+        mean (float): The mean score
+        std (float): The sample standard deviation of the scores
+        min (float): The minimum score
+        q25 (float): The first quartile score
+        q50 (float): The median score
+        q75 (float): The third quartile score
+        max (float): The maximum score
+
+        Returns:
+        ScoreSummary: The initialized ScoreSummary
+        """
+        self.count = count
+        self.mean = mean
+        self.std = std
+        self.min = min
+        self.q25 = q25
+        self.q50 = q50
+        self.q75 = q75
+        self.max = max
+
+    def to_string(self) -> str:
+        """
+        Serializes the ScoreSummary as one metric per line
+
+        Args:
+        None
+
+        Returns:
+        str: The string-serialized ScoreSummary
+        """
+        return "\n".join([
+            f"{name:<5} {getattr(self, field):>12.6f}"
+            for field, name in SCORE_SUMMARY_FIELDS
+        ])
+
+    def __json__(self) -> Dict[str, Any]:
+        """
+        Serializes the ScoreSummary as a JSON dict keyed like
+        pandas.Series.describe, with NaN metrics serialized as null
+
+        Args:
+        None
+
+        Returns:
+        dict: The JSON-serialized ScoreSummary
+        """
+        obj = {}
+        for field, name in SCORE_SUMMARY_FIELDS:
+            value = getattr(self, field)
+            obj[name] = None if math.isnan(value) \
+                else round(value, SCORE_SUMMARY_PRECISION)
+        return obj
+
 class BoxScoreSummary:
     def __init__(
-            self, team: str, offense: pandas.Series, defense: pandas.Series
+            self, team: str, offense: ScoreSummary, defense: ScoreSummary
         ) -> Type["BoxScoreSummary"]:
         """
         Constructor for the BoxScoreSummary class
 
         Args:
         team (str): The team name
-        offense (pandas.Series): The boxplot summary of the team's points for
+        offense (ScoreSummary): The boxplot summary of the team's points for
             on offense
-        defense (pandas.Series): The boxplot summary of the team's points
+        defense (ScoreSummary): The boxplot summary of the team's points
             against on defense
         
         Returns:
@@ -435,6 +1141,21 @@ class BoxScoreSummary:
             f"\n{self.offense.to_string()}\n\nDefense:" + \
             f"\n{self.defense.to_string()}"
 
+    def get_side_json(self, side: str) -> Dict[str, Any]:
+        """
+        Serializes one side of a BoxScoreSummary as a flat JSON dict
+
+        Args:
+        side (str): Either offense or defense
+
+        Returns:
+        dict: The side's boxplot metrics along with the team name
+        """
+        summary = self.offense if side == "offense" else self.defense
+        obj = summary.__json__()
+        obj["team"] = self.team
+        return obj
+
     def __json__(self) -> Dict[str, Any]:
         """
         Serializes a BoxScoreSummary as a JSON dict
@@ -447,8 +1168,8 @@ class BoxScoreSummary:
         """
         return {
             "team": self.team,
-            "offense": json.loads(self.offense.to_json()),
-            "defense": json.loads(self.defense.to_json())
+            "offense": self.offense.__json__(),
+            "defense": self.defense.__json__()
         }
 
 class BoxScoreSummaryList:
@@ -498,12 +1219,7 @@ class BoxScoreSummaryList:
         Returns:
         list: The offensive summaries serialized as a JSON list
         """
-        summaries = []
-        for s in self.summary:
-            offense = json.loads(s.offense.to_json())
-            offense.update({"team": s.team})
-            summaries.append(offense)
-        return summaries
+        return [ s.get_side_json("offense") for s in self.summary ]
 
     def get_defense_summary_json(self) -> List[Dict[str, Any]]:
         """
@@ -515,12 +1231,7 @@ class BoxScoreSummaryList:
         Returns:
         list: The defensive summaries serialized as a JSON list
         """
-        summaries = []
-        for s in self.summary:
-            offense = json.loads(s.defense.to_json())
-            offense.update({"team": s.team})
-            summaries.append(offense)
-        return summaries
+        return [ s.get_side_json("defense") for s in self.summary ]
 
     def __json__(self) -> List[Dict[str, Any]]:
         """
@@ -31,3 +31,33 @@ BOX_SCORE_LIST_SCHEMA = {
     "description": "A list of fooball box scores",
     "items": BOX_SCORE_SCHEMA
 }
+
+# The offense & defense tiers each side of a labeled game is labeled with
+LABELED_TIER_FIELDS = [
+    "home_offense", "home_defense", "away_offense", "away_defense"
+]
+
+LABELED_BOX_SCORE_SCHEMA = {
+    "type": "object",
+    "description": "A football box score labeled with each side's tiers",
+    "additionalProperties": False,
+    "required": list(BOX_SCORE_SCHEMA["properties"]) + LABELED_TIER_FIELDS,
+    "properties": {
+        **BOX_SCORE_SCHEMA["properties"],
+        **{
+            field: {
+                "type": "integer",
+                "description": "The " + field.replace("_", " ") + " tier",
+                "minimum": 1,
+                "maximum": 5
+            }
+            for field in LABELED_TIER_FIELDS
+        }
+    }
+}
+
+LABELED_BOX_SCORE_LIST_SCHEMA = {
+    "type": "array",
+    "description": "A list of labeled football box scores",
+    "items": LABELED_BOX_SCORE_SCHEMA
+}
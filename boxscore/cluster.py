@@ -0,0 +1,249 @@
+import hashlib
+import json
+import numpy
+import pandas
+from boxscore.storage import data_exists, read_json, write_json
+from boxscore.workspace import get_workspace_path
+from sklearn.cluster import KMeans
+from typing import Dict, Any, Type, List
+
+# The features, cluster count, and seed used to derive the skill tiers
+CLUSTER_FEATURES = ["mean", "50%"]
+CLUSTER_COUNT = 5
+CLUSTER_SEED = 0
+
+def load_summary_dataframe(summary_path: str) -> pandas.DataFrame:
+    """
+    Loads an offense or defense summary file, compressed or not, and
+    filters it down to the team-seasons which are eligible for clustering
+
+    Args:
+    summary_path (str): The uncompressed path of the summary JSON
+
+    Returns:
+    pandas.DataFrame: The filtered summary dataframe
+    """
+    dataframe = pandas.DataFrame(read_json(summary_path))
+    dataframe = dataframe.query('count > 5')
+    dataframe = dataframe.dropna()
+    return dataframe.reset_index(drop=True)
+
+def kmeans_1d(values: numpy.ndarray, n_clusters: int) -> numpy.ndarray:
+    """
+    Computes the optimal 1-D k-means partition of a set of values using
+    dynamic programming over the sorted values
+
+    Args:
+    values (numpy.ndarray): The values to cluster
+    n_clusters (int): The number of clusters
+
+    Returns:
+    numpy.ndarray: The cluster centroids, in ascending order
+    """
+    x = numpy.sort(numpy.asarray(values, dtype=float))
+    n = len(x)
+    n_clusters = min(n_clusters, len(numpy.unique(x)))
+    s1 = numpy.concatenate(([0.0], numpy.cumsum(x)))
+    s2 = numpy.concatenate(([0.0], numpy.cumsum(x * x)))
+
+    def cost(j: numpy.ndarray, i: int) -> numpy.ndarray:
+        # Sum of squared deviations of x[j:i] from its mean
+        cnt = i - j
+        tot = s1[i] - s1[j]
+        return (s2[i] - s2[j]) - tot * tot / cnt
+
+    # best[k][i] is the minimum cost of splitting x[:i] into k + 1 clusters
+    best = numpy.full((n_clusters, n + 1), numpy.inf)
+    split = numpy.zeros((n_clusters, n + 1), dtype=int)
+    best[0, 1:] = cost(numpy.zeros(n, dtype=int), numpy.arange(1, n + 1))
+    for k in range(1, n_clusters):
+        for i in range(k + 1, n + 1):
+            j = numpy.arange(k, i)
+            candidates = best[k - 1, j] + cost(j, i)
+            arg = int(numpy.argmin(candidates))
+            best[k, i] = candidates[arg]
+            split[k, i] = j[arg]
+
+    # Walk the split points back to recover the centroids
+    centroids = []
+    i = n
+    for k in range(n_clusters - 1, -1, -1):
+        j = split[k, i] if k > 0 else 0
+        centroids.append(x[j:i].mean())
+        i = j
+    return numpy.array(centroids[::-1])
+
+class SkillClustering:
+    @staticmethod
+    def hash_input(summary_path: str, n_clusters: int, seed: int) -> str:
+        """
+        Hashes a summary file's JSON together with the clustering parameters
+        so that a persisted clustering can be matched to its input, however
+        the summary is compressed
+
+        Args:
+        summary_path (str): The uncompressed path of the summary JSON
+        n_clusters (int): The number of clusters
+        seed (int): The random seed used when fitting
+
+        Returns:
+        str: The hex digest of the input
+        """
+        digest = hashlib.sha256()
+        digest.update(
+            json.dumps(read_json(summary_path), sort_keys=True).encode()
+        )
+        digest.update(
+            json.dumps([CLUSTER_FEATURES, n_clusters, seed]).encode()
+        )
+        return digest.hexdigest()
+
+    @staticmethod
+    def fit(
+            dataframe: pandas.DataFrame,
+            side: str,
+            input_hash: str,
+            n_clusters: int = CLUSTER_COUNT,
+            seed: int = CLUSTER_SEED
+        ) -> Type["SkillClustering"]:
+        """
+        Fits the skill clustering for a summary dataframe. The clusters are
+        seeded from the exact 1-D solution along the principal axis of the
+        features, so the fit is deterministic and converges quickly.
+
+        Args:
+        dataframe (pandas.DataFrame): The filtered summary dataframe
+        side (str): Either offense or defense
+        input_hash (str): The hash of the clustering input
+        n_clusters (int): The number of clusters
+        seed (int): The random seed used when fitting
+
+        Returns:
+        SkillClustering: The fitted clustering
+        """
+        features = dataframe[CLUSTER_FEATURES].to_numpy(dtype=float)
+
+        # Solve exactly along the principal axis, then refine in 2-D
+        center = features.mean(axis=0)
+        _, _, vt = numpy.linalg.svd(features - center, full_matrices=False)
+        axis = vt[0]
+        projected = (features - center) @ axis
+        init = kmeans_1d(projected, n_clusters)
+        init = center + numpy.outer(init, axis)
+        kmeans = KMeans(
+            n_clusters=len(init),
+            init=init,
+            n_init=1,
+            random_state=seed
+        )
+        kmeans.fit(features)
+        centroids = kmeans.cluster_centers_
+
+        # Rank the clusters so that a higher tier is always a better unit,
+        # i.e. more points for on offense and fewer points against on defense
+        order = numpy.argsort(centroids[:, 0])
+        if side == "defense":
+            order = order[::-1]
+        ranks = numpy.empty(len(order), dtype=int)
+        ranks[order] = numpy.arange(1, len(order) + 1)
+        centroids = centroids[order]
+        tiers = ranks[kmeans.labels_]
+        return SkillClustering(
+            side,
+            input_hash,
+            centroids.tolist(),
+            dict(zip(dataframe["team"], tiers.tolist()))
+        )
+
+    @staticmethod
+    def load_or_fit(
+            side: str,
+            refit: bool = False
+        ) -> Type["SkillClustering"]:
+        """
+        Loads the persisted clustering for a side if its input hash matches
+        the current summary file, otherwise fits and persists a new one
+
+        Args:
+        side (str): Either offense or defense
+        refit (bool): Whether to ignore any persisted clustering
+
+        Returns:
+        SkillClustering: The loaded or fitted clustering
+        """
+        summary_path = get_workspace_path("preprocessed", f"{side}.json")
+        cache_path = get_workspace_path(
+            "preprocessed", f"{side}_clusters.json"
+        )
+        input_hash = SkillClustering.hash_input(
+            summary_path, CLUSTER_COUNT, CLUSTER_SEED
+        )
+        if not refit and data_exists(cache_path):
+            cached = read_json(cache_path)
+            if cached.get("input_hash") == input_hash:
+                return SkillClustering(
+                    cached["side"],
+                    cached["input_hash"],
+                    cached["centroids"],
+                    cached["tiers"]
+                )
+        clustering = SkillClustering.fit(
+            load_summary_dataframe(summary_path), side, input_hash
+        )
+        write_json(clustering, cache_path)
+        return clustering
+
+    def __init__(
+            self,
+            side: str,
+            input_hash: str,
+            centroids: List[List[float]],
+            tiers: Dict[str, int]
+        ) -> Type["SkillClustering"]:
+        """
+        Constructor for the SkillClustering class
+
+        Args:
+        side (str): Either offense or defense
+        input_hash (str): The hash of the clustering input
+        centroids (list): The cluster centroids, ordered by tier
+        tiers (dict): The mapping of team-seasons to their tier
+
+        Returns:
+        SkillClustering: The initialized SkillClustering
+        """
+        self.side = side
+        self.input_hash = input_hash
+        self.centroids = centroids
+        self.tiers = tiers
+
+    def get_tier(self, team: str) -> int:
+        """
+        Returns the tier of a team-season, or None if it was not clustered
+
+        Args:
+        team (str): The team-season, e.g. "2017 New England Patriots"
+
+        Returns:
+        int: The tier of the team-season, from 1 (worst) to 5 (best)
+        """
+        return self.tiers.get(team)
+
+    def __json__(self) -> Dict[str, Any]:
+        """
+        Serializes the SkillClustering instance as a JSON dict
+
+        Args:
+        None
+
+        Returns:
+        dict: The JSON-serialized SkillClustering
+        """
+        return {
+            "side": self.side,
+            "input_hash": self.input_hash,
+            "features": CLUSTER_FEATURES,
+            "seed": CLUSTER_SEED,
+            "centroids": self.centroids,
+            "tiers": self.tiers
+        }
@@ -0,0 +1,261 @@
+import numpy
+import pandas
+from typing import Type, List, Tuple
+
+# Weeks of the season run from Tuesday through Monday
+WEEK_START_WEEKDAY = 1
+
+# Months from this one onward belong to the calendar year the season started
+SEASON_START_MONTH = 6
+
+def parse_dates(dates: List[str]) -> numpy.ndarray:
+    """
+    Parses box score date strings into a datetime64 array in one pass
+
+    Args:
+    dates (list): The dates, formatted as MM/DD/YYYY
+
+    Returns:
+    numpy.ndarray: The parsed dates as datetime64[D]
+    """
+    return pandas.to_datetime(
+        pandas.Series(dates, dtype=object), format="%m/%d/%Y"
+    ).to_numpy().astype("datetime64[D]")
+
+def get_date_seasons(dates: numpy.ndarray) -> numpy.ndarray:
+    """
+    Returns the season each date falls in, seasons starting in June so that
+    January & February games count toward the previous year
+
+    Args:
+    dates (numpy.ndarray): The dates as datetime64[D]
+
+    Returns:
+    numpy.ndarray: The season of each date
+    """
+    months = numpy.asarray(dates).astype("datetime64[M]").astype(numpy.int64)
+    years = months // 12 + 1970
+    return (years - (months % 12 + 1 < SEASON_START_MONTH)).astype(numpy.int32)
+
+def get_weeks(seasons: numpy.ndarray, dates: numpy.ndarray) -> numpy.ndarray:
+    """
+    Derives the week of the season of each game. Week 1 starts on the
+    Tuesday on or before the first game of the season.
+
+    Args:
+    seasons (numpy.ndarray): The season of each game
+    dates (numpy.ndarray): The datetime64[D] date of each game
+
+    Returns:
+    numpy.ndarray: The week of the season of each game
+    """
+    days = dates.astype(numpy.int64)
+    unique, inverse = numpy.unique(seasons, return_inverse=True)
+    first = numpy.full(len(unique), numpy.iinfo(numpy.int64).max)
+    numpy.minimum.at(first, inverse, days)
+
+    # 1970-01-01 was a Thursday, so weekday 0 (Monday) is day 4 mod 7
+    weekday = (first + 3) % 7
+    anchor = first - (weekday - WEEK_START_WEEKDAY) % 7
+    return ((days - anchor[inverse]) // 7 + 1).astype(numpy.int32)
+
+class DateIndex:
+    def __init__(
+            self, seasons: numpy.ndarray, dates: numpy.ndarray
+        ) -> Type["DateIndex"]:
+        """
+        Constructor for the DateIndex class, which sorts games by season
+        and date once so that time-range queries are binary searches
+
+        Args:
+        seasons (numpy.ndarray): The season of each game
+        dates (numpy.ndarray): The datetime64[D] date of each game
+
+        Returns:
+        DateIndex: The initialized DateIndex
+        """
+        seasons = numpy.asarray(seasons, dtype=numpy.int32)
+        dates = numpy.asarray(dates, dtype="datetime64[D]")
+        weeks = get_weeks(seasons, dates)
+        self.order = numpy.lexsort((dates, seasons))
+        self.seasons = seasons[self.order]
+        self.dates = dates[self.order]
+        self.weeks = weeks[self.order]
+
+        # Composite keys keep each sorted column searchable
+        self.week_keys = self.seasons.astype(numpy.int64) * 64 + self.weeks
+
+    def get_weeks(self) -> numpy.ndarray:
+        """
+        Returns the week of the season of each game, in the original order
+
+        Args:
+        None
+
+        Returns:
+        numpy.ndarray: The week of each game
+        """
+        weeks = numpy.empty_like(self.weeks)
+        weeks[self.order] = self.weeks
+        return weeks
+
+    def get_season_range(
+            self, start: int, end: int
+        ) -> Tuple[int, int]:
+        """
+        Returns the sorted positions spanning an inclusive range of seasons
+
+        Args:
+        start (int): The first season
+        end (int): The last season
+
+        Returns:
+        int: The first sorted position in the range
+        int: The sorted position after the range
+        """
+        lo = numpy.searchsorted(self.seasons, start, side="left")
+        hi = numpy.searchsorted(self.seasons, end, side="right")
+        return int(lo), int(hi)
+
+    def select_ranges(
+            self, lo: numpy.ndarray, hi: numpy.ndarray
+        ) -> numpy.ndarray:
+        """
+        Returns the original game indices covered by a set of sorted ranges
+
+        Args:
+        lo (numpy.ndarray): The first sorted position of each range
+        hi (numpy.ndarray): The sorted position after each range
+
+        Returns:
+        numpy.ndarray: The indices of the games in the ranges, in date order
+        """
+        lo = numpy.atleast_1d(lo)
+        hi = numpy.maximum(numpy.atleast_1d(hi), lo)
+        lengths = hi - lo
+        if lengths.sum() == 0:
+            return numpy.empty(0, dtype=self.order.dtype)
+        starts = numpy.repeat(lo - numpy.cumsum(lengths) + lengths, lengths)
+        return self.order[starts + numpy.arange(lengths.sum())]
+
+    def seasons_between(self, start: int, end: int) -> numpy.ndarray:
+        """
+        Returns the games in an inclusive range of seasons
+
+        Args:
+        start (int): The first season
+        end (int): The last season
+
+        Returns:
+        numpy.ndarray: The indices of the games, in date order
+        """
+        return self.select_ranges(*self.get_season_range(start, end))
+
+    def dates_between(
+            self, start: numpy.datetime64, end: numpy.datetime64
+        ) -> numpy.ndarray:
+        """
+        Returns the games played in an inclusive range of dates
+
+        Args:
+        start (numpy.datetime64): The first date
+        end (numpy.datetime64): The last date
+
+        Returns:
+        numpy.ndarray: The indices of the games, in date order
+        """
+        # Seasons never overlap, so the season-major order is also date order
+        lo = numpy.searchsorted(
+            self.dates, numpy.datetime64(start, "D"), side="left"
+        )
+        hi = numpy.searchsorted(
+            self.dates, numpy.datetime64(end, "D"), side="right"
+        )
+        return self.select_ranges(lo, hi)
+
+    def weeks_between(
+            self,
+            start_week: int,
+            end_week: int,
+            start_season: int = None,
+            end_season: int = None
+        ) -> numpy.ndarray:
+        """
+        Returns the games in an inclusive range of weeks of each season in
+        an inclusive range of seasons, e.g. weeks 5-10 of 1985-1995
+
+        Args:
+        start_week (int): The first week
+        end_week (int): The last week
+        start_season (int): The first season, defaults to the earliest
+        end_season (int): The last season, defaults to the latest
+
+        Returns:
+        numpy.ndarray: The indices of the games, in date order
+        """
+        seasons = self.get_seasons(start_season, end_season)
+        lo = numpy.searchsorted(
+            self.week_keys, seasons * 64 + start_week, side="left"
+        )
+        hi = numpy.searchsorted(
+            self.week_keys, seasons * 64 + end_week, side="right"
+        )
+        return self.select_ranges(lo, hi)
+
+    def in_month(
+            self,
+            month: int,
+            start_season: int = None,
+            end_season: int = None
+        ) -> numpy.ndarray:
+        """
+        Returns the games played in a calendar month of each season, e.g.
+        all December games
+
+        Args:
+        month (int): The calendar month, from 1 to 12
+        start_season (int): The first season, defaults to the earliest
+        end_season (int): The last season, defaults to the latest
+
+        Returns:
+        numpy.ndarray: The indices of the games, in date order
+        """
+        seasons = self.get_seasons(start_season, end_season)
+        years = seasons + (0 if month >= SEASON_START_MONTH else 1)
+        first = (years - 1970) * 12 + (month - 1)
+        starts = first.astype("datetime64[M]").astype("datetime64[D]")
+        ends = (first + 1).astype("datetime64[M]").astype("datetime64[D]")
+        lo = numpy.searchsorted(self.dates, starts, side="left")
+        hi = numpy.searchsorted(self.dates, ends, side="left")
+        return self.select_ranges(lo, hi)
+
+    def get_seasons(
+            self, start: int = None, end: int = None
+        ) -> numpy.ndarray:
+        """
+        Returns the distinct indexed seasons within an inclusive range
+
+        Args:
+        start (int): The first season, defaults to the earliest
+        end (int): The last season, defaults to the latest
+
+        Returns:
+        numpy.ndarray: The distinct seasons
+        """
+        lo, hi = self.get_season_range(
+            self.seasons[0] if start is None else start,
+            self.seasons[-1] if end is None else end
+        )
+        return numpy.unique(self.seasons[lo:hi]).astype(numpy.int64)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of indexed games
+
+        Args:
+        None
+
+        Returns:
+        int: The number of games
+        """
+        return len(self.order)
@@ -0,0 +1,324 @@
+import numpy
+import os
+import pandas
+from boxscore.dates import parse_dates, get_date_seasons
+from boxscore.loader import get_years, get_season_path
+from boxscore.storage import list_data_files, read_json
+from boxscore.team import parse_team_season
+from boxscore.workspace import get_workspace_path
+from typing import Dict, Any, List
+
+# The file extension of each export format
+EXPORT_EXTENSIONS = {
+    "arrow": "arrow",
+    "parquet": "parquet"
+}
+
+# The dataset tiers which can be exported
+EXPORT_TIERS = [ "raw", "labeled", "processed", "preprocessed" ]
+
+# The splits of the processed games
+PROCESSED_SPLITS = [ "training", "validation", "testing" ]
+
+# The typed columns of box scores, and of their labels if labeled
+BOX_SCORE_DTYPES = {
+    "home_score": numpy.int16,
+    "away_score": numpy.int16,
+    "home_offense": numpy.int8,
+    "home_defense": numpy.int8,
+    "away_offense": numpy.int8,
+    "away_defense": numpy.int8
+}
+
+def get_pyarrow() -> Any:
+    """
+    Imports pyarrow, which is only needed to export & read columnar files
+
+    Args:
+    None
+
+    Returns:
+    module: The pyarrow module
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise Exception(
+            "Exporting columnar datasets requires pyarrow, " + \
+            "install it with pip install pyarrow"
+        )
+    return pyarrow
+
+def get_box_score_frame(scores: List[Dict[str, Any]]) -> pandas.DataFrame:
+    """
+    Converts box score dicts into a typed frame, with the dates parsed and
+    the team names as categoricals
+
+    Args:
+    scores (list): The box score or labeled box score dicts
+
+    Returns:
+    pandas.DataFrame: The typed box scores
+    """
+    frame = pandas.DataFrame(scores)
+    frame["date"] = parse_dates(list(frame["date"]))
+    for column in [ "home_team", "away_team" ]:
+        frame[column] = frame[column].astype("category")
+    for column, dtype in BOX_SCORE_DTYPES.items():
+        if column in frame.columns:
+            frame[column] = frame[column].astype(dtype)
+    return frame
+
+def is_summary(obj: Any) -> bool:
+    """
+    Checks whether a preprocessed file holds a summary, i.e. a list of
+    rows, a dict written by pandas describe, or a dict of counts keyed by
+    score, rather than other state such as a cache
+
+    Args:
+    obj (Any): The preprocessed file's JSON
+
+    Returns:
+    bool: Whether the JSON is a summary
+    """
+    if isinstance(obj, list):
+        return all(isinstance(row, dict) for row in obj)
+    if not isinstance(obj, dict) or len(obj) == 0:
+        return False
+    if all(isinstance(value, dict) for value in obj.values()):
+        return True
+    return all(
+        key.isdigit() and isinstance(value, (int, float))
+        for key, value in obj.items()
+    )
+
+def get_summary_frame(obj: Any) -> pandas.DataFrame:
+    """
+    Converts a preprocessed summary into a typed frame. Percentage strings
+    become floats, team-seasons are split into a season & team, and the
+    dicts written by pandas describe become one row per index value.
+
+    Args:
+    obj (Any): The preprocessed summary JSON, a list or a dict
+
+    Returns:
+    pandas.DataFrame: The typed summary
+    """
+    if isinstance(obj, list):
+        frame = pandas.DataFrame(obj)
+    elif all(isinstance(value, dict) for value in obj.values()):
+        frame = pandas.DataFrame(obj).rename_axis("norm_diff").reset_index()
+        frame["norm_diff"] = frame["norm_diff"].astype(float)
+        frame.columns = [
+            column.split("'")[-2] if column.startswith("(") else column
+            for column in frame.columns
+        ]
+    else:
+        frame = pandas.DataFrame({
+            "score": [ int(key) for key in obj.keys() ],
+            "count": list(obj.values())
+        })
+    frame.columns = [ column.lower() for column in frame.columns ]
+    for column in frame.columns:
+        values = frame[column]
+        if pandas.api.types.is_string_dtype(values) and \
+                values.str.endswith("%").all():
+            frame[column] = values.str.rstrip("%").astype(float)
+    if "team" in frame.columns and frame["team"].str.match(r"\d{4} ").all():
+        seasons, teams = zip(*[
+            parse_team_season(team) for team in frame["team"]
+        ])
+        frame["team"] = pandas.Categorical(teams)
+        frame.insert(0, "season", numpy.array(seasons, dtype=numpy.int32))
+    return frame
+
+def write_frame(
+        frame: pandas.DataFrame, path: str, format: str = "arrow"
+    ) -> None:
+    """
+    Writes a frame as an uncompressed Arrow IPC file, which can be memory
+    mapped without copying, or as a Parquet file
+
+    Args:
+    frame (pandas.DataFrame): The frame to write
+    path (str): The file to write, without its extension
+    format (str): The export format, either arrow or parquet
+
+    Returns:
+    None
+    """
+    pyarrow = get_pyarrow()
+    extension = EXPORT_EXTENSIONS.get(format)
+    if extension is None:
+        raise Exception(f"Unrecognized export format {format}")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+    if "date" in table.column_names:
+        table = table.set_column(
+            table.schema.get_field_index("date"),
+            "date",
+            table["date"].cast(pyarrow.date32())
+        )
+    if format == "parquet":
+        pyarrow.parquet.write_table(table, f"{path}.{extension}")
+        return
+    with pyarrow.OSFile(f"{path}.{extension}", "wb") as sink, \
+            pyarrow.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+def export_tier(
+        tier: str,
+        format: str = "arrow",
+        directory: str = None
+    ) -> List[str]:
+    """
+    Exports one dataset tier. Raw & labeled seasons are partitioned by
+    season, processed games by split and season, and each preprocessed
+    summary is written to its own file, skipping any cached state which
+    isn't a summary.
+
+    Args:
+    tier (str): The tier, one of raw, labeled, processed or preprocessed
+    format (str): The export format, either arrow or parquet
+    directory (str): The root directory to export into, defaults to the
+        current workspace's export stage
+
+    Returns:
+    list: The paths written, without their extensions
+    """
+    if directory is None:
+        directory = get_workspace_path("export")
+    paths = []
+    if tier in [ "raw", "labeled" ]:
+        for year in get_years(tier):
+            frame = get_box_score_frame(
+                read_json(get_season_path(year, tier))
+            )
+            paths.append(f"{directory}/{tier}/season={year}/part-0")
+            write_frame(frame, paths[-1], format)
+    elif tier == "processed":
+        for split in PROCESSED_SPLITS:
+            frame = get_box_score_frame(
+                read_json(get_workspace_path("processed", f"{split}.json"))
+            )
+            seasons = get_date_seasons(frame["date"].to_numpy())
+            for season in numpy.unique(seasons):
+                paths.append(
+                    f"{directory}/{tier}/split={split}/season={season}/part-0"
+                )
+                write_frame(
+                    frame[seasons == season].reset_index(drop=True),
+                    paths[-1],
+                    format
+                )
+    elif tier == "preprocessed":
+        for file in list_data_files(get_workspace_path("preprocessed")):
+            if not file.endswith(".json"):
+                continue
+            obj = read_json(get_workspace_path("preprocessed", file))
+            if not is_summary(obj):
+                continue
+            frame = get_summary_frame(obj)
+            paths.append(f"{directory}/{tier}/{file.replace('.json', '')}")
+            write_frame(frame, paths[-1], format)
+    else:
+        raise Exception(f"Unrecognized dataset tier {tier}")
+    return paths
+
+def read_file(path: str) -> Any:
+    """
+    Reads one exported file, memory mapping Arrow IPC files so that their
+    columns are read in place rather than copied
+
+    Args:
+    path (str): The exported file
+
+    Returns:
+    pyarrow.Table: The file's table
+    """
+    pyarrow = get_pyarrow()
+    if path.endswith(".parquet"):
+        return pyarrow.parquet.read_table(path, memory_map=True)
+    return pyarrow.ipc.open_file(pyarrow.memory_map(path, "r")).read_all()
+
+def read_dataset(
+        tier: str,
+        name: str = None,
+        seasons: List[int] = None,
+        splits: List[str] = None,
+        directory: str = None,
+        format: str = None
+    ) -> Any:
+    """
+    Reads an exported dataset tier, in either format, restoring the season
+    & split partition keys as columns. Call to_pandas(date_as_object=False)
+    on the result for a typed DataFrame.
+
+    Args:
+    tier (str): The tier, one of raw, labeled, processed or preprocessed
+    name (str): The summary to read, required for the preprocessed tier
+    seasons (list): The seasons to read, defaults to all of them
+    splits (list): The processed splits to read, defaults to all of them
+    directory (str): The root directory the tier was exported into,
+        defaults to the current workspace's export stage
+    format (str): The export format to read, defaults to the first one
+        found, so partitions exported in both formats are read once
+
+    Returns:
+    pyarrow.Table: The concatenated partitions
+    """
+    if directory is None:
+        directory = get_workspace_path("export")
+    pyarrow = get_pyarrow()
+    root = f"{directory}/{tier}"
+    extensions = list(EXPORT_EXTENSIONS.values())
+    if format is not None:
+        if format not in EXPORT_EXTENSIONS:
+            raise Exception(f"Unrecognized export format {format}")
+        extensions = [ EXPORT_EXTENSIONS[format] ]
+    if tier == "preprocessed":
+        if name is None:
+            raise Exception("Reading a preprocessed summary requires a name")
+        for extension in extensions:
+            if os.path.exists(f"{root}/{name}.{extension}"):
+                return read_file(f"{root}/{name}.{extension}")
+        raise Exception(f"Unrecognized preprocessed summary {name}")
+    if tier not in EXPORT_TIERS:
+        raise Exception(f"Unrecognized dataset tier {tier}")
+
+    # Walk the hive-style partition directories, e.g. split=x/season=y
+    tables = []
+    for parent, _, files in sorted(os.walk(root)):
+        keys = dict(
+            part.split("=", 1)
+            for part in os.path.relpath(parent, root).split(os.sep)
+            if "=" in part
+        )
+        if "season" not in keys:
+            continue
+        season = int(keys["season"])
+        if seasons is not None and season not in seasons:
+            continue
+        if splits is not None and keys.get("split") not in splits:
+            continue
+        # Read the partition in a single format, the first one present
+        by_extension = [
+            [ f for f in sorted(files) if f.endswith(f".{extension}") ]
+            for extension in extensions
+        ]
+        parts = next((p for p in by_extension if len(p) > 0), [])
+        for file in parts:
+            table = read_file(f"{parent}/{file}")
+            if "split" in keys:
+                table = table.append_column(
+                    "split", pyarrow.array([ keys["split"] ] * len(table))
+                )
+            tables.append(table.append_column(
+                "season",
+                pyarrow.array(numpy.full(len(table), season, numpy.int32))
+            ))
+    if len(tables) == 0:
+        raise Exception(f"No exported {tier} partitions found in {root}")
+    return pyarrow.concat_tables(tables, promote_options="permissive")
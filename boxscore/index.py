@@ -0,0 +1,182 @@
+import json
+import os
+from boxscore.boxscore import BoxScore, LabeledBoxScore
+from boxscore.storage import find_data_path, \
+                             is_cached, \
+                             list_data_files, \
+                             read_json
+from boxscore.workspace import get_workspace
+from collections import Counter
+from typing import Dict, Any, List
+
+# The kinds of season files which can be indexed
+INDEX_KINDS = [ "raw", "labeled" ]
+
+def get_index_path(year: int, kind: str = "raw", root: str = None) -> str:
+    """
+    Returns the path of a season's hash index, stored alongside the data
+
+    Args:
+    year (int): The year the season occurred
+    kind (str): The kind of season file, either raw or labeled
+    root (str): The root directory of the dataset version, defaults to the
+        current workspace's
+
+    Returns:
+    str: The path of the season's hash index
+    """
+    if kind not in INDEX_KINDS:
+        raise Exception(f"Unrecognized season kind {kind}")
+    if root is None:
+        root = get_workspace().root
+    return f"{root}/index/{kind}/{year}.json"
+
+def get_indexed_years(kind: str = "raw", root: str = None) -> List[int]:
+    """
+    Returns the years for which a kind of season file exists in a dataset
+    version, in order
+
+    Args:
+    kind (str): The kind of season file, either raw or labeled
+    root (str): The root directory of the dataset version, defaults to the
+        current workspace's
+
+    Returns:
+    list: The years, in ascending order
+    """
+    if root is None:
+        root = get_workspace().root
+    return sorted([
+        int(name.replace(".json", ""))
+        for name in list_data_files(f"{root}/{kind}")
+        if name.endswith(".json")
+    ])
+
+def build_season_index(
+        scores: List[Dict[str, Any]], kind: str = "raw"
+    ) -> List[List[str]]:
+    """
+    Hashes each game of a season in one pass over its JSON dicts, without
+    constructing or validating box scores
+
+    Args:
+    scores (list): The season's box score dicts
+    kind (str): The kind of season file, either raw or labeled
+
+    Returns:
+    list: The [key, hash] pair of each game, in file order
+    """
+    hash_static = LabeledBoxScore.hash_static \
+        if kind == "labeled" else BoxScore.hash_static
+    return [
+        [ BoxScore.get_key_static(score), hash_static(score) ]
+        for score in scores
+    ]
+
+def load_season_index(
+        year: int,
+        kind: str = "raw",
+        root: str = None,
+        write: bool = False
+    ) -> List[List[str]]:
+    """
+    Loads a season's hash index, rebuilding it from the season file if it
+    is missing, older than the season file, or the season file is cached
+
+    Args:
+    year (int): The year the season occurred
+    kind (str): The kind of season file, either raw or labeled
+    root (str): The root directory of the dataset version, defaults to the
+        current workspace's
+    write (bool): Whether to store a rebuilt index alongside the data
+
+    Returns:
+    list: The [key, hash] pair of each game, in file order
+    """
+    if root is None:
+        root = get_workspace().root
+    season_path = find_data_path(f"{root}/{kind}/{year}.json")
+    index_path = get_index_path(year, kind, root)
+    if not os.path.exists(season_path) and not is_cached(season_path):
+        return []
+    if os.path.exists(index_path) and not is_cached(season_path) and \
+            os.path.getmtime(index_path) >= os.path.getmtime(season_path):
+        with open(index_path) as index_data:
+            return json.load(index_data)["games"]
+    index = build_season_index(read_json(season_path), kind)
+    if write:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(index_path, "w") as index_data:
+            index_data.write(json.dumps({
+                "year": year,
+                "kind": kind,
+                "games": index
+            }))
+    return index
+
+def diff_season_indexes(
+        old: List[List[str]], new: List[List[str]]
+    ) -> Dict[str, List[str]]:
+    """
+    Compares two versions of a season's hash index in O(n), matching games
+    by key and comparing the content hashes of matched games
+
+    Args:
+    old (list): The old version's [key, hash] pairs
+    new (list): The new version's [key, hash] pairs
+
+    Returns:
+    dict: The keys of the added, removed & changed games, and of the games
+        appearing more than once in the new version
+    """
+    old_hashes = {}
+    for key, digest in old:
+        old_hashes.setdefault(key, []).append(digest)
+    new_hashes = {}
+    for key, digest in new:
+        new_hashes.setdefault(key, []).append(digest)
+    counts = Counter(key for key, _ in new)
+    return {
+        "added": [ key for key in new_hashes if key not in old_hashes ],
+        "removed": [ key for key in old_hashes if key not in new_hashes ],
+        "changed": [
+            key for key, digests in new_hashes.items()
+            if key in old_hashes and
+                sorted(set(digests)) != sorted(set(old_hashes[key]))
+        ],
+        "duplicates": [ key for key, count in counts.items() if count > 1 ]
+    }
+
+def diff_datasets(
+        old_root: str,
+        new_root: str = None,
+        kind: str = "raw",
+        write: bool = False
+    ) -> Dict[int, Dict[str, List[str]]]:
+    """
+    Compares two versions of a dataset season by season through their hash
+    indexes, e.g. a re-scraped copy against the current data
+
+    Args:
+    old_root (str): The root directory of the old version
+    new_root (str): The root directory of the new version, defaults to the
+        current workspace's
+    kind (str): The kind of season file, either raw or labeled
+    write (bool): Whether to store rebuilt indexes alongside the data
+
+    Returns:
+    dict: The differences of each season with any, keyed by year
+    """
+    years = sorted(
+        set(get_indexed_years(kind, old_root)) | \
+        set(get_indexed_years(kind, new_root))
+    )
+    diffs = {}
+    for year in years:
+        diff = diff_season_indexes(
+            load_season_index(year, kind, old_root, write),
+            load_season_index(year, kind, new_root, write)
+        )
+        if any(len(keys) > 0 for keys in diff.values()):
+            diffs[year] = diff
+    return diffs
@@ -0,0 +1,273 @@
+import os
+import re
+from boxscore.boxscore import BoxScoreList
+from boxscore.storage import evict_cached, \
+                             open_data, \
+                             set_data_cache, \
+                             strip_compression, \
+                             write_json
+from boxscore.workspace import get_workspace_path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from html.parser import HTMLParser
+from jsonschema import ValidationError
+from typing import Dict, Any, Iterator, List, Tuple
+
+# The header cells naming the date, away team & home team columns, the
+# column after each team holding its score
+HEADER_COLUMNS = {
+    "date": [ "date" ],
+    "away_team": [ "visitor", "away" ],
+    "home_team": [ "home" ]
+}
+
+# Dates as they appear on season pages, with or without a weekday
+DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2,4})")
+
+# Elements hidden on desktop, holding the abbreviated team names
+HIDDEN_CLASSES = [ "visible-xs" ]
+
+# Elements without an end tag, which never open a hidden element
+VOID_TAGS = [ "br", "img", "input", "meta", "link", "hr", "wbr" ]
+
+class SeasonPageParser(HTMLParser):
+    def __init__(self) -> None:
+        """
+        Constructor for the SeasonPageParser class, which collects the text
+        of every table row on a saved season page in a single pass
+
+        Args:
+        None
+
+        Returns:
+        None
+        """
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self.row = None
+        self.cell = None
+        self.header = False
+        self.hidden_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str]]) -> None:
+        """
+        Opens a row or cell, or tracks elements hidden within a cell
+
+        Args:
+        tag (str): The element's tag
+        attrs (list): The element's attributes
+
+        Returns:
+        None
+        """
+        if tag == "tr":
+            self.row, self.header = [], False
+        elif tag in [ "td", "th" ] and self.row is not None:
+            self.cell = []
+            self.header = self.header or tag == "th"
+        elif self.cell is not None and tag not in VOID_TAGS:
+            classes = (dict(attrs).get("class") or "").split()
+            if self.hidden_depth > 0 or \
+                    any(c in HIDDEN_CLASSES for c in classes):
+                self.hidden_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        """
+        Closes a row or cell, keeping the cell's visible text
+
+        Args:
+        tag (str): The element's tag
+
+        Returns:
+        None
+        """
+        if tag in [ "td", "th" ] and self.cell is not None:
+            self.row.append(" ".join("".join(self.cell).split()))
+            self.cell, self.hidden_depth = None, 0
+        elif tag == "tr" and self.row is not None:
+            self.rows.append((self.header, self.row))
+            self.row = None
+        elif self.hidden_depth > 0:
+            self.hidden_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        """
+        Collects the visible text of the open cell
+
+        Args:
+        data (str): The text
+
+        Returns:
+        None
+        """
+        if self.cell is not None and self.hidden_depth == 0:
+            self.cell.append(data)
+
+def get_header_columns(header: List[str]) -> Dict[str, int]:
+    """
+    Locates the date, away team & home team columns of a table header
+
+    Args:
+    header (list): The header row's cell text
+
+    Returns:
+    dict: The column of each field, or None if the header isn't a box score
+        table's
+    """
+    names = [ cell.lower() for cell in header ]
+    columns = {}
+    for field, labels in HEADER_COLUMNS.items():
+        matches = [ i for i, name in enumerate(names) if name in labels ]
+        if len(matches) == 0:
+            return None
+        columns[field] = matches[0]
+    return columns
+
+def format_date(date: str, year: int) -> str:
+    """
+    Normalizes a season page's date as MM/DD/YYYY
+
+    Args:
+    date (str): The date cell's text, e.g. Sun 09/10/2023
+    year (int): The season, resolving two-digit years
+
+    Returns:
+    str: The formatted date, or None if the cell has no date
+    """
+    match = DATE_PATTERN.search(date)
+    if match is None:
+        return None
+    month, day, date_year = [ int(part) for part in match.groups() ]
+    if date_year < 100:
+        date_year = year if month >= 6 else year + 1
+    return f"{month:02d}/{day:02d}/{date_year}"
+
+def parse_season_page(html: str, year: int) -> List[Dict[str, Any]]:
+    """
+    Parses the box scores out of a saved season page, in page order. Games
+    without both scores, e.g. ones not yet played, are skipped.
+
+    Args:
+    html (str): The page's HTML
+    year (int): The season
+
+    Returns:
+    list: The box score dicts
+    """
+    parser = SeasonPageParser()
+    parser.feed(html)
+    parser.close()
+    scores, columns = [], None
+    for header, row in parser.rows:
+        if header:
+            columns = get_header_columns(row)
+            continue
+        if columns is None:
+            continue
+        try:
+            date = format_date(row[columns["date"]], year)
+            away_score = int(row[columns["away_team"] + 1])
+            home_score = int(row[columns["home_team"] + 1])
+        except (IndexError, ValueError):
+            continue
+        if date is None:
+            continue
+        scores.append({
+            "date": date,
+            "away_team": row[columns["away_team"]],
+            "away_score": away_score,
+            "home_team": row[columns["home_team"]],
+            "home_score": home_score
+        })
+    return scores
+
+def get_page_years(directory: str) -> Dict[int, str]:
+    """
+    Finds the saved season pages in a directory, named by year, e.g.
+    2023.html, compressed or not
+
+    Args:
+    directory (str): The directory of saved pages
+
+    Returns:
+    dict: The path of each year's page
+    """
+    pages = {}
+    for name in sorted(os.listdir(directory)):
+        stem = strip_compression(name)
+        if stem.endswith(".html") and stem[:-len(".html")].isdigit():
+            pages[int(stem[:-len(".html")])] = os.path.join(directory, name)
+    return pages
+
+def ingest_season_page(
+        path: str, year: int, output: str, compress: str = None
+    ) -> Tuple[int, int]:
+    """
+    Parses, validates & writes one season page as a raw season file
+
+    Args:
+    path (str): The saved season page
+    year (int): The season
+    output (str): The directory in which to write the season file
+    compress (str): The compression, either gzip or zstd, or None
+
+    Returns:
+    int: The season
+    int: The number of box scores written
+    """
+    with open_data(path) as page:
+        scores = parse_season_page(page.read(), year)
+    if len(scores) == 0:
+        raise Exception(f"No box scores found in {path}")
+    valid, err = BoxScoreList.validate_static(scores)
+    if not valid:
+        raise ValidationError(err)
+    write_json(scores, f"{output}/{year}.json", compress)
+    return year, len(scores)
+
+def ingest_season_pages(
+        directory: str,
+        output: str = None,
+        years: List[int] = None,
+        compress: str = None,
+        workers: int = None
+    ) -> Iterator[Tuple[int, int]]:
+    """
+    Ingests many saved season pages on a process pool, each worker writing
+    its season file as soon as it is parsed, and yields each season as it
+    completes
+
+    Args:
+    directory (str): The directory of saved pages
+    output (str): The directory in which to write the season files,
+        defaults to the current workspace's raw stage
+    years (list): The years to ingest, defaults to every saved page
+    compress (str): The compression, either gzip or zstd, or None
+    workers (int): The number of worker processes, defaults to the CPUs
+
+    Returns:
+    Iterator: The season & number of box scores written, as completed
+    """
+    if output is None:
+        output = get_workspace_path("raw")
+    pages = get_page_years(directory)
+    if years is not None:
+        missing = [ year for year in years if year not in pages ]
+        if len(missing) > 0:
+            raise Exception(f"No saved pages for {missing}")
+        pages = { year: pages[year] for year in years }
+    os.makedirs(output, exist_ok=True)
+
+    # Workers always write to disk, any cached copy being stale afterwards
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=set_data_cache,
+            initargs=(False,)
+        ) as executor:
+        futures = [
+            executor.submit(ingest_season_page, path, year, output, compress)
+            for year, path in pages.items()
+        ]
+        for future in as_completed(futures):
+            year, count = future.result()
+            evict_cached(f"{output}/{year}.json")
+            yield year, count
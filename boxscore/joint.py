@@ -0,0 +1,238 @@
+import numpy
+from boxscore.sampler import AliasTable
+from boxscore.skill import SKILL_DIFF_OFFSET, \
+                           SKILL_DIFF_BINS, \
+                           SKILL_DIFF_PAIRS, \
+                           get_joint_score_counts, \
+                           get_pair_index, \
+                           get_skill_diff_bins
+from typing import Dict, Any, Type, Tuple
+
+def smooth_scores(counts: numpy.ndarray, bandwidth: float) -> numpy.ndarray:
+    """
+    Smooths histograms over both score axes with a Gaussian kernel. Each
+    score's kernel is truncated to the histogram's scores and renormalized,
+    so that each histogram keeps its total.
+
+    Args:
+    counts (numpy.ndarray): The histograms, (P, S, S)
+    bandwidth (float): The kernel's std, in points
+
+    Returns:
+    numpy.ndarray: The smoothed histograms
+    """
+    scores = numpy.arange(counts.shape[-1])
+    weights = numpy.exp(
+        -0.5 * ((scores[None, :] - scores[:, None]) / bandwidth) ** 2
+    )
+    weights /= weights.sum(axis=1, keepdims=True)
+    return weights.T @ counts @ weights
+
+class JointScoreDistribution:
+    @staticmethod
+    def from_columns(
+            columns: Dict[str, numpy.ndarray],
+            bandwidth: float = 0.0,
+            prior: float = 0.0
+        ) -> Type["JointScoreDistribution"]:
+        """
+        Builds the (home_score, away_score) histogram of each pair of home &
+        away skill differentials from labeled game columns
+
+        Args:
+        columns (dict): The home_score, away_score & tier columns, e.g. as
+            loaded by load_labeled_columns
+        bandwidth (float): The std in points of the Gaussian kernel to smooth
+            each histogram's scores with, or 0 not to smooth them
+        prior (float): The number of pseudo-games, distributed like every
+            game pooled, to shrink each histogram toward
+
+        Returns:
+        JointScoreDistribution: The joint score distributions
+        """
+        n_scores = int(max(
+            columns["home_score"].max(), columns["away_score"].max()
+        )) + 1
+        counts = get_joint_score_counts(
+            get_skill_diff_bins(
+                columns["home_offense"], columns["away_defense"]
+            ),
+            get_skill_diff_bins(
+                columns["away_offense"], columns["home_defense"]
+            ),
+            columns["home_score"],
+            columns["away_score"],
+            n_scores
+        )
+        return JointScoreDistribution(counts, bandwidth, prior)
+
+    def __init__(
+            self,
+            counts: numpy.ndarray,
+            bandwidth: float = 0.0,
+            prior: float = 0.0
+        ) -> Type["JointScoreDistribution"]:
+        """
+        Constructor for the JointScoreDistribution class, which normalizes
+        the histograms into probabilities and precomputes each pair's tie &
+        margin probabilities. Pairs without games fall back onto every game
+        pooled.
+
+        Args:
+        counts (numpy.ndarray): The histogram of each pair, (P, S, S)
+        bandwidth (float): The std in points of the smoothing kernel, or 0
+        prior (float): The number of pooled pseudo-games per pair
+
+        Returns:
+        JointScoreDistribution: The initialized JointScoreDistribution
+        """
+        self.counts = counts
+        self.games = counts.sum(axis=(1, 2))
+        self.n_scores = counts.shape[-1]
+        if bandwidth > 0:
+            counts = smooth_scores(counts, bandwidth)
+        pooled = counts.sum(axis=0) / counts.sum()
+        counts = counts + prior * pooled
+        counts[counts.sum(axis=(1, 2)) == 0] = pooled
+        self.pmfs = counts / counts.sum(axis=(1, 2), keepdims=True)
+
+        # Sum each histogram along its diagonals into a margin distribution,
+        # margin m = home - away stored at m + S - 1
+        n = self.n_scores
+        margins = (
+            numpy.arange(n)[:, None] - numpy.arange(n)[None, :] + n - 1
+        ).ravel()
+        flat = self.pmfs.reshape(SKILL_DIFF_PAIRS, n * n)
+        self.margins = numpy.zeros((SKILL_DIFF_PAIRS, 2 * n - 1))
+        for pair in range(SKILL_DIFF_PAIRS):
+            self.margins[pair] = numpy.bincount(
+                margins, weights=flat[pair], minlength=2 * n - 1
+            )
+
+        # The probability of each margin or more, with a zero past the end
+        self.at_least = numpy.zeros((SKILL_DIFF_PAIRS, 2 * n))
+        self.at_least[:, :-1] = numpy.cumsum(
+            self.margins[:, ::-1], axis=1
+        )[:, ::-1]
+        self.alias = None
+
+    def get_margin_index(self, margin: int) -> int:
+        """
+        Returns the column of a margin in the cumulative margin table,
+        clipping margins beyond any observed score
+
+        Args:
+        margin (int): The home margin
+
+        Returns:
+        int: The column of the margin
+        """
+        n = self.n_scores
+        return int(numpy.clip(margin + n - 1, 0, 2 * n - 1))
+
+    def get_tie_probability(
+            self, home_diffs: numpy.ndarray, away_diffs: numpy.ndarray
+        ) -> numpy.ndarray:
+        """
+        Returns the probability of a tie for each pair of skill differential
+        bins
+
+        Args:
+        home_diffs (numpy.ndarray): The home offense versus away defense bins
+        away_diffs (numpy.ndarray): The away offense versus home defense bins
+
+        Returns:
+        numpy.ndarray: The tie probability of each pair
+        """
+        pairs = get_pair_index(home_diffs, away_diffs)
+        return self.margins[pairs, self.n_scores - 1]
+
+    def get_margin_probability(
+            self,
+            home_diffs: numpy.ndarray,
+            away_diffs: numpy.ndarray,
+            margin: int,
+            absolute: bool = False
+        ) -> numpy.ndarray:
+        """
+        Returns the probability of the home side winning by at least a
+        margin for each pair of skill differential bins, or of either side
+        winning by at least the margin
+
+        Args:
+        home_diffs (numpy.ndarray): The home offense versus away defense bins
+        away_diffs (numpy.ndarray): The away offense versus home defense bins
+        margin (int): The margin, negative margins allowing home losses
+        absolute (bool): Whether either side may win by the margin
+
+        Returns:
+        numpy.ndarray: The margin probability of each pair
+        """
+        pairs = get_pair_index(home_diffs, away_diffs)
+        probability = self.at_least[pairs, self.get_margin_index(margin)]
+        if absolute and margin > 0:
+            probability = probability + 1.0 - \
+                self.at_least[pairs, self.get_margin_index(-margin + 1)]
+        elif absolute:
+            probability = numpy.ones_like(probability)
+        return probability
+
+    def sample(
+            self,
+            home_diffs: numpy.ndarray,
+            away_diffs: numpy.ndarray,
+            rng: numpy.random.Generator
+        ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Draws home & away scores jointly for each pair of skill differential
+        bins, compiling the alias tables on first use
+
+        Args:
+        home_diffs (numpy.ndarray): The home offense versus away defense bins
+        away_diffs (numpy.ndarray): The away offense versus home defense bins
+        rng (numpy.random.Generator): The random generator
+
+        Returns:
+        numpy.ndarray: The drawn home scores
+        numpy.ndarray: The drawn away scores
+        """
+        if self.alias is None:
+            self.alias = AliasTable(
+                self.pmfs.reshape(SKILL_DIFF_PAIRS, self.n_scores ** 2)
+            )
+        outcomes = self.alias.sample(
+            get_pair_index(home_diffs, away_diffs), rng
+        )
+        return outcomes // self.n_scores, outcomes % self.n_scores
+
+    def __json__(self) -> Dict[str, Any]:
+        """
+        Serializes the JointScoreDistribution instance as a JSON dict of
+        each pair's games, home win, tie & margin distribution
+
+        Args:
+        None
+
+        Returns:
+        dict: The JSON-serialized JointScoreDistribution
+        """
+        n = self.n_scores
+        return {
+            "n_scores": n,
+            "pairs": [
+                {
+                    "home_diff": int(pair // SKILL_DIFF_BINS) - \
+                        SKILL_DIFF_OFFSET,
+                    "away_diff": int(pair % SKILL_DIFF_BINS) - \
+                        SKILL_DIFF_OFFSET,
+                    "games": int(self.games[pair]),
+                    "home_win": float(self.at_least[pair, n]),
+                    "tie": float(self.margins[pair, n - 1]),
+                    "margins": {
+                        str(m - n + 1): float(p)
+                        for m, p in enumerate(self.margins[pair]) if p > 0
+                    }
+                }
+                for pair in range(SKILL_DIFF_PAIRS)
+            ]
+        }
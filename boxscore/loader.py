@@ -0,0 +1,127 @@
+import numpy
+from boxscore.boxscore import BoxScoreList, LabeledBoxScore
+from boxscore.storage import list_data_files, read_json
+from boxscore.workspace import get_workspace_path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from jsonschema import ValidationError
+from typing import Any, Dict, Iterator, List, Tuple
+
+# The kinds of season file, each stored in its own workspace stage
+SEASON_KINDS = [ "raw", "labeled" ]
+
+def get_season_path(year: int, kind: str = "raw") -> str:
+    """
+    Returns the uncompressed path of a season file
+
+    Args:
+    year (int): The year the season occurred
+    kind (str): The kind of season file, either raw or labeled
+
+    Returns:
+    str: The path of the season file
+    """
+    if kind not in SEASON_KINDS:
+        raise Exception(f"Unrecognized season kind {kind}")
+    return get_workspace_path(kind, f"{year}.json")
+
+def get_years(kind: str = "raw") -> List[int]:
+    """
+    Returns the years for which a kind of season file exists, compressed or
+    not, in order
+
+    Args:
+    kind (str): The kind of season file, either raw or labeled
+
+    Returns:
+    list: The years, in ascending order
+    """
+    if kind not in SEASON_KINDS:
+        raise Exception(f"Unrecognized season kind {kind}")
+    return sorted([
+        int(name.replace(".json", ""))
+        for name in list_data_files(get_workspace_path(kind))
+        if name.endswith(".json")
+    ])
+
+def load_season(year: int, kind: str = "raw") -> Any:
+    """
+    Reads, parses & validates a single season file, decompressing it as it
+    is parsed if it is stored compressed
+
+    Args:
+    year (int): The year the season occurred
+    kind (str): The kind of season file, either raw or labeled
+
+    Returns:
+    BoxScoreList: The season's box scores, if kind is raw
+    list: The season's LabeledBoxScores, if kind is labeled
+    """
+    scores = read_json(get_season_path(year, kind))
+    if kind == "labeled":
+        return LabeledBoxScore.from_json_list(scores)
+    return BoxScoreList(scores)
+
+def load_seasons(
+        years: List[int] = None,
+        kind: str = "raw",
+        workers: int = 8
+    ) -> Iterator[Tuple[int, Any]]:
+    """
+    Loads many season files concurrently on a thread pool, so that reading
+    later files overlaps with parsing earlier ones, and yields the seasons in
+    the order of the given years. At most twice as many seasons as there are
+    workers are in flight at once.
+
+    Args:
+    years (list): The years to load, defaults to every year of that kind
+    kind (str): The kind of season file, either raw or labeled
+    workers (int): The number of loader threads
+
+    Returns:
+    Iterator: The (year, season) pairs, in the order of the given years
+    """
+    if years is None:
+        years = get_years(kind)
+    years = list(years)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        next_year = 0
+        while next_year < len(years) or pending:
+            while next_year < len(years) and len(pending) < 2 * workers:
+                year = years[next_year]
+                pending.append(
+                    (year, executor.submit(load_season, year, kind))
+                )
+                next_year += 1
+            year, future = pending.popleft()
+            yield year, future.result()
+
+def load_labeled_columns(years: List[int] = None) -> Dict[str, numpy.ndarray]:
+    """
+    Loads the scores & tiers of many labeled seasons straight into columnar
+    arrays, validating each season file once and never constructing
+    LabeledBoxScores
+
+    Args:
+    years (list): The years to load, defaults to every labeled year
+
+    Returns:
+    dict: The home_score, away_score & tier columns of every game, in the
+        order of the given years
+    """
+    if years is None:
+        years = get_years("labeled")
+    seasons = []
+    for year in years:
+        scores = read_json(get_season_path(year, "labeled"))
+        valid, err = LabeledBoxScore.validate_list_static(scores)
+        if not valid:
+            raise ValidationError(err)
+        seasons.append(LabeledBoxScore.get_columns_static(scores))
+    if len(seasons) == 0:
+        return LabeledBoxScore.get_columns_static([])
+    return {
+        field: numpy.concatenate([ season[field] for season in seasons ])
+        for field in seasons[0]
+    }
@@ -0,0 +1,165 @@
+import numpy
+import scipy.sparse
+import scipy.sparse.linalg
+from boxscore.rating import get_rating_tiers
+from boxscore.table import GameTable
+from boxscore.team import TeamDimension
+from typing import Dict, Any, Type, Tuple
+
+def get_design_matrix(
+        table: GameTable, n_teams: int
+    ) -> Tuple[scipy.sparse.csr_matrix, numpy.ndarray, numpy.ndarray]:
+    """
+    Builds the sparse least-squares design of every game side in a table.
+    Each side's score is modelled as its season's mean score, plus or minus
+    half the home advantage, plus its offense, minus the opposing defense.
+    The columns are the offense of each team, then the defense of each team,
+    then each season's mean score, then the home advantage.
+
+    Args:
+    table (GameTable): The games
+    n_teams (int): The number of team ids
+
+    Returns:
+    scipy.sparse.csr_matrix: The design, one row per game side
+    numpy.ndarray: The score of each game side
+    numpy.ndarray: The distinct seasons, in column order
+    """
+    n_games = len(table)
+    seasons, season_index = numpy.unique(table["season"], return_inverse=True)
+    offense = numpy.concatenate([ table["home_id"], table["away_id"] ])
+    defense = numpy.concatenate([ table["away_id"], table["home_id"] ])
+    season_column = 2 * n_teams + numpy.tile(season_index, 2)
+    home_column = numpy.full(2 * n_games, 2 * n_teams + len(seasons))
+    rows = numpy.tile(numpy.arange(2 * n_games), 4)
+    columns = numpy.concatenate([
+        offense, n_teams + defense, season_column, home_column
+    ])
+    values = numpy.concatenate([
+        numpy.ones(2 * n_games),
+        -numpy.ones(2 * n_games),
+        numpy.ones(2 * n_games),
+        numpy.repeat([ 0.5, -0.5 ], n_games)
+    ])
+    design = scipy.sparse.csr_matrix(
+        (values, (rows, columns)),
+        shape=(2 * n_games, 2 * n_teams + len(seasons) + 1)
+    )
+    scores = numpy.concatenate([
+        table["home_score"], table["away_score"]
+    ]).astype(numpy.float64)
+    return design, scores, seasons
+
+class MasseyRatings:
+    @staticmethod
+    def fit(
+            table: GameTable, dimension: TeamDimension, ridge: float = 1.0
+        ) -> Type["MasseyRatings"]:
+        """
+        Solves the schedule-adjusted offense & defense ratings of every
+        team-season in a table at once. Team-season ids are unique to their
+        season, so all seasons share one sparse system of normal equations,
+        which decouples into per-season blocks. The ridge penalty acts like
+        a number of pseudo-games against an average opponent, centering each
+        season's ratings on zero and shrinking those of teams with few games.
+
+        Args:
+        table (GameTable): The games, from one or many seasons
+        dimension (TeamDimension): The dimension the table's teams belong to
+        ridge (float): The ridge penalty on the team ratings
+
+        Returns:
+        MasseyRatings: The fitted ratings
+        """
+        if not ridge > 0:
+            raise ValueError(f"The ridge penalty must be positive: {ridge}")
+        n_teams = len(dimension)
+        design, scores, seasons = get_design_matrix(table, n_teams)
+        penalty = numpy.zeros(design.shape[1])
+        penalty[:2 * n_teams] = ridge
+        normal = (design.T @ design + scipy.sparse.diags(penalty)).tocsc()
+        solution = scipy.sparse.linalg.spsolve(normal, design.T @ scores)
+        return MasseyRatings(
+            dimension,
+            solution[:n_teams],
+            solution[n_teams:2 * n_teams],
+            dict(zip(
+                seasons.tolist(), solution[2 * n_teams:-1].tolist()
+            )),
+            float(solution[-1])
+        )
+
+    def __init__(
+            self,
+            dimension: TeamDimension,
+            offense: numpy.ndarray,
+            defense: numpy.ndarray,
+            season_means: Dict[int, float],
+            home_advantage: float
+        ) -> Type["MasseyRatings"]:
+        """
+        Constructor for the MasseyRatings class, which holds offense and
+        defense ratings per team-season in points per game relative to the
+        season average, a higher rating always being a better unit
+
+        Args:
+        dimension (TeamDimension): The dimension the ratings are indexed by
+        offense (numpy.ndarray): The offense rating of each team id
+        defense (numpy.ndarray): The defense rating of each team id
+        season_means (dict): The mean score of each season
+        home_advantage (float): The home scoring advantage
+
+        Returns:
+        MasseyRatings: The initialized MasseyRatings
+        """
+        self.dimension = dimension
+        self.offense = offense
+        self.defense = defense
+        self.season_means = season_means
+        self.home_advantage = home_advantage
+
+    def get_game_tiers(self, table: GameTable) -> numpy.ndarray:
+        """
+        Buckets the ratings of each game's teams into the 1-5 tiers used to
+        label box scores
+
+        Args:
+        table (GameTable): The games, indexed by the same dimension
+
+        Returns:
+        numpy.ndarray: The home offense, home defense, away offense & away
+            defense tiers of each game
+        """
+        offense_tiers = get_rating_tiers(self.offense)
+        defense_tiers = get_rating_tiers(self.defense)
+        return numpy.stack([
+            offense_tiers[table["home_id"]],
+            defense_tiers[table["home_id"]],
+            offense_tiers[table["away_id"]],
+            defense_tiers[table["away_id"]]
+        ], axis=1)
+
+    def __json__(self) -> Dict[str, Any]:
+        """
+        Serializes the MasseyRatings instance as a JSON dict
+
+        Args:
+        None
+
+        Returns:
+        dict: The JSON-serialized MasseyRatings
+        """
+        return {
+            "home_advantage": self.home_advantage,
+            "season_means": {
+                str(season): mean
+                for season, mean in self.season_means.items()
+            },
+            "ratings": {
+                self.dimension.get_team_season(team_id): {
+                    "offense": float(self.offense[team_id]),
+                    "defense": float(self.defense[team_id])
+                }
+                for team_id in range(len(self.dimension))
+            }
+        }
@@ -0,0 +1,154 @@
+import numpy
+import scipy.sparse
+from boxscore.table import GameTable
+from boxscore.team import TeamDimension
+from typing import Dict, Any, Type
+
+# The team-versus-team statistics, each held as its own sparse matrix
+MATCHUP_STATS = [ "games", "points_for", "points_against", "margin" ]
+
+class MatchupMatrices:
+    @staticmethod
+    def from_table(
+            table: GameTable,
+            dimension: TeamDimension,
+            franchise: bool = False
+        ) -> Type["MatchupMatrices"]:
+        """
+        Builds the team-versus-team matrices of a game table in one pass.
+        Each game adds an entry from the home team against the away team
+        and one from the away team against the home team, and repeated
+        meetings are summed. Team-season ids are unique to their season, so
+        the matrices of many seasons stack block-diagonally; by franchise,
+        meetings across every season are summed instead.
+
+        Args:
+        table (GameTable): The games
+        dimension (TeamDimension): The dimension the table's teams belong to
+        franchise (bool): Whether to index by franchise rather than by
+            team-season id
+
+        Returns:
+        MatchupMatrices: The matrices, rows being teams & columns opponents
+        """
+        home, away = table["home_id"], table["away_id"]
+        n_teams = len(dimension)
+        if franchise:
+            franchise_ids = dimension.get_franchise_ids()
+            home, away = franchise_ids[home], franchise_ids[away]
+            n_teams = len(dimension.franchises)
+        teams = numpy.concatenate([ home, away ])
+        opponents = numpy.concatenate([ away, home ])
+        points_for = numpy.concatenate([
+            table["home_score"], table["away_score"]
+        ]).astype(numpy.float64)
+        points_against = numpy.concatenate([
+            table["away_score"], table["home_score"]
+        ]).astype(numpy.float64)
+        values = {
+            "games": numpy.ones(len(teams)),
+            "points_for": points_for,
+            "points_against": points_against,
+            "margin": points_for - points_against
+        }
+        return MatchupMatrices({
+            stat: scipy.sparse.csr_matrix(
+                (values[stat], (teams, opponents)), shape=(n_teams, n_teams)
+            )
+            for stat in MATCHUP_STATS
+        })
+
+    def __init__(
+            self, matrices: Dict[str, scipy.sparse.csr_matrix]
+        ) -> Type["MatchupMatrices"]:
+        """
+        Constructor for the MatchupMatrices class
+
+        Args:
+        matrices (dict): The CSR matrix of each statistic in MATCHUP_STATS
+
+        Returns:
+        MatchupMatrices: The initialized MatchupMatrices
+        """
+        self.matrices = matrices
+
+    def __getitem__(self, stat: str) -> scipy.sparse.csr_matrix:
+        """
+        Returns the matrix of one statistic
+
+        Args:
+        stat (str): The statistic, one of MATCHUP_STATS
+
+        Returns:
+        scipy.sparse.csr_matrix: The statistic's team-versus-team matrix
+        """
+        return self.matrices[stat]
+
+    def select(self, team_ids: numpy.ndarray) -> Type["MatchupMatrices"]:
+        """
+        Restricts the matrices to a subset of teams, e.g. one season's
+
+        Args:
+        team_ids (numpy.ndarray): The teams to keep, in the order to keep
+            them in
+
+        Returns:
+        MatchupMatrices: The matrices between the selected teams
+        """
+        return MatchupMatrices({
+            stat: matrix[team_ids][:, team_ids]
+            for stat, matrix in self.matrices.items()
+        })
+
+    def get_season(
+            self, dimension: TeamDimension, season: int
+        ) -> Type["MatchupMatrices"]:
+        """
+        Restricts team-season matrices to a single season
+
+        Args:
+        dimension (TeamDimension): The dimension the matrices are indexed by
+        season (int): The season to restrict to
+
+        Returns:
+        MatchupMatrices: The season's matrices, in team id order
+        """
+        return self.select(
+            numpy.flatnonzero(dimension.get_seasons() == season)
+        )
+
+    def get_head_to_head(self, team: int, opponent: int) -> Dict[str, Any]:
+        """
+        Returns the statistics of one team against one opponent
+
+        Args:
+        team (int): The team's index
+        opponent (int): The opponent's index
+
+        Returns:
+        dict: The games, points for, points against & margin
+        """
+        head_to_head = {
+            stat: matrix[team, opponent]
+            for stat, matrix in self.matrices.items()
+        }
+        head_to_head["games"] = int(head_to_head["games"])
+        return head_to_head
+
+    def get_opponent_average(self, values: numpy.ndarray) -> numpy.ndarray:
+        """
+        Averages a value over each team's opponents, weighted by the games
+        played against each, e.g. a strength of schedule from ratings
+
+        Args:
+        values (numpy.ndarray): The value of each team, indexed like rows
+
+        Returns:
+        numpy.ndarray: The games-weighted opponent average of each team,
+            NaN for teams without games
+        """
+        games = self.matrices["games"]
+        totals = games @ numpy.asarray(values, dtype=numpy.float64)
+        counts = numpy.asarray(games.sum(axis=1)).ravel()
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return totals / counts
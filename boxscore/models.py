@@ -0,0 +1,250 @@
+import numpy
+from boxscore.bootstrap import MEAN_MODEL_DEGREE, \
+                               STD_MODEL_DEGREE, \
+                               get_norm_diffs
+from boxscore.boxscore import LabeledBoxScore
+from boxscore.regression import fit_polynomial, \
+                                evaluate_polynomial, \
+                                format_polynomial
+from boxscore.skill import SKILL_DIFF_BINS, get_skill_diff_bins
+from typing import Dict, Any, Type, Tuple, List
+
+# The sides of a game, each with its own pair of score models
+MODEL_SIDES = [ "home", "away" ]
+
+# The score models documented in the README, fit on the training split
+README_SCORE_MODELS = {
+    "games": None,
+    "home": {
+        "mean_coef": [ 10.9716991, 23.14578315 ],
+        "std_coef": [ 7.64006156, 5.72612946, -4.29283414 ]
+    },
+    "away": {
+        "mean_coef": [ 8.92113289, 22.14952374 ],
+        "std_coef": [ 6.47638621, 8.00861267, -5.589282 ]
+    }
+}
+
+class ScoreModels:
+    @staticmethod
+    def from_json(obj: Dict[str, Any]) -> Type["ScoreModels"]:
+        """
+        Loads a set of ScoreModels from their JSON-serialized coefficients
+
+        Args:
+        obj (dict): The JSON-serialized ScoreModels
+
+        Returns:
+        ScoreModels: The loaded ScoreModels
+        """
+        return ScoreModels({
+            side: (
+                numpy.array(obj[side]["mean_coef"]),
+                numpy.array(obj[side]["std_coef"])
+            )
+            for side in MODEL_SIDES
+        }, obj.get("games"))
+
+    def __init__(
+            self,
+            coefs: Dict[str, Tuple[numpy.ndarray, numpy.ndarray]],
+            games: int = None
+        ) -> Type["ScoreModels"]:
+        """
+        Constructor for the ScoreModels class, which holds the mean & std
+        score regression models of the home and away sides
+
+        Args:
+        coefs (dict): The mean & std coefficients of each side, in ascending
+            powers of the normalized skill differential
+        games (int): The number of games the models were fit on
+
+        Returns:
+        ScoreModels: The initialized ScoreModels
+        """
+        self.coefs = coefs
+        self.games = games
+
+    def predict(
+            self, norm_diffs: numpy.ndarray, away: bool = False
+        ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Predicts the mean & std score of one side at each normalized skill
+        differential
+
+        Args:
+        norm_diffs (numpy.ndarray): The normalized skill differentials
+        away (bool): Whether to predict away rather than home scores
+
+        Returns:
+        numpy.ndarray: The predicted mean scores
+        numpy.ndarray: The predicted score stds
+        """
+        mean_coef, std_coef = self.coefs["away" if away else "home"]
+        x = numpy.atleast_1d(numpy.asarray(norm_diffs, dtype=float))
+        return (
+            evaluate_polynomial(mean_coef, x),
+            evaluate_polynomial(std_coef, x)
+        )
+
+    def __str__(self) -> str:
+        """
+        Serializes the ScoreModels instance as a string
+
+        Args:
+        None
+
+        Returns:
+        str: The string-serialized ScoreModels
+        """
+        lines = [ f"Games: {self.games}" ]
+        for side in MODEL_SIDES:
+            mean_coef, std_coef = self.coefs[side]
+            lines.append(f"{side.title()} mean score model: " + \
+                format_polynomial(mean_coef))
+            lines.append(f"{side.title()} std score model: " + \
+                format_polynomial(std_coef))
+        return "\n".join(lines)
+
+    def __json__(self) -> Dict[str, Any]:
+        """
+        Serializes the ScoreModels instance as a JSON dict
+
+        Args:
+        None
+
+        Returns:
+        dict: The JSON-serialized ScoreModels
+        """
+        obj = { "games": self.games }
+        for side in MODEL_SIDES:
+            mean_coef, std_coef = self.coefs[side]
+            obj[side] = {
+                "mean_coef": mean_coef.tolist(),
+                "std_coef": std_coef.tolist()
+            }
+        return obj
+
+class ScoreModelAccumulator:
+    def __init__(self) -> Type["ScoreModelAccumulator"]:
+        """
+        Constructor for the ScoreModelAccumulator class, which accumulates
+        the count, score sum & squared score sum of each skill differential
+        bin per side. These are sufficient statistics for both score models,
+        so games can be streamed through once and then discarded.
+
+        Args:
+        None
+
+        Returns:
+        ScoreModelAccumulator: The empty ScoreModelAccumulator
+        """
+        self.moments = {
+            side: numpy.zeros((3, SKILL_DIFF_BINS)) for side in MODEL_SIDES
+        }
+
+    def add_scores(
+            self, bins: numpy.ndarray, scores: numpy.ndarray, away: bool
+        ) -> None:
+        """
+        Accumulates the scores of one side of a batch of games
+
+        Args:
+        bins (numpy.ndarray): The skill differential bin of each game
+        scores (numpy.ndarray): The score of each game
+        away (bool): Whether the scores are away rather than home scores
+
+        Returns:
+        None
+        """
+        scores = numpy.asarray(scores, dtype=float)
+        moments = self.moments["away" if away else "home"]
+        for i, values in enumerate([ None, scores, scores ** 2 ]):
+            moments[i] += numpy.bincount(
+                bins, weights=values, minlength=SKILL_DIFF_BINS
+            )
+
+    def add_columns(self, columns: Dict[str, numpy.ndarray]) -> None:
+        """
+        Accumulates both sides of a batch of labeled games from their
+        columns, e.g. as loaded by load_labeled_columns
+
+        Args:
+        columns (dict): The home_score, away_score & tier columns
+
+        Returns:
+        None
+        """
+        home_diff = get_skill_diff_bins(
+            columns["home_offense"], columns["away_defense"]
+        )
+        away_diff = get_skill_diff_bins(
+            columns["away_offense"], columns["home_defense"]
+        )
+        self.add_scores(home_diff, columns["home_score"], False)
+        self.add_scores(away_diff, columns["away_score"], True)
+
+    def add_games(self, games: List[LabeledBoxScore]) -> None:
+        """
+        Accumulates both sides of a batch of labeled games
+
+        Args:
+        games (list): The LabeledBoxScores
+
+        Returns:
+        None
+        """
+        self.add_columns(LabeledBoxScore.get_columns_static([
+            g.score_obj for g in games
+        ]))
+
+    def get_summary(
+            self, away: bool = False
+        ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the count, mean & sample std score of each bin of one side
+
+        Args:
+        away (bool): Whether to summarize away rather than home scores
+
+        Returns:
+        numpy.ndarray: The count of each bin
+        numpy.ndarray: The mean score of each bin, NaN if empty
+        numpy.ndarray: The std score of each bin, NaN below two games
+        """
+        count, total, total_sq = self.moments["away" if away else "home"]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            mean = total / count
+            std = numpy.sqrt(
+                numpy.maximum(total_sq - total * mean, 0.0) / (count - 1)
+            )
+        mean[count < 1] = numpy.nan
+        std[count < 2] = numpy.nan
+        return count, mean, std
+
+    def solve(self, weighted: bool = True) -> ScoreModels:
+        """
+        Solves the mean & std score regressions of both sides in closed form.
+        Weighting each bin's mean by its game count is equivalent to fitting
+        the mean model on every game, and each bin's std is weighted by its
+        degrees of freedom, so sparse extreme bins no longer count as much as
+        the crowded middle ones.
+
+        Args:
+        weighted (bool): Whether to weight bins by their number of games,
+            rather than equally as in the README models
+
+        Returns:
+        ScoreModels: The fitted ScoreModels
+        """
+        x = get_norm_diffs()
+        coefs = {}
+        for side in MODEL_SIDES:
+            count, mean, std = self.get_summary(side == "away")
+            mean_weights = count if weighted else None
+            std_weights = numpy.maximum(count - 1, 0) if weighted else None
+            coefs[side] = (
+                fit_polynomial(x, mean, MEAN_MODEL_DEGREE, mean_weights),
+                fit_polynomial(x, std, STD_MODEL_DEGREE, std_weights)
+            )
+        return ScoreModels(coefs, int(self.moments["home"][0].sum()))
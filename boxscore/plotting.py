@@ -0,0 +1,126 @@
+import numpy
+from boxscore.boxscore import ScoreSummary
+from typing import Dict, Any, List
+
+# Whiskers reach the furthest scores within this many IQRs of the box, as
+# in matplotlib & pandas boxplots
+WHISKER_IQRS = 1.5
+
+def get_grouped_counts(
+        groups: numpy.ndarray, scores: numpy.ndarray, n_groups: int
+    ) -> numpy.ndarray:
+    """
+    Counts the integer scores of each group with a single 2-D bincount,
+    the only pass over the raw scores a boxplot needs
+
+    Args:
+    groups (numpy.ndarray): The group index of each score, from 0
+    scores (numpy.ndarray): The scores
+    n_groups (int): The number of groups
+
+    Returns:
+    numpy.ndarray: The histogram of each group's scores, (G, S)
+    """
+    groups = numpy.asarray(groups, dtype=numpy.int64)
+    scores = numpy.asarray(scores, dtype=numpy.int64)
+    n_scores = int(scores.max()) + 1 if len(scores) > 0 else 1
+    return numpy.bincount(
+        groups * n_scores + scores, minlength=n_groups * n_scores
+    ).reshape(n_groups, n_scores)
+
+def get_box_stats(counts: numpy.ndarray, label: str) -> Dict[str, Any]:
+    """
+    Computes the statistics matplotlib's bxp draws a box from, using a
+    histogram of integer scores rather than the scores themselves. Each
+    distinct outlying score is drawn once.
+
+    Args:
+    counts (numpy.ndarray): The number of times each score occurred,
+        indexed by score
+    label (str): The box's label
+
+    Returns:
+    dict: The box's label, mean, median, quartiles, whiskers & fliers
+    """
+    summary = ScoreSummary.from_counts(counts)
+    observed = numpy.flatnonzero(counts)
+    iqr = summary.q75 - summary.q25
+    low = observed[observed >= summary.q25 - WHISKER_IQRS * iqr]
+    high = observed[observed <= summary.q75 + WHISKER_IQRS * iqr]
+    whislo = float(low.min()) if len(low) > 0 else summary.q25
+    whishi = float(high.max()) if len(high) > 0 else summary.q75
+    return {
+        "label": label,
+        "mean": summary.mean,
+        "med": summary.q50,
+        "q1": summary.q25,
+        "q3": summary.q75,
+        "whislo": whislo,
+        "whishi": whishi,
+        "fliers": observed[(observed < whislo) | (observed > whishi)]
+    }
+
+def plot_box_counts(
+        ax: Any, counts: numpy.ndarray, labels: List[str]
+    ) -> Any:
+    """
+    Draws one box per histogram with matplotlib's bxp, so that drawing costs
+    the same however many scores were counted
+
+    Args:
+    ax (matplotlib.axes.Axes): The axes to draw on
+    counts (numpy.ndarray): The histogram of each box's scores, (G, S)
+    labels (list): The label of each box
+
+    Returns:
+    dict: The drawn artists, as returned by bxp
+    """
+    stats = [
+        get_box_stats(row, label)
+        for row, label in zip(counts, labels) if row.sum() > 0
+    ]
+    return ax.bxp(stats)
+
+def plot_scatter(
+        ax: Any,
+        x: numpy.ndarray,
+        y: numpy.ndarray,
+        c: numpy.ndarray = None,
+        max_points: int = None,
+        hexbin: bool = False,
+        gridsize: int = 40,
+        seed: int = 0
+    ) -> Any:
+    """
+    Draws a scatter which stays cheap over dense inputs, either as a hexbin
+    of the point density, colored by the median color value of each hexagon
+    if colors are given, or as a random subset of at most max_points points
+
+    Args:
+    ax (matplotlib.axes.Axes): The axes to draw on
+    x (numpy.ndarray): The x coordinates
+    y (numpy.ndarray): The y coordinates
+    c (numpy.ndarray): The color value of each point, if any
+    max_points (int): The most points to draw, or None to draw them all
+    hexbin (bool): Whether to draw a hexbin rather than points
+    gridsize (int): The number of hexagons across the x axis
+    seed (int): The random seed of the decimation
+
+    Returns:
+    matplotlib.collections.Collection: The drawn collection
+    """
+    x, y = numpy.asarray(x), numpy.asarray(y)
+    c = None if c is None else numpy.asarray(c)
+    if hexbin:
+        if c is None:
+            return ax.hexbin(x, y, gridsize=gridsize, mincnt=1)
+        return ax.hexbin(
+            x, y, C=c, gridsize=gridsize, reduce_C_function=numpy.median
+        )
+    if max_points is not None and len(x) > max_points:
+        keep = numpy.sort(numpy.random.default_rng(seed).choice(
+            len(x), max_points, replace=False
+        ))
+        x, y = x[keep], y[keep]
+        c = None if c is None else c[keep]
+    return ax.scatter(x, y, c=c)
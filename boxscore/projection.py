@@ -0,0 +1,349 @@
+import numpy
+from boxscore.boxscore import BoxScoreList
+from boxscore.models import ScoreModels
+from boxscore.shared import SharedDataset
+from boxscore.skill import get_skill_diff_bins, normalize_skill_diffs
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Type, List
+
+# The tier assumed for teams without a labeled rating
+DEFAULT_TIER = 3
+
+def get_tier_norm_diffs(offense: numpy.ndarray, defense: numpy.ndarray):
+    """
+    Normalizes offense-defense tier differentials onto [0, 1], as the score
+    models expect
+
+    Args:
+    offense (numpy.ndarray): The offense tiers
+    defense (numpy.ndarray): The opposing defense tiers
+
+    Returns:
+    numpy.ndarray: The normalized skill differentials
+    """
+    return normalize_skill_diffs(get_skill_diff_bins(offense, defense))
+
+def simulate_replicates(
+        schedule: Dict[str, numpy.ndarray],
+        n_teams: int,
+        max_wins: int,
+        n_replicates: int,
+        seed: numpy.random.SeedSequence
+    ) -> Dict[str, numpy.ndarray]:
+    """
+    Simulates the remaining games across a batch of replicates at once,
+    drawing every game's scores from its normal score models in one pass,
+    and tallies the resulting win totals & finishing positions
+
+    Args:
+    schedule (dict): The remaining games' home & away team indices, score
+        means & stds, and each team's current wins & standings points
+    n_teams (int): The number of teams
+    max_wins (int): The most wins any team can finish with
+    n_replicates (int): The number of replicates to simulate
+    seed (numpy.random.SeedSequence): The seed for this batch
+
+    Returns:
+    dict: The counts of each team's win totals & finishing positions
+    """
+    rng = numpy.random.default_rng(seed)
+    n_games = len(schedule["home"])
+    shape = (n_replicates, n_games)
+    home_scores = numpy.maximum(numpy.rint(rng.normal(
+        schedule["home_mean"], schedule["home_std"], shape
+    )), 0)
+    away_scores = numpy.maximum(numpy.rint(rng.normal(
+        schedule["away_mean"], schedule["away_std"], shape
+    )), 0)
+
+    # Scatter each game's result onto its teams, as wins & standings points
+    home_wins = (home_scores > away_scores).astype(numpy.int32)
+    away_wins = (away_scores > home_scores).astype(numpy.int32)
+    ties = 1 - home_wins - away_wins
+    home_onehot = numpy.zeros((n_games, n_teams), dtype=numpy.int32)
+    away_onehot = numpy.zeros((n_games, n_teams), dtype=numpy.int32)
+    home_onehot[numpy.arange(n_games), schedule["home"]] = 1
+    away_onehot[numpy.arange(n_games), schedule["away"]] = 1
+    new_wins = home_wins @ home_onehot + away_wins @ away_onehot
+    wins = schedule["wins"] + new_wins
+    points = schedule["points"] + 2 * new_wins + \
+        ties @ (home_onehot + away_onehot)
+
+    # Rank teams by standings points, breaking ties at random
+    order = numpy.argsort(-(points + rng.random(points.shape)), axis=1)
+    positions = numpy.argsort(order, axis=1)
+    teams = numpy.arange(n_teams)
+    return {
+        "wins": numpy.bincount(
+            (teams * (max_wins + 1) + wins).ravel(),
+            minlength=n_teams * (max_wins + 1)
+        ).reshape(n_teams, max_wins + 1),
+        "positions": numpy.bincount(
+            (teams * n_teams + positions).ravel(),
+            minlength=n_teams * n_teams
+        ).reshape(n_teams, n_teams)
+    }
+
+def simulate_shared_replicates(
+        handle: Dict[str, Any],
+        n_teams: int,
+        max_wins: int,
+        n_replicates: int,
+        seed: numpy.random.SeedSequence
+    ) -> Dict[str, numpy.ndarray]:
+    """
+    Simulates a batch of replicates over a schedule published in a shared
+    dataset, so that workers read the schedule in place
+
+    Args:
+    handle (dict): The handle of the shared schedule
+    n_teams (int): The number of teams
+    max_wins (int): The most wins any team can finish with
+    n_replicates (int): The number of replicates to simulate
+    seed (numpy.random.SeedSequence): The seed for this batch
+
+    Returns:
+    dict: The counts of each team's win totals & finishing positions
+    """
+    return simulate_replicates(
+        SharedDataset.attach(handle), n_teams, max_wins, n_replicates, seed
+    )
+
+class SeasonProjection:
+    @staticmethod
+    def get_tiers(labeled: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+        """
+        Returns each team's most recent offense & defense tiers from a
+        season of labeled box scores
+
+        Args:
+        labeled (list): The labeled box score dicts, in date order
+
+        Returns:
+        dict: The [offense, defense] tiers of each team
+        """
+        tiers = {}
+        for score in labeled:
+            tiers[score["home_team"]] = [
+                score["home_offense"], score["home_defense"]
+            ]
+            tiers[score["away_team"]] = [
+                score["away_offense"], score["away_defense"]
+            ]
+        return tiers
+
+    def __init__(
+            self,
+            played: BoxScoreList,
+            remaining: List[Dict[str, Any]],
+            tiers: Dict[str, List[int]],
+            models: ScoreModels
+        ) -> Type["SeasonProjection"]:
+        """
+        Constructor for the SeasonProjection class, which tallies the played
+        games' standings and prepares the score distribution of each
+        remaining game
+
+        Args:
+        played (BoxScoreList): The season's played games
+        remaining (list): The remaining games' dicts, each with a home_team
+            and an away_team
+        tiers (dict): The [offense, defense] tiers of each team, teams
+            without one assumed average
+        models (ScoreModels): The mean & std score models
+
+        Returns:
+        SeasonProjection: The prepared SeasonProjection
+        """
+        columns = played.get_columns()
+        self.teams = sorted(
+            set(played.teams.tolist()) | \
+            set(game["home_team"] for game in remaining) | \
+            set(game["away_team"] for game in remaining)
+        )
+        team_index = { team: i for i, team in enumerate(self.teams) }
+
+        # Tally the played games' wins & standings points per team
+        n_teams = len(self.teams)
+        played_ids = numpy.array([
+            team_index[team] for team in played.teams
+        ], dtype=numpy.int64)
+        home = played_ids[columns["home_id"]]
+        away = played_ids[columns["away_id"]]
+        margin = columns["home_score"] - columns["away_score"]
+        self.wins = numpy.bincount(home, margin > 0, n_teams) + \
+            numpy.bincount(away, margin < 0, n_teams)
+        self.ties = numpy.bincount(home, margin == 0, n_teams) + \
+            numpy.bincount(away, margin == 0, n_teams)
+        self.losses = numpy.bincount(home, margin < 0, n_teams) + \
+            numpy.bincount(away, margin > 0, n_teams)
+        self.wins = self.wins.astype(numpy.int32)
+        self.ties = self.ties.astype(numpy.int32)
+        self.losses = self.losses.astype(numpy.int32)
+
+        # Model the score distribution of each remaining game
+        offense, defense = numpy.array([
+            tiers.get(team, [ DEFAULT_TIER, DEFAULT_TIER ])
+            for team in self.teams
+        ]).T
+        self.home = numpy.array([
+            team_index[game["home_team"]] for game in remaining
+        ], dtype=numpy.int64)
+        self.away = numpy.array([
+            team_index[game["away_team"]] for game in remaining
+        ], dtype=numpy.int64)
+        self.home_mean, self.home_std = models.predict(
+            get_tier_norm_diffs(offense[self.home], defense[self.away])
+        )
+        self.away_mean, self.away_std = models.predict(
+            get_tier_norm_diffs(offense[self.away], defense[self.home]),
+            away=True
+        )
+        self.home_std = numpy.maximum(self.home_std, 0.0)
+        self.away_std = numpy.maximum(self.away_std, 0.0)
+        self.remaining = numpy.bincount(self.home, minlength=n_teams) + \
+            numpy.bincount(self.away, minlength=n_teams)
+
+    def get_schedule(self) -> Dict[str, Any]:
+        """
+        Returns the arrays a simulation batch needs
+
+        Args:
+        None
+
+        Returns:
+        dict: The remaining games & the current standings
+        """
+        return {
+            "home": self.home,
+            "away": self.away,
+            "home_mean": self.home_mean,
+            "home_std": self.home_std,
+            "away_mean": self.away_mean,
+            "away_std": self.away_std,
+            "wins": self.wins,
+            "points": 2 * self.wins + self.ties
+        }
+
+    def simulate(
+            self,
+            n_replicates: int = 20000,
+            n_workers: int = None,
+            seed: int = 0,
+            chunk_size: int = 2000
+        ) -> Type["ProjectionResult"]:
+        """
+        Simulates the rest of the season many times, spreading batches of
+        replicates across a process pool
+
+        Args:
+        n_replicates (int): The number of replicates to simulate
+        n_workers (int): The number of worker processes, defaults to the CPUs
+        seed (int): The random seed
+        chunk_size (int): The number of replicates per batch
+
+        Returns:
+        ProjectionResult: The win total & finishing position distributions
+        """
+        if n_replicates < 1:
+            raise ValueError(
+                f"Projecting requires at least 1 replicate, got {n_replicates}"
+            )
+        sizes = [ chunk_size ] * (n_replicates // chunk_size)
+        if n_replicates % chunk_size:
+            sizes.append(n_replicates % chunk_size)
+        seeds = numpy.random.SeedSequence(seed).spawn(len(sizes))
+        n_teams = len(self.teams)
+        max_wins = int((self.wins + self.remaining).max())
+        with SharedDataset(self.get_schedule()) as schedule, \
+                ProcessPoolExecutor(max_workers=n_workers) as executor:
+            batches = list(executor.map(
+                simulate_shared_replicates,
+                [ schedule.get_handle() ] * len(sizes),
+                [ n_teams ] * len(sizes),
+                [ max_wins ] * len(sizes),
+                sizes,
+                seeds
+            ))
+        return ProjectionResult(
+            self,
+            sum(batch["wins"] for batch in batches),
+            sum(batch["positions"] for batch in batches),
+            n_replicates
+        )
+
+class ProjectionResult:
+    def __init__(
+            self,
+            projection: SeasonProjection,
+            wins: numpy.ndarray,
+            positions: numpy.ndarray,
+            n_replicates: int
+        ) -> Type["ProjectionResult"]:
+        """
+        Constructor for the ProjectionResult class
+
+        Args:
+        projection (SeasonProjection): The simulated projection
+        wins (numpy.ndarray): The count of each team's win totals
+        positions (numpy.ndarray): The count of each team's finishing
+            positions, from first onward
+        n_replicates (int): The number of replicates simulated
+
+        Returns:
+        ProjectionResult: The initialized ProjectionResult
+        """
+        self.projection = projection
+        self.wins = wins / n_replicates
+        self.positions = positions / n_replicates
+        self.n_replicates = n_replicates
+
+    def get_rows(self, top: int = 7) -> List[Dict[str, Any]]:
+        """
+        Summarizes each team's projection, best expected record first
+
+        Args:
+        top (int): The number of leading finishing positions to total
+
+        Returns:
+        list: The record, expected wins & standings probabilities per team
+        """
+        projection = self.projection
+        expected = self.wins @ numpy.arange(self.wins.shape[1])
+        rows = [
+            {
+                "team": team,
+                "record": f"{projection.wins[i]}-{projection.losses[i]}" + \
+                    (f"-{projection.ties[i]}" if projection.ties[i] else ""),
+                "remaining": int(projection.remaining[i]),
+                "expected_wins": float(expected[i]),
+                "first": float(self.positions[i, 0]),
+                f"top_{top}": float(self.positions[i, :top].sum())
+            }
+            for i, team in enumerate(projection.teams)
+        ]
+        return sorted(rows, key=lambda row: -row["expected_wins"])
+
+    def __json__(self) -> Dict[str, Any]:
+        """
+        Serializes the ProjectionResult instance as a JSON dict
+
+        Args:
+        None
+
+        Returns:
+        dict: The JSON-serialized ProjectionResult
+        """
+        return {
+            "replicates": self.n_replicates,
+            "teams": {
+                team: {
+                    "wins": {
+                        str(w): float(p)
+                        for w, p in enumerate(self.wins[i]) if p > 0
+                    },
+                    "positions": self.positions[i].tolist()
+                }
+                for i, team in enumerate(self.projection.teams)
+            }
+        }
@@ -0,0 +1,242 @@
+import numpy
+from boxscore.table import GameTable
+from boxscore.team import TeamDimension
+from typing import Dict, Any, Type, Tuple, List
+
+# The rating deviations, in points per game, separating tiers 1 through 5
+RATING_TIER_CUTS = [-4.0, -1.5, 1.5, 4.0]
+
+# The tier of a team without a usable rating
+NEUTRAL_RATING_TIER = 3
+
+# The league average score & home advantage adapt more slowly than teams
+LEAGUE_RATE_SCALE = 0.05
+
+def get_rating_tiers(ratings: numpy.ndarray) -> numpy.ndarray:
+    """
+    Buckets ratings into the 1-5 tiers used to label box scores, where a
+    higher tier is always a better unit. Non-finite ratings, e.g. NaN, get
+    the neutral tier rather than digitize's top one.
+
+    Args:
+    ratings (numpy.ndarray): The offense or defense ratings
+
+    Returns:
+    numpy.ndarray: The tier of each rating
+    """
+    tiers = numpy.digitize(ratings, RATING_TIER_CUTS) + 1
+    return numpy.where(numpy.isfinite(ratings), tiers, NEUTRAL_RATING_TIER)
+
+class RatingEngine:
+    @staticmethod
+    def from_json(obj: Dict[str, Any]) -> Type["RatingEngine"]:
+        """
+        Loads a RatingEngine from its JSON-serialized state
+
+        Args:
+        obj (dict): The JSON-serialized RatingEngine
+
+        Returns:
+        RatingEngine: The loaded RatingEngine
+        """
+        engine = RatingEngine(
+            k=obj["k"],
+            carryover=obj["carryover"],
+            mean_score=obj["mean_score"],
+            home_advantage=obj["home_advantage"]
+        )
+        engine.last_date = numpy.datetime64(obj["last_date"], "D") \
+            if obj["last_date"] is not None else None
+        engine.last_games = set(obj["last_games"]) \
+            if "last_games" in obj else None
+        engine.ratings = {
+            franchise: [ r["offense"], r["defense"], r["season"] ]
+            for franchise, r in obj["ratings"].items()
+        }
+        return engine
+
+    def __init__(
+            self,
+            k: float = 0.06,
+            carryover: float = 0.6,
+            mean_score: float = 20.0,
+            home_advantage: float = 2.5
+        ) -> Type["RatingEngine"]:
+        """
+        Constructor for the RatingEngine class, which maintains exponentially
+        weighted offense & defense ratings per franchise, in points per game
+        relative to the league average, updated one game at a time
+
+        Args:
+        k (float): The weight of each game's scoring surprise
+        carryover (float): The share of a rating kept into the next season
+        mean_score (float): The initial league average score
+        home_advantage (float): The initial home scoring advantage
+
+        Returns:
+        RatingEngine: The initialized RatingEngine
+        """
+        self.k = k
+        self.carryover = carryover
+        self.mean_score = mean_score
+        self.home_advantage = home_advantage
+        self.last_date = None
+        self.last_games = set()
+        self.ratings = {}
+
+    def get_ratings(self, franchise: str, season: int) -> List[float]:
+        """
+        Returns a franchise's mutable [offense, defense, season] state as of
+        a season, regressing it toward the mean when a new season starts
+
+        Args:
+        franchise (str): The franchise name
+        season (int): The season of the game being processed
+
+        Returns:
+        list: The franchise's offense, defense, and last season
+        """
+        state = self.ratings.get(franchise)
+        if state is None:
+            state = [ 0.0, 0.0, season ]
+            self.ratings[franchise] = state
+        elif state[2] != season:
+            state[0] *= self.carryover
+            state[1] *= self.carryover
+            state[2] = season
+        return state
+
+    def process_game(
+            self,
+            season: int,
+            home: str,
+            away: str,
+            home_score: int,
+            away_score: int
+        ) -> Tuple[float, float, float, float]:
+        """
+        Updates the ratings with one game's result, returning the ratings
+        each team held before the game
+
+        Args:
+        season (int): The season the game occurred in
+        home (str): The home franchise
+        away (str): The away franchise
+        home_score (int): The home team score
+        away_score (int): The away team score
+
+        Returns:
+        float: The home offense rating before the game
+        float: The home defense rating before the game
+        float: The away offense rating before the game
+        float: The away defense rating before the game
+        """
+        h = self.get_ratings(home, season)
+        a = self.get_ratings(away, season)
+        pre_game = (h[0], h[1], a[0], a[1])
+
+        # Compare the result with the expected score of each side
+        half_advantage = self.home_advantage / 2.0
+        home_error = home_score - \
+            (self.mean_score + half_advantage + h[0] - a[1])
+        away_error = away_score - \
+            (self.mean_score - half_advantage + a[0] - h[1])
+
+        # Share each surprise between the offense and the opposing defense
+        h[0] += self.k * home_error
+        a[1] -= self.k * home_error
+        a[0] += self.k * away_error
+        h[1] -= self.k * away_error
+        league_k = self.k * LEAGUE_RATE_SCALE
+        self.mean_score += league_k * (home_error + away_error)
+        self.home_advantage += league_k * (home_error - away_error)
+        return pre_game
+
+    def is_processed(self, date: numpy.datetime64, key: str) -> bool:
+        """
+        Returns whether a game was already processed. Games are processed in
+        date order, so only the keys of those on the last date are kept, or
+        None if unknown, in which case every game on that date was.
+
+        Args:
+        date (numpy.datetime64): The date of the game
+        key (str): The game's home & away franchises, e.g. "Bears|Packers"
+
+        Returns:
+        bool: Whether the game was already processed
+        """
+        if self.last_date is None or date > self.last_date:
+            return False
+        if date < self.last_date or self.last_games is None:
+            return True
+        return key in self.last_games
+
+    def process_table(
+            self, table: GameTable, dimension: TeamDimension
+        ) -> numpy.ndarray:
+        """
+        Streams the games of a table through the engine in date order,
+        skipping any already processed, including those on the same date as
+        the last processed game
+
+        Args:
+        table (GameTable): The games to process
+        dimension (TeamDimension): The dimension the table's teams belong to
+
+        Returns:
+        numpy.ndarray: The pre-game home offense, home defense, away offense
+            & away defense ratings of each game in table order, NaN for games
+            skipped as already processed
+        """
+        franchise_ids = dimension.get_franchise_ids()
+        home = franchise_ids[table["home_id"]]
+        away = franchise_ids[table["away_id"]]
+        ratings = numpy.full((len(table), 4), numpy.nan)
+        for i in table.get_date_index().order:
+            date = table["date"][i]
+            home_team = dimension.franchises[home[i]]
+            away_team = dimension.franchises[away[i]]
+            key = f"{home_team}|{away_team}"
+            if self.is_processed(date, key):
+                continue
+            ratings[i] = self.process_game(
+                int(table["season"][i]),
+                home_team,
+                away_team,
+                int(table["home_score"][i]),
+                int(table["away_score"][i])
+            )
+            if self.last_date is None or date > self.last_date:
+                self.last_date = date
+                self.last_games = set()
+            self.last_games.add(key)
+        return ratings
+
+    def __json__(self) -> Dict[str, Any]:
+        """
+        Serializes the RatingEngine state as a JSON dict
+
+        Args:
+        None
+
+        Returns:
+        dict: The JSON-serialized RatingEngine
+        """
+        return {
+            "k": self.k,
+            "carryover": self.carryover,
+            "mean_score": self.mean_score,
+            "home_advantage": self.home_advantage,
+            "last_date": str(self.last_date) \
+                if self.last_date is not None else None,
+            "last_games": sorted(self.last_games) \
+                if self.last_games is not None else None,
+            "ratings": {
+                franchise: {
+                    "offense": state[0],
+                    "defense": state[1],
+                    "season": state[2]
+                }
+                for franchise, state in self.ratings.items()
+            }
+        }
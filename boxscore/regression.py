@@ -0,0 +1,88 @@
+import numpy
+
+def get_design_matrix(x: numpy.ndarray, degree: int) -> numpy.ndarray:
+    """
+    Returns the polynomial design matrix of a set of inputs, with columns
+    in ascending powers starting from the intercept
+
+    Args:
+    x (numpy.ndarray): The inputs
+    degree (int): The polynomial degree
+
+    Returns:
+    numpy.ndarray: The design matrix, one row per input
+    """
+    return numpy.vander(
+        numpy.asarray(x, dtype=float), degree + 1, increasing=True
+    )
+
+def fit_polynomial(
+        x: numpy.ndarray,
+        y: numpy.ndarray,
+        degree: int,
+        weights: numpy.ndarray = None
+    ) -> numpy.ndarray:
+    """
+    Fits weighted least-squares polynomials in closed form. The targets and
+    weights may carry leading batch dimensions, in which case one polynomial
+    is fit per batch over the shared inputs.
+
+    Args:
+    x (numpy.ndarray): The inputs, shape (n,)
+    y (numpy.ndarray): The targets, shape (..., n)
+    degree (int): The polynomial degree
+    weights (numpy.ndarray): The weight of each target, shape (..., n)
+
+    Returns:
+    numpy.ndarray: The coefficients in ascending powers, shape (..., p)
+    """
+    design = get_design_matrix(x, degree)
+    y = numpy.asarray(y, dtype=float)
+    if weights is None:
+        weights = numpy.ones_like(y)
+    weights = numpy.where(numpy.isfinite(y), weights, 0.0)
+    y = numpy.where(numpy.isfinite(y), y, 0.0)
+
+    # Solve the normal equations (X^T W X) b = X^T W y for every batch
+    xtwx = numpy.einsum("ni,...n,nj->...ij", design, weights, design)
+    xtwy = numpy.einsum("ni,...n->...i", design, weights * y)
+    return numpy.linalg.solve(xtwx, xtwy[..., None])[..., 0]
+
+def evaluate_polynomial(
+        coef: numpy.ndarray, x: numpy.ndarray
+    ) -> numpy.ndarray:
+    """
+    Evaluates polynomials with coefficients in ascending powers
+
+    Args:
+    coef (numpy.ndarray): The coefficients, shape (..., p)
+    x (numpy.ndarray): The inputs, shape (n,)
+
+    Returns:
+    numpy.ndarray: The evaluated polynomials, shape (..., n)
+    """
+    design = get_design_matrix(x, coef.shape[-1] - 1)
+    return numpy.einsum("ni,...i->...n", design, coef)
+
+def format_polynomial(
+        coef: numpy.ndarray, variable: str = "skill_diff"
+    ) -> str:
+    """
+    Formats polynomial coefficients in the expanded form used in the README
+
+    Args:
+    coef (numpy.ndarray): The coefficients in ascending powers
+    variable (str): The name of the input variable
+
+    Returns:
+    str: The formatted polynomial
+    """
+    terms = []
+    for power, c in enumerate(coef):
+        if power == 0:
+            terms.append(f"{c:.8f}")
+        elif power == 1:
+            terms.append(f"{c:.8f} {variable}")
+        else:
+            terms.append(f"{c:.8f} {variable}^{power}")
+    return " + ".join(terms).replace("+ -", "- ")
@@ -0,0 +1,212 @@
+import numpy
+from boxscore.skill import SKILL_DIFF_BINS, \
+                           get_joint_score_counts, \
+                           get_pair_index, \
+                           get_skill_diff_bins
+from typing import Dict, Any, Type, Tuple, List
+
+class AliasTable:
+    def __init__(self, pmfs: numpy.ndarray) -> Type["AliasTable"]:
+        """
+        Constructor for the AliasTable class, which compiles a batch of
+        discrete distributions over the same outcomes into Walker alias
+        tables, so that each draw costs O(1) regardless of the outcomes
+
+        Args:
+        pmfs (numpy.ndarray): One unnormalized distribution per row, (B, K)
+
+        Returns:
+        AliasTable: The compiled AliasTable
+        """
+        pmfs = numpy.atleast_2d(numpy.asarray(pmfs, dtype=float))
+        n_rows, n_outcomes = pmfs.shape
+        self.prob = numpy.ones((n_rows, n_outcomes))
+        self.alias = numpy.tile(
+            numpy.arange(n_outcomes, dtype=numpy.int32), (n_rows, 1)
+        )
+        for row in range(n_rows):
+            self.build_row(row, pmfs[row])
+
+    def build_row(self, row: int, pmf: numpy.ndarray) -> None:
+        """
+        Builds the alias table of one distribution with Vose's method
+
+        Args:
+        row (int): The row of the table to build
+        pmf (numpy.ndarray): The unnormalized distribution
+
+        Returns:
+        None
+        """
+        total = pmf.sum()
+        if total <= 0:
+            raise Exception(f"Distribution {row} has no mass")
+        scaled = pmf * (len(pmf) / total)
+        small = list(numpy.flatnonzero(scaled < 1.0))
+        large = list(numpy.flatnonzero(scaled >= 1.0))
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[row, less] = scaled[less]
+            self.alias[row, less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Whatever remains is 1 up to floating point error
+        for index in small + large:
+            self.prob[row, index] = 1.0
+
+    def sample(
+            self, rows: numpy.ndarray, rng: numpy.random.Generator
+        ) -> numpy.ndarray:
+        """
+        Draws one outcome from each of the given rows' distributions
+
+        Args:
+        rows (numpy.ndarray): The distribution to draw from, per draw
+        rng (numpy.random.Generator): The random generator
+
+        Returns:
+        numpy.ndarray: The drawn outcome indices
+        """
+        rows = numpy.asarray(rows)
+        n_outcomes = self.prob.shape[1]
+        u = rng.random(rows.shape) * n_outcomes
+        column = numpy.minimum(u.astype(numpy.int64), n_outcomes - 1)
+        keep = (u - column) < self.prob[rows, column]
+        return numpy.where(keep, column, self.alias[rows, column])
+
+def get_skill_diffs(
+        games: List[Dict[str, Any]]
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Returns the home and away offense-defense skill differential bins of
+    each labeled game
+
+    Args:
+    games (list): The labeled box score dicts
+
+    Returns:
+    numpy.ndarray: The home offense versus away defense bin of each game
+    numpy.ndarray: The away offense versus home defense bin of each game
+    """
+    home = get_skill_diff_bins(
+        [ g["home_offense"] for g in games ],
+        [ g["away_defense"] for g in games ]
+    )
+    away = get_skill_diff_bins(
+        [ g["away_offense"] for g in games ],
+        [ g["home_defense"] for g in games ]
+    )
+    return home, away
+
+class ScoreSampler:
+    @staticmethod
+    def from_games(
+            games: List[Dict[str, Any]], joint: bool = False
+        ) -> Type["ScoreSampler"]:
+        """
+        Builds a sampler from the empirical score distributions of labeled
+        games, per skill differential and home/away side. Bins with no games
+        fall back onto that side's distribution over every differential.
+
+        Args:
+        games (list): The labeled box score dicts
+        joint (bool): Whether to also build joint home/away distributions per
+            pair of home & away skill differentials
+
+        Returns:
+        ScoreSampler: The compiled sampler
+        """
+        home_diff, away_diff = get_skill_diffs(games)
+        home_score = numpy.array([ g["home_score"] for g in games ])
+        away_score = numpy.array([ g["away_score"] for g in games ])
+        n_scores = int(max(home_score.max(), away_score.max())) + 1
+
+        # Count each side's scores per differential
+        pmfs = []
+        for diff, score in [(home_diff, home_score), (away_diff, away_score)]:
+            counts = numpy.zeros((SKILL_DIFF_BINS, n_scores))
+            numpy.add.at(counts, (diff, score), 1)
+            counts[counts.sum(axis=1) == 0] = counts.sum(axis=0)
+            pmfs.append(counts)
+        sampler = ScoreSampler(n_scores, numpy.vstack(pmfs))
+
+        # Count the joint scores per pair of differentials
+        if joint:
+            counts = get_joint_score_counts(
+                home_diff, away_diff, home_score, away_score, n_scores
+            ).reshape(-1, n_scores ** 2)
+            counts[counts.sum(axis=1) == 0] = counts.sum(axis=0)
+            sampler.joint = AliasTable(counts)
+        return sampler
+
+    def __init__(
+            self, n_scores: int, pmfs: numpy.ndarray
+        ) -> Type["ScoreSampler"]:
+        """
+        Constructor for the ScoreSampler class
+
+        Args:
+        n_scores (int): The number of distinct scores, from 0 upward
+        pmfs (numpy.ndarray): The home score distributions per differential
+            followed by the away score distributions per differential
+
+        Returns:
+        ScoreSampler: The compiled ScoreSampler
+        """
+        self.n_scores = n_scores
+        self.marginal = AliasTable(pmfs)
+        self.joint = None
+
+    def sample_scores(
+            self,
+            diffs: numpy.ndarray,
+            away: bool,
+            rng: numpy.random.Generator
+        ) -> numpy.ndarray:
+        """
+        Draws one side's score for each skill differential bin
+
+        Args:
+        diffs (numpy.ndarray): The skill differential bin of each draw
+        away (bool): Whether to draw away rather than home scores
+        rng (numpy.random.Generator): The random generator
+
+        Returns:
+        numpy.ndarray: The drawn scores
+        """
+        rows = numpy.asarray(diffs) + (SKILL_DIFF_BINS if away else 0)
+        return self.marginal.sample(rows, rng)
+
+    def sample_box_scores(
+            self,
+            home_diffs: numpy.ndarray,
+            away_diffs: numpy.ndarray,
+            rng: numpy.random.Generator
+        ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Draws home & away scores for each pair of skill differential bins,
+        jointly if the joint distributions were built
+
+        Args:
+        home_diffs (numpy.ndarray): The home offense versus away defense bins
+        away_diffs (numpy.ndarray): The away offense versus home defense bins
+        rng (numpy.random.Generator): The random generator
+
+        Returns:
+        numpy.ndarray: The drawn home scores
+        numpy.ndarray: The drawn away scores
+        """
+        if self.joint is None:
+            return (
+                self.sample_scores(home_diffs, False, rng),
+                self.sample_scores(away_diffs, True, rng)
+            )
+        outcomes = self.joint.sample(
+            get_pair_index(home_diffs, away_diffs), rng
+        )
+        return outcomes // self.n_scores, outcomes % self.n_scores
@@ -0,0 +1,216 @@
+import numpy
+from boxscore.table import GameTable
+from multiprocessing import shared_memory
+from typing import Dict, Any, Type
+
+# Columns are aligned to this many bytes within the shared buffer
+SHARED_ALIGNMENT = 64
+
+# Segments already attached by this process, keyed by name or path
+attached_segments = {}
+
+def get_layout(columns: Dict[str, numpy.ndarray]) -> Dict[str, Any]:
+    """
+    Lays out a set of columns back to back in a single buffer
+
+    Args:
+    columns (dict): The mapping of column names to arrays
+
+    Returns:
+    dict: The offset, shape & dtype of each column, and the buffer size
+    """
+    layout = {}
+    offset = 0
+    for name, values in columns.items():
+        layout[name] = {
+            "offset": offset,
+            "shape": list(values.shape),
+            "dtype": values.dtype.str
+        }
+        offset += values.nbytes
+        offset += -offset % SHARED_ALIGNMENT
+    return { "columns": layout, "size": max(offset, 1) }
+
+def get_views(
+        buffer: Any, layout: Dict[str, Any]
+    ) -> Dict[str, numpy.ndarray]:
+    """
+    Returns read-only array views onto each column of a shared buffer
+
+    Args:
+    buffer (Any): The shared memory buffer or memory map
+    layout (dict): The layout of the columns in the buffer
+
+    Returns:
+    dict: The mapping of column names to read-only arrays
+    """
+    views = {}
+    for name, column in layout["columns"].items():
+        view = numpy.ndarray(
+            tuple(column["shape"]),
+            dtype=numpy.dtype(column["dtype"]),
+            buffer=buffer,
+            offset=column["offset"]
+        )
+        view.flags.writeable = False
+        views[name] = view
+    return views
+
+class SharedDataset:
+    @staticmethod
+    def attach(handle: Dict[str, Any]) -> Dict[str, numpy.ndarray]:
+        """
+        Attaches to a published dataset from any process, without copying.
+        Segments stay attached for the life of the process, so repeated
+        tasks on a pool worker only attach once.
+
+        Args:
+        handle (dict): The handle returned by SharedDataset.get_handle
+
+        Returns:
+        dict: The mapping of column names to read-only arrays
+        """
+        key = handle.get("name") or handle.get("path")
+        segment = attached_segments.get(key)
+        if segment is None:
+            if handle.get("name") is not None:
+                segment = shared_memory.SharedMemory(name=handle["name"])
+                buffer = segment.buf
+            else:
+                buffer = numpy.memmap(handle["path"], mode="r")
+                segment = buffer
+            attached_segments[key] = segment
+        buffer = segment.buf \
+            if isinstance(segment, shared_memory.SharedMemory) else segment
+        return get_views(buffer, handle["layout"])
+
+    @staticmethod
+    def attach_table(handle: Dict[str, Any]) -> GameTable:
+        """
+        Attaches to a published game table without copying its columns
+
+        Args:
+        handle (dict): The handle returned by SharedDataset.get_handle
+
+        Returns:
+        GameTable: The game table backed by the shared columns
+        """
+        return GameTable(SharedDataset.attach(handle))
+
+    def __init__(
+            self, columns: Dict[str, numpy.ndarray], path: str = None
+        ) -> Type["SharedDataset"]:
+        """
+        Constructor for the SharedDataset class, which publishes a set of
+        columns into one shared memory block, or into a memory-mapped file
+        if a path is given, so that worker processes can read them in place
+
+        Args:
+        columns (dict): The mapping of column names to arrays
+        path (str): The file to memory-map instead of using shared memory
+
+        Returns:
+        SharedDataset: The published SharedDataset
+        """
+        columns = {
+            name: numpy.ascontiguousarray(values)
+            for name, values in columns.items()
+        }
+        self.layout = get_layout(columns)
+        self.path = path
+        self.segment = None
+        if path is None:
+            self.segment = shared_memory.SharedMemory(
+                create=True, size=self.layout["size"]
+            )
+            buffer = self.segment.buf
+        else:
+            buffer = numpy.memmap(
+                path, dtype=numpy.uint8, mode="w+", shape=self.layout["size"]
+            )
+        for name, column in self.layout["columns"].items():
+            values = columns[name]
+            target = numpy.ndarray(
+                values.shape,
+                dtype=values.dtype,
+                buffer=buffer,
+                offset=column["offset"]
+            )
+            target[...] = values
+            del target
+        if path is not None:
+            buffer.flush()
+            del buffer
+
+    @staticmethod
+    def from_table(
+            table: GameTable, path: str = None
+        ) -> Type["SharedDataset"]:
+        """
+        Publishes the columns of a game table
+
+        Args:
+        table (GameTable): The game table to publish
+        path (str): The file to memory-map instead of using shared memory
+
+        Returns:
+        SharedDataset: The published SharedDataset
+        """
+        return SharedDataset(table.columns, path=path)
+
+    def get_handle(self) -> Dict[str, Any]:
+        """
+        Returns a small, picklable handle workers can attach with
+
+        Args:
+        None
+
+        Returns:
+        dict: The handle to the published dataset
+        """
+        return {
+            "name": self.segment.name if self.segment is not None else None,
+            "path": self.path,
+            "layout": self.layout
+        }
+
+    def close(self) -> None:
+        """
+        Releases the published dataset. Shared memory is unlinked, while a
+        memory-mapped file is left on disk for later runs.
+
+        Args:
+        None
+
+        Returns:
+        None
+        """
+        if self.segment is not None:
+            attached_segments.pop(self.segment.name, None)
+            self.segment.close()
+            self.segment.unlink()
+            self.segment = None
+
+    def __enter__(self) -> Type["SharedDataset"]:
+        """
+        Enters a context in which the dataset stays published
+
+        Args:
+        None
+
+        Returns:
+        SharedDataset: This SharedDataset
+        """
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """
+        Releases the dataset when leaving its context
+
+        Args:
+        exc (Any): The exception info, if any
+
+        Returns:
+        None
+        """
+        self.close()
@@ -0,0 +1,84 @@
+import numpy
+
+# Skill differentials run from -4 to 4, offset onto 9 bins from 0
+SKILL_DIFF_OFFSET = 4
+SKILL_DIFF_BINS = 2 * SKILL_DIFF_OFFSET + 1
+
+# Each pair of home & away skill differential bins
+SKILL_DIFF_PAIRS = SKILL_DIFF_BINS ** 2
+
+def get_skill_diff_bins(
+        offense: numpy.ndarray, defense: numpy.ndarray
+    ) -> numpy.ndarray:
+    """
+    Returns the bin of each offense versus opposing defense skill
+    differential
+
+    Args:
+    offense (numpy.ndarray): The offense tiers
+    defense (numpy.ndarray): The opposing defense tiers
+
+    Returns:
+    numpy.ndarray: The skill differential bins
+    """
+    return numpy.asarray(offense) - numpy.asarray(defense) + \
+        SKILL_DIFF_OFFSET
+
+def normalize_skill_diffs(bins: numpy.ndarray) -> numpy.ndarray:
+    """
+    Normalizes skill differential bins onto [0, 1], as the score models
+    expect
+
+    Args:
+    bins (numpy.ndarray): The skill differential bins
+
+    Returns:
+    numpy.ndarray: The normalized skill differentials
+    """
+    return numpy.asarray(bins) / (SKILL_DIFF_BINS - 1)
+
+def get_pair_index(
+        home_diffs: numpy.ndarray, away_diffs: numpy.ndarray
+    ) -> numpy.ndarray:
+    """
+    Returns the index of each pair of home & away skill differential bins
+
+    Args:
+    home_diffs (numpy.ndarray): The home offense versus away defense bins
+    away_diffs (numpy.ndarray): The away offense versus home defense bins
+
+    Returns:
+    numpy.ndarray: The index of each pair
+    """
+    return numpy.asarray(home_diffs) * SKILL_DIFF_BINS + \
+        numpy.asarray(away_diffs)
+
+def get_joint_score_counts(
+        home_diffs: numpy.ndarray,
+        away_diffs: numpy.ndarray,
+        home_scores: numpy.ndarray,
+        away_scores: numpy.ndarray,
+        n_scores: int
+    ) -> numpy.ndarray:
+    """
+    Counts the (home_score, away_score) histogram of each pair of home &
+    away skill differential bins, with a single bincount over the flattened
+    pair, home score & away score
+
+    Args:
+    home_diffs (numpy.ndarray): The home offense versus away defense bins
+    away_diffs (numpy.ndarray): The away offense versus home defense bins
+    home_scores (numpy.ndarray): The home scores
+    away_scores (numpy.ndarray): The away scores
+    n_scores (int): The number of distinct scores, from 0 upward
+
+    Returns:
+    numpy.ndarray: The histogram of each pair, (P, S, S)
+    """
+    home_scores = numpy.asarray(home_scores, dtype=numpy.int64)
+    away_scores = numpy.asarray(away_scores, dtype=numpy.int64)
+    index = (get_pair_index(home_diffs, away_diffs).astype(numpy.int64) * \
+        n_scores + home_scores) * n_scores + away_scores
+    return numpy.bincount(
+        index, minlength=SKILL_DIFF_PAIRS * n_scores ** 2
+    ).reshape(SKILL_DIFF_PAIRS, n_scores, n_scores).astype(float)
@@ -0,0 +1,302 @@
+import gzip
+import io
+import json
+import os
+from typing import Any, List, TextIO
+
+# The compressions data files may be stored with, by file extension
+COMPRESSION_EXTENSIONS = {
+    "gzip": ".gz",
+    "zstd": ".zst"
+}
+
+# The parsed data files read or written during a batch, by uncompressed
+# path, or None outside of one
+data_cache = None
+
+# Whether data files written during a batch are also written to disk
+data_write_through = True
+
+def get_zstandard() -> Any:
+    """
+    Imports zstandard, which is only needed for zstd-compressed data files
+
+    Args:
+    None
+
+    Returns:
+    module: The zstandard module
+    """
+    try:
+        import zstandard
+    except ImportError:
+        raise Exception(
+            "Reading or writing zstd-compressed data requires zstandard, " + \
+            "install it with pip install zstandard"
+        )
+    return zstandard
+
+def get_compression(path: str) -> str:
+    """
+    Detects the compression of a data file from its extension
+
+    Args:
+    path (str): The data file
+
+    Returns:
+    str: The compression, either gzip or zstd, or None if uncompressed
+    """
+    for compression, extension in COMPRESSION_EXTENSIONS.items():
+        if path.endswith(extension):
+            return compression
+    return None
+
+def get_data_paths(path: str) -> List[str]:
+    """
+    Returns every path a data file may be stored under, uncompressed first
+
+    Args:
+    path (str): The uncompressed path of the data file, e.g. x.json
+
+    Returns:
+    list: The uncompressed path followed by each compressed one
+    """
+    return [ path ] + [
+        path + extension for extension in COMPRESSION_EXTENSIONS.values()
+    ]
+
+def find_data_path(path: str) -> str:
+    """
+    Resolves the uncompressed path of a data file to wherever it is stored,
+    compressed or not
+
+    Args:
+    path (str): The uncompressed path of the data file, e.g. x.json
+
+    Returns:
+    str: The path the data file is stored under, or the given path if it
+        is not stored under any of them
+    """
+    for data_path in get_data_paths(path):
+        if os.path.exists(data_path):
+            return data_path
+    return path
+
+def strip_compression(path: str) -> str:
+    """
+    Strips any compression extension from a data file name
+
+    Args:
+    path (str): The data file, e.g. x.json.gz
+
+    Returns:
+    str: The uncompressed file name, e.g. x.json
+    """
+    compression = get_compression(path)
+    if compression is None:
+        return path
+    return path[:-len(COMPRESSION_EXTENSIONS[compression])]
+
+def open_data(path: str, mode: str = "r") -> TextIO:
+    """
+    Opens a data file as a text stream, transparently compressing or
+    decompressing it according to its extension. Reads decompress as they
+    go rather than inflating the whole file up front.
+
+    Args:
+    path (str): The data file
+    mode (str): Either r to read or w to write
+
+    Returns:
+    TextIO: The open text stream
+    """
+    compression = get_compression(path)
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if compression == "zstd":
+        zstandard = get_zstandard()
+        raw = open(path, mode + "b")
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(
+                raw, closefd=True
+            )
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(
+                raw, closefd=True
+            )
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode)
+
+def set_data_cache(enabled: bool, write_through: bool = True) -> None:
+    """
+    Starts or stops caching the data files this process reads & writes in
+    memory, so that a batch of commands parses each file at most once. The
+    cached JSON is shared between readers, which must not mutate it.
+
+    Args:
+    enabled (bool): Whether to cache data files, clearing any cached ones
+    write_through (bool): Whether written data files also go to disk,
+        rather than only to the cache
+
+    Returns:
+    None
+    """
+    global data_cache, data_write_through
+    data_cache = {} if enabled else None
+    data_write_through = write_through
+
+def holds_writes_in_memory() -> bool:
+    """
+    Returns whether data files written during a batch are only held in the
+    data cache rather than also written to disk
+
+    Args:
+    None
+
+    Returns:
+    bool: Whether writes are held in memory
+    """
+    return data_cache is not None and not data_write_through
+
+def get_cache_key(path: str) -> str:
+    """
+    Returns the key a data file is cached under, the same however it is
+    compressed or its path is spelled
+
+    Args:
+    path (str): The data file, e.g. ./data/x.json.gz
+
+    Returns:
+    str: The absolute uncompressed path of the data file
+    """
+    return os.path.abspath(strip_compression(path))
+
+def is_cached(path: str) -> bool:
+    """
+    Returns whether a data file is held in the data cache, in which case
+    its copy on disk, if any, may be stale
+
+    Args:
+    path (str): The uncompressed path of the data file, e.g. x.json
+
+    Returns:
+    bool: Whether the data file is cached
+    """
+    return data_cache is not None and get_cache_key(path) in data_cache
+
+def data_exists(path: str) -> bool:
+    """
+    Returns whether a data file exists, compressed or not, on disk or in
+    the data cache
+
+    Args:
+    path (str): The uncompressed path of the data file, e.g. x.json
+
+    Returns:
+    bool: Whether the data file exists
+    """
+    return is_cached(path) or any(
+        os.path.exists(data_path) for data_path in get_data_paths(path)
+    )
+
+def evict_cached(path: str) -> None:
+    """
+    Drops a data file from the data cache, e.g. once another process has
+    rewritten it on disk
+
+    Args:
+    path (str): The uncompressed path of the data file, e.g. x.json
+
+    Returns:
+    None
+    """
+    if data_cache is not None:
+        data_cache.pop(get_cache_key(path), None)
+
+def list_data_files(directory: str) -> List[str]:
+    """
+    Lists the data files in a directory by their uncompressed names,
+    including any only held in the data cache
+
+    Args:
+    directory (str): The directory
+
+    Returns:
+    list: The uncompressed file names, in order
+    """
+    names = set()
+    if os.path.isdir(directory):
+        names.update(strip_compression(name) for name in os.listdir(directory))
+    if data_cache is not None:
+        prefix = os.path.abspath(directory) + os.sep
+        names.update(
+            key[len(prefix):] for key in data_cache
+            if key.startswith(prefix) and os.sep not in key[len(prefix):]
+        )
+    return sorted(names)
+
+def read_json(path: str) -> Any:
+    """
+    Reads a JSON data file, wherever it is stored, compressed or not, or
+    from the data cache if it holds the file
+
+    Args:
+    path (str): The uncompressed path of the data file, e.g. x.json
+
+    Returns:
+    Any: The parsed JSON
+    """
+    if data_cache is not None and get_cache_key(path) in data_cache:
+        return data_cache[get_cache_key(path)]
+    with open_data(find_data_path(path)) as data:
+        obj = json.load(data)
+    if data_cache is not None:
+        data_cache[get_cache_key(path)] = obj
+    return obj
+
+def write_json(
+        obj: Any, path: str, compress: str = None, sort_keys: bool = False
+    ) -> str:
+    """
+    Writes a JSON data file, optionally compressed, replacing any copy of it
+    stored with a different compression. Uncompressed files are indented
+    for readability, while compressed ones are written compactly. During a
+    batch the file is also cached as it would be read back, and only
+    cached if the batch doesn't write through.
+
+    Args:
+    obj (Any): The JSON-serializable object
+    path (str): The uncompressed path of the data file, e.g. x.json
+    compress (str): The compression, either gzip or zstd, or None
+    sort_keys (bool): Whether to sort the keys of JSON objects
+
+    Returns:
+    str: The path written
+    """
+    path = strip_compression(path)
+    target = path
+    if compress is not None:
+        extension = COMPRESSION_EXTENSIONS.get(compress)
+        if extension is None:
+            raise Exception(f"Unrecognized compression {compress}")
+        target = path + extension
+    if data_cache is not None:
+        # Cache the file as it would be read back, e.g. with string keys
+        text = json.dumps(
+            obj, indent=4 if compress is None else None, sort_keys=sort_keys
+        )
+        data_cache[get_cache_key(path)] = json.loads(text)
+        if not data_write_through:
+            return target
+        with open_data(target, "w") as data:
+            data.write(text)
+    else:
+        with open_data(target, "w") as data:
+            if compress is None:
+                data.write(json.dumps(obj, indent=4, sort_keys=sort_keys))
+            else:
+                json.dump(obj, data, sort_keys=sort_keys)
+    for data_path in get_data_paths(path):
+        if data_path != target and os.path.exists(data_path):
+            os.remove(data_path)
+    return target
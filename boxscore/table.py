@@ -0,0 +1,135 @@
+import numpy
+from boxscore.boxscore import BoxScoreList
+from boxscore.dates import DateIndex, parse_dates, get_weeks
+from boxscore.team import TeamDimension
+from typing import Dict, Type, List
+
+# The columns of a game table and their dtypes
+GAME_TABLE_COLUMNS = {
+    "season": numpy.int32,
+    "date": "datetime64[D]",
+    "week": numpy.int32,
+    "home_id": numpy.int32,
+    "away_id": numpy.int32,
+    "home_score": numpy.int32,
+    "away_score": numpy.int32
+}
+
+class GameTable:
+    @staticmethod
+    def from_box_score_list(
+            scores: BoxScoreList,
+            year: int,
+            dimension: TeamDimension
+        ) -> Type["GameTable"]:
+        """
+        Builds a columnar game table from a season's box scores, interning
+        the home and away teams in the given team dimension
+
+        Args:
+        scores (BoxScoreList): The season's box scores
+        year (int): The year the season occurred
+        dimension (TeamDimension): The team dimension to intern teams in
+
+        Returns:
+        GameTable: The season's game table
+        """
+        score_list = scores.score_list
+        seasons = numpy.full(len(score_list), year, dtype=numpy.int32)
+        dates = parse_dates([ s.get_date_str() for s in score_list ])
+        return GameTable({
+            "season": seasons,
+            "date": dates,
+            "week": get_weeks(seasons, dates),
+            "home_id": [
+                dimension.intern(year, s.get_home_team()) for s in score_list
+            ],
+            "away_id": [
+                dimension.intern(year, s.get_away_team()) for s in score_list
+            ],
+            "home_score": [ s.get_home_score() for s in score_list ],
+            "away_score": [ s.get_away_score() for s in score_list ]
+        })
+
+    @staticmethod
+    def concat(tables: List[Type["GameTable"]]) -> Type["GameTable"]:
+        """
+        Concatenates game tables, e.g. to stack seasons into one history
+
+        Args:
+        tables (list): The game tables to concatenate
+
+        Returns:
+        GameTable: The concatenated game table
+        """
+        return GameTable({
+            name: numpy.concatenate([ table[name] for table in tables ])
+            for name in tables[0].columns.keys()
+        })
+
+    def __init__(
+            self, columns: Dict[str, numpy.ndarray]
+        ) -> Type["GameTable"]:
+        """
+        Constructor for the GameTable class
+
+        Args:
+        columns (dict): The mapping of column names to equal-length arrays
+
+        Returns:
+        GameTable: The initialized GameTable
+        """
+        self.columns = {}
+        for name, values in columns.items():
+            dtype = GAME_TABLE_COLUMNS.get(name)
+            self.columns[name] = numpy.asarray(values, dtype=dtype)
+
+    def get_date_index(self) -> DateIndex:
+        """
+        Returns a date index over the games in the table
+
+        Args:
+        None
+
+        Returns:
+        DateIndex: The index of the games by season, week, and date
+        """
+        return DateIndex(self["season"], self["date"])
+
+    def take(self, index: numpy.ndarray) -> Type["GameTable"]:
+        """
+        Returns the rows of the game table at the given index or mask
+
+        Args:
+        index (numpy.ndarray): The row indices or boolean mask
+
+        Returns:
+        GameTable: The selected rows
+        """
+        return GameTable({
+            name: values[index] for name, values in self.columns.items()
+        })
+
+    def __getitem__(self, name: str) -> numpy.ndarray:
+        """
+        Returns a column of the game table
+
+        Args:
+        name (str): The column name
+
+        Returns:
+        numpy.ndarray: The column
+        """
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of games in the table
+
+        Args:
+        None
+
+        Returns:
+        int: The number of games
+        """
+        return len(self.columns["season"])
@@ -0,0 +1,245 @@
+import numpy
+from typing import Dict, Any, Type, Tuple, List
+
+# Maps historic team names onto the current name of their franchise, so that
+# relocated and renamed teams share a franchise id
+FRANCHISE_ALIASES = {
+    "Baltimore Colts": "Indianapolis Colts",
+    "Boston Patriots": "New England Patriots",
+    "Houston Oilers": "Tennessee Titans",
+    "Tennessee Oilers": "Tennessee Titans",
+    "Oakland Raiders": "Las Vegas Raiders",
+    "Los Angeles Raiders": "Las Vegas Raiders",
+    "St. Louis Cardinals": "Arizona Cardinals",
+    "Phoenix Cardinals": "Arizona Cardinals",
+    "St. Louis Rams": "Los Angeles Rams",
+    "San Diego Chargers": "Los Angeles Chargers",
+    "Washington Redskins": "Washington Commanders",
+    "Washington Football Team": "Washington Commanders"
+}
+
+def format_team_season(season: int, team: str) -> str:
+    """
+    Formats a team-season the way it is written in the summary data
+
+    Args:
+    season (int): The year the season occurred
+    team (str): The team name
+
+    Returns:
+    str: The team-season, e.g. "2017 New England Patriots"
+    """
+    return f"{season} {team}"
+
+def parse_team_season(team_season: str) -> Tuple[int, str]:
+    """
+    Parses a team-season as written in the summary data
+
+    Args:
+    team_season (str): The team-season, e.g. "2017 New England Patriots"
+
+    Returns:
+    int: The year the season occurred
+    str: The team name
+    """
+    season, team = team_season.split(" ", 1)
+    return int(season), team
+
+def get_franchise_name(team: str) -> str:
+    """
+    Returns the current name of the franchise a team name belongs to
+
+    Args:
+    team (str): The team name
+
+    Returns:
+    str: The franchise name
+    """
+    return FRANCHISE_ALIASES.get(team, team)
+
+class TeamDimension:
+    def __init__(self) -> Type["TeamDimension"]:
+        """
+        Constructor for the TeamDimension class, which interns team-seasons
+        and franchises as dense integer ids
+
+        Args:
+        None
+
+        Returns:
+        TeamDimension: The initialized, empty TeamDimension
+        """
+        self.team_ids = {}
+        self.teams = []
+        self.franchise_ids = {}
+        self.franchises = []
+        self.team_franchises = []
+
+    def intern(self, season: int, team: str) -> int:
+        """
+        Returns the id of a team-season, assigning a new one if needed
+
+        Args:
+        season (int): The year the season occurred
+        team (str): The team name
+
+        Returns:
+        int: The team-season id
+        """
+        key = (int(season), team)
+        team_id = self.team_ids.get(key)
+        if team_id is None:
+            team_id = len(self.teams)
+            self.team_ids[key] = team_id
+            self.teams.append(key)
+            self.team_franchises.append(self.intern_franchise(team))
+        return team_id
+
+    def intern_franchise(self, team: str) -> int:
+        """
+        Returns the franchise id of a team name, assigning a new one if needed
+
+        Args:
+        team (str): The team name
+
+        Returns:
+        int: The franchise id
+        """
+        franchise = get_franchise_name(team)
+        franchise_id = self.franchise_ids.get(franchise)
+        if franchise_id is None:
+            franchise_id = len(self.franchises)
+            self.franchise_ids[franchise] = franchise_id
+            self.franchises.append(franchise)
+        return franchise_id
+
+    def intern_team_season(self, team_season: str) -> int:
+        """
+        Returns the id of a team-season as written in the summary data
+
+        Args:
+        team_season (str): The team-season, e.g. "2017 New England Patriots"
+
+        Returns:
+        int: The team-season id
+        """
+        return self.intern(*parse_team_season(team_season))
+
+    def get_team_id(self, season: int, team: str) -> int:
+        """
+        Returns the id of an already interned team-season
+
+        Args:
+        season (int): The year the season occurred
+        team (str): The team name
+
+        Returns:
+        int: The team-season id
+        """
+        team_id = self.team_ids.get((int(season), team))
+        if team_id is None:
+            raise KeyError(
+                f"Team not found: {format_team_season(season, team)}"
+            )
+        return team_id
+
+    def get_team(self, team_id: int) -> Tuple[int, str]:
+        """
+        Returns the season and team name of a team-season id
+
+        Args:
+        team_id (int): The team-season id
+
+        Returns:
+        int: The year the season occurred
+        str: The team name
+        """
+        return self.teams[team_id]
+
+    def get_team_season(self, team_id: int) -> str:
+        """
+        Returns a team-season id formatted as in the summary data
+
+        Args:
+        team_id (int): The team-season id
+
+        Returns:
+        str: The team-season, e.g. "2017 New England Patriots"
+        """
+        return format_team_season(*self.teams[team_id])
+
+    def get_franchise_ids(self) -> numpy.ndarray:
+        """
+        Returns the franchise id of every team-season, indexed by team id
+
+        Args:
+        None
+
+        Returns:
+        numpy.ndarray: The franchise ids
+        """
+        return numpy.array(self.team_franchises, dtype=numpy.int32)
+
+    def get_seasons(self) -> numpy.ndarray:
+        """
+        Returns the season of every team-season, indexed by team id
+
+        Args:
+        None
+
+        Returns:
+        numpy.ndarray: The seasons
+        """
+        return numpy.array(
+            [ season for season, _ in self.teams ], dtype=numpy.int32
+        )
+
+    def lookup(self, values: Dict[str, int], fill: int = 0) -> numpy.ndarray:
+        """
+        Converts a mapping keyed by team-season strings into an array indexed
+        by team id, interning any team-seasons not yet seen
+
+        Args:
+        values (dict): The mapping of team-seasons to integer values
+        fill (int): The value for team ids missing from the mapping
+
+        Returns:
+        numpy.ndarray: The values indexed by team id
+        """
+        ids = [ self.intern_team_season(key) for key in values.keys() ]
+        array = numpy.full(len(self), fill, dtype=numpy.int32)
+        array[ids] = list(values.values())
+        return array
+
+    def __len__(self) -> int:
+        """
+        Returns the number of interned team-seasons
+
+        Args:
+        None
+
+        Returns:
+        int: The number of team-seasons
+        """
+        return len(self.teams)
+
+    def __json__(self) -> List[Dict[str, Any]]:
+        """
+        Serializes the TeamDimension as a JSON list indexed by team id
+
+        Args:
+        None
+
+        Returns:
+        list: The JSON-serialized TeamDimension
+        """
+        return [
+            {
+                "team_id": team_id,
+                "season": season,
+                "team": team,
+                "franchise_id": self.team_franchises[team_id],
+                "franchise": self.franchises[self.team_franchises[team_id]]
+            }
+            for team_id, (season, team) in enumerate(self.teams)
+        ]
@@ -0,0 +1,185 @@
+import contextlib
+import io
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Tuple, Type
+
+# The data root used when no workspace is given, the historical dataset
+DEFAULT_ROOT = "./data"
+
+# The directories each stage of a workspace's data is stored in, state
+# holding what commands persist between runs rather than derived data
+WORKSPACE_STAGES = [
+    "raw", "labeled", "preprocessed", "processed", "index", "export", "state"
+]
+
+class Workspace:
+    def __init__(
+            self, root: str = DEFAULT_ROOT, name: str = None
+        ) -> Type["Workspace"]:
+        """
+        Constructor for the Workspace class, a self-contained dataset, e.g.
+        one league or source, whose data & caches are all stored under one
+        root and partitioned by stage and then by season
+
+        Args:
+        root (str): The root directory of the workspace's data
+        name (str): The workspace's name, defaults to the root's basename
+
+        Returns:
+        Workspace: The initialized Workspace
+        """
+        self.root = root.rstrip("/") or "/"
+        self.name = name if name is not None \
+            else os.path.basename(os.path.abspath(self.root))
+
+    def get_path(self, stage: str, name: str = None) -> str:
+        """
+        Returns the path of a stage's directory, or of a file within it
+
+        Args:
+        stage (str): The stage, one of WORKSPACE_STAGES
+        name (str): The file within the stage's directory, if any
+
+        Returns:
+        str: The path
+        """
+        if stage not in WORKSPACE_STAGES:
+            raise Exception(f"Unrecognized workspace stage {stage}")
+        if name is None:
+            return f"{self.root}/{stage}"
+        return f"{self.root}/{stage}/{name}"
+
+    def __str__(self) -> str:
+        """
+        Serializes the Workspace instance as a string
+
+        Args:
+        None
+
+        Returns:
+        str: The workspace's name & root
+        """
+        return f"{self.name} ({self.root})"
+
+# The workspace commands run in, one per process
+current_workspace = Workspace()
+
+def get_workspace() -> Workspace:
+    """
+    Returns the workspace commands in this process run in
+
+    Args:
+    None
+
+    Returns:
+    Workspace: The current workspace
+    """
+    return current_workspace
+
+def set_workspace(workspace: Workspace) -> None:
+    """
+    Sets the workspace commands in this process run in
+
+    Args:
+    workspace (Workspace): The workspace
+
+    Returns:
+    None
+    """
+    global current_workspace
+    current_workspace = workspace
+
+def get_workspace_path(stage: str, name: str = None) -> str:
+    """
+    Returns the path of a stage's directory, or of a file within it, in the
+    current workspace
+
+    Args:
+    stage (str): The stage, one of WORKSPACE_STAGES
+    name (str): The file within the stage's directory, if any
+
+    Returns:
+    str: The path
+    """
+    return current_workspace.get_path(stage, name)
+
+def find_workspaces(parent: str) -> List[Workspace]:
+    """
+    Finds the workspaces partitioned under a parent directory, e.g. one
+    subdirectory per league, as those subdirectories with a raw stage
+
+    Args:
+    parent (str): The parent directory
+
+    Returns:
+    list: The workspaces, in name order
+    """
+    return [
+        Workspace(f"{parent.rstrip('/')}/{name}", name)
+        for name in sorted(os.listdir(parent))
+        if os.path.isdir(f"{parent.rstrip('/')}/{name}/raw")
+    ]
+
+def run_in_workspace(
+        workspace: Workspace, command: Callable[[Any], None], args: Any
+    ) -> Tuple[str, str]:
+    """
+    Runs a command in a workspace, capturing what it prints
+
+    Args:
+    workspace (Workspace): The workspace
+    command (Callable): The command, called with args
+    args (Any): The command's args
+
+    Returns:
+    str: The command's printed output
+    str: The traceback if the command failed, otherwise None
+    """
+    set_workspace(workspace)
+    output = io.StringIO()
+    error = None
+    with contextlib.redirect_stdout(output):
+        try:
+            command(args)
+        except Exception:
+            error = traceback.format_exc()
+    return output.getvalue(), error
+
+def run_in_workspaces(
+        workspaces: List[Workspace],
+        command: Callable[[Any], None],
+        args: Any,
+        jobs: int = None
+    ) -> None:
+    """
+    Runs a command in many workspaces concurrently, one process each so that
+    every workspace keeps its own state & caches, printing each workspace's
+    output in order once it completes
+
+    Args:
+    workspaces (list): The workspaces
+    command (Callable): The command, called with args
+    args (Any): The command's args
+    jobs (int): The number of worker processes, defaults to the CPUs
+
+    Returns:
+    None
+    """
+    failed = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(
+            run_in_workspace,
+            workspaces,
+            [ command ] * len(workspaces),
+            [ args ] * len(workspaces)
+        )
+        for workspace, (output, error) in zip(workspaces, results):
+            print(f"== {workspace} ==")
+            print(output, end="")
+            if error is not None:
+                print(error, end="")
+                failed.append(workspace.name)
+    if len(failed) > 0:
+        raise Exception(f"Failed in workspaces {failed}")
@@ -1,15 +1,50 @@
 import argparse
 import json
 import matplotlib.pyplot
+import numpy
 import os
 import pandas
 import random
 from boxscore.boxscore  import  BoxScoreList, \
+                                BoxScoreSummary, \
                                 BoxScoreSummaryList, \
                                 LabeledBoxScore
-from sklearn.cluster    import  KMeans
+from boxscore.cluster   import  SkillClustering, \
+                                load_summary_dataframe
+from boxscore.export    import  EXPORT_TIERS, \
+                                export_tier
+from boxscore.ingest    import  ingest_season_pages
+from boxscore.index     import  diff_datasets, \
+                                get_indexed_years, \
+                                load_season_index
+from boxscore.loader    import  get_years, \
+                                load_season, \
+                                load_seasons
+from boxscore.massey    import  MasseyRatings
+from boxscore.matchup   import  MATCHUP_STATS, \
+                                MatchupMatrices
+from boxscore.models    import  README_SCORE_MODELS, \
+                                ScoreModels
+from boxscore.plotting  import  plot_scatter
+from boxscore.projection import SeasonProjection
+from boxscore.rating    import  RatingEngine, \
+                                get_rating_tiers
+from boxscore.table     import  GameTable
+from boxscore.storage   import  data_exists, \
+                                read_json, \
+                                write_json
+from boxscore.workspace import  get_workspace_path
+from boxscore.team      import  TeamDimension, \
+                                format_team_season, \
+                                get_franchise_name
+from cli.render         import  STREAMING_FORMATS, \
+                                open_output, \
+                                render_rows, \
+                                slice_rows, \
+                                write_output_json
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error
+from typing import Iterator
 
 def list_boxscores(args: argparse.Namespace) -> None:
     """
@@ -22,13 +57,37 @@ def list_boxscores(args: argparse.Namespace) -> None:
     None
     """
     # Load the year of scores
-    with open(f"./data/raw/{args.year}.json") as data:
-        scores = BoxScoreList(json.load(data))
+    scores = load_season(args.year, kind="raw")
+
+    # Filter the scores by whichever predicates are given
+    filtered = scores.where(
+        team=args.team,
+        opponent=args.opponent,
+        date_between=(args.start_date, args.end_date),
+        min_total=args.min_total,
+        margin_gt=args.margin_gt,
+        tie=args.tie
+    )
+
+    # Page the box scores, whichever format they are output in
+    filtered = BoxScoreList.from_box_scores(list(
+        slice_rows(filtered.score_list, args.limit, args.offset)
+    ))
+
+    # Stream the box scores row by row in the streaming formats
+    if args.output in STREAMING_FORMATS:
+        with open_output(args.file) as out:
+            render_rows(
+                ( score.__json__() for score in filtered.score_list ),
+                out,
+                args.output
+            )
+        return
 
-    # Filter a team's scores if a team is given
-    filtered = scores
-    if args.team is not None:
-        filtered = scores.to_box_score_season().get_team_box_scores(args.team)
+    # Write a JSON file through the data cache
+    if args.output == "json" and args.file is not None:
+        write_output_json(filtered, args.file)
+        return
 
     # Get the box scores as a string
     box_score_str = ""
@@ -36,78 +95,132 @@ def list_boxscores(args: argparse.Namespace) -> None:
         box_score_str = str(filtered)
     elif args.output == "json":
         box_score_str = json.dumps(filtered, indent=4)
-    elif args.output == "table":
-        box_score_str = pandas.read_json(json.dumps(filtered)).to_string()
     else:
         raise Exception(f"Unrecognized output format {args.output}")
+    with open_output(args.file) as out:
+        out.write(box_score_str + "\n")
 
-    # Output the box scores either to stdout or to a file
-    if args.file is not None:
-        with open(args.file, 'w') as out:
-            out.write(box_score_str)
-    else:
-        print(box_score_str)
-
-def summarize_boxscores(args: argparse.Namespace) -> None:
+def iter_summaries(args: argparse.Namespace) -> Iterator[BoxScoreSummary]:
     """
-    Execute the boxscore summarize CLI command
+    Lazily summarizes each requested season of box scores
 
     Args:
     args (argparse.Namespace): The CLI args
 
     Returns:
-    None
+    Iterator: The summary of each team-season, one season at a time
     """
     # Load each year of box scores, or load a specific year if a year is given
-    years = [
-        int(d.replace(".json", "")) for d in os.listdir("./data/raw")
-    ]
+    years = get_years("raw")
     if args.year is not None:
         years = [ args.year ]
-    
-    # Summarize each year and add each summary to a BoxScoreSummaryList
-    summary_list = BoxScoreSummaryList()
-    for year in years:
-        # Load the year of scores
-        with open(f"./data/raw/{year}.json") as data:
-            scores = BoxScoreList(json.load(data))
-
+    for year, scores in load_seasons(years, kind="raw"):
         # Filter a team's scores if a team is given
-        # Summarize and add to the summary list
         season_scores = scores.to_box_score_season(year)
         if args.team is not None:
             season_scores = season_scores.get_team_box_scores(args.team)
             team_summary = season_scores.summarize_team_scores(args.team)
-            team_summary.team = f"{year} {args.team}"
-            summary_list.add_summary(team_summary)
+            team_summary.team = format_team_season(year, args.team)
+            yield team_summary
         else:
-            summary_list.add_summaries(season_scores.summarize())
-    
+            yield from season_scores.summarize().summary
+
+def summarize_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore summarize CLI command
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    # Page the summaries, whichever format they are output in
+    summaries = slice_rows(iter_summaries(args), args.limit, args.offset)
+
+    # Stream the summaries as each season is summarized
+    if args.output in STREAMING_FORMATS:
+        if args.offense:
+            rows = ( s.get_side_json("offense") for s in summaries )
+        elif args.defense:
+            rows = ( s.get_side_json("defense") for s in summaries )
+        else:
+            rows = ( s.__json__() for s in summaries )
+        with open_output(args.file) as out:
+            render_rows(rows, out, args.output)
+        return
+
+    # Add each summary to a BoxScoreSummaryList
+    summary_list = BoxScoreSummaryList()
+    for team_summary in summaries:
+        summary_list.add_summary(team_summary)
+
     # Summarize only offense or defense if requested
     if args.offense:
         summary_list = summary_list.get_offense_summary_json()
     elif args.defense:
         summary_list = summary_list.get_defense_summary_json()
 
+    # Write a JSON file through the data cache
+    if args.output == "json" and args.file is not None:
+        write_output_json(summary_list, args.file)
+        return
+
     # Get the summaries as a string
     summary_str = ""
     if args.output == "default":
         summary_str = str(summary_list)
     elif args.output == "json":
         summary_str = json.dumps(summary_list, indent=4)
-    elif args.output == "table":
-        summary_str = pandas.read_json(
-            json.dumps(summary_list)
-        ).to_string()
     else:
         raise Exception(f"Unrecognized output format {args.output}")
+    with open_output(args.file) as out:
+        out.write(summary_str + "\n")
 
-    # Output the box scores either to stdout or to a file
-    if args.file is not None:
-        with open(args.file, 'w') as out:
-            out.write(summary_str)
+def weekly_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore weekly CLI command
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    # Load each year of box scores within the requested range of seasons
+    years = get_years("raw")
+    if args.start_year is not None:
+        years = [ year for year in years if year >= args.start_year ]
+    if args.end_year is not None:
+        years = [ year for year in years if year <= args.end_year ]
+    dimension = TeamDimension()
+    tables = []
+    for year, scores in load_seasons(years, kind="raw"):
+        tables.append(GameTable.from_box_score_list(scores, year, dimension))
+    table = GameTable.concat(tables)
+
+    # Select the games within the requested weeks or month
+    date_index = table.get_date_index()
+    if args.month is not None:
+        games = date_index.in_month(args.month)
     else:
-        print(summary_str)
+        games = date_index.weeks_between(args.start_week, args.end_week)
+    table = table.take(games)
+
+    # Summarize the scoring by week of the season
+    dataframe = pandas.DataFrame({
+        "week": table["week"],
+        "home_score": table["home_score"],
+        "away_score": table["away_score"],
+        "total_score": table["home_score"] + table["away_score"]
+    })
+    summary = dataframe.groupby("week").agg(
+        games=("total_score", "count"),
+        mean_home_score=("home_score", "mean"),
+        mean_away_score=("away_score", "mean"),
+        mean_total_score=("total_score", "mean")
+    )
+    print(summary.to_string())
 
 def visualize_boxscores(args: argparse.Namespace) -> None:
     """
@@ -124,23 +237,15 @@ def visualize_boxscores(args: argparse.Namespace) -> None:
 
     # Initialize the dataframe
     if args.offense:
-        # Sort and filter the dataframe
-        dataframe = pandas.read_json("./data/preprocessed/offense.json")
-        dataframe = dataframe.sort_values(["mean", "std"], ascending=False)
-        dataframe = dataframe.query('count > 5')
-        dataframe = dataframe.dropna()
-        
+        side = "offense"
+
         # Set the figure title & y-axis label
         matplotlib.pyplot.title('Historic football offense summary data')
         ax.set_xlabel('Mean points for')
         ax.set_ylabel('Median points for')
     elif args.defense:
-        # Sort and filter the dataframe
-        dataframe = pandas.read_json("./data/preprocessed/defense.json")
-        dataframe = dataframe.sort_values(["mean", "std"])
-        dataframe = dataframe.query('count > 5')
-        dataframe = dataframe.dropna()
-        
+        side = "defense"
+
         # Set the figure title
         matplotlib.pyplot.title('Historic football defense summary data')
         ax.set_xlabel('Mean points against')
@@ -148,16 +253,140 @@ def visualize_boxscores(args: argparse.Namespace) -> None:
     else:
         raise Exception("Must provide either --offense or --defense")
 
-    # Plot the dataframe
-    filtered = dataframe[["mean", "50%"]]
-    kmeans = KMeans(n_clusters=5)
-    kmeans.fit(filtered)
-    filtered['cluster'] = kmeans.labels_
-
-    # Visualize the clusters
-    matplotlib.pyplot.scatter(filtered['mean'], filtered['50%'], c=filtered['cluster'])
+    # Load the filtered dataframe and its shared clustering
+    dataframe = load_summary_dataframe(get_workspace_path(
+        "preprocessed", f"{side}.json"
+    ))
+    clustering = SkillClustering.load_or_fit(side)
+    dataframe['cluster'] = dataframe['team'].map(clustering.tiers)
+
+    # Visualize the clusters, decimated or binned if there are many points
+    plot_scatter(
+        ax,
+        dataframe['mean'].to_numpy(),
+        dataframe['50%'].to_numpy(),
+        c=dataframe['cluster'].to_numpy(),
+        max_points=args.max_points,
+        hexbin=args.hexbin
+    )
     matplotlib.pyplot.show()
 
+def cluster_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore cluster subcommand
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    sides = [ "offense", "defense" ]
+    if args.offense:
+        sides = [ "offense" ]
+    elif args.defense:
+        sides = [ "defense" ]
+    for side in sides:
+        clustering = SkillClustering.load_or_fit(side, refit=args.refit)
+        print(f"Clustered {len(clustering.tiers)} {side} team-seasons")
+        for tier, centroid in enumerate(clustering.centroids, start=1):
+            print(f"Tier {tier}: {centroid}")
+
+def rate_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore rate subcommand
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    # Resume from the persisted ratings unless a reset is requested
+    state_path = get_workspace_path("state", "ratings.json")
+    engine = RatingEngine()
+    if not args.reset and data_exists(state_path):
+        engine = RatingEngine.from_json(read_json(state_path))
+
+    # Only seasons which may hold unprocessed games need to be loaded
+    years = get_years("raw")
+    if engine.last_date is not None and len(engine.ratings) > 0:
+        last_season = max(state[2] for state in engine.ratings.values())
+        years = [ year for year in years if year >= last_season ]
+    dimension = TeamDimension()
+    tables = []
+    for year, scores in load_seasons(years, kind="raw"):
+        tables.append(GameTable.from_box_score_list(scores, year, dimension))
+    if len(tables) == 0:
+        print("No box scores to rate")
+        return
+    ratings = engine.process_table(GameTable.concat(tables), dimension)
+    print(f"Rated {int((~numpy.isnan(ratings[:, 0])).sum())} new games")
+    os.makedirs(get_workspace_path("state"), exist_ok=True)
+    write_json(engine, state_path)
+
+    # Print the current ratings of the teams active in the latest season
+    if len(engine.ratings) == 0:
+        print("No team ratings to show")
+        return
+    latest = max(state[2] for state in engine.ratings.values())
+    dataframe = pandas.DataFrame([
+        {
+            "team": franchise,
+            "offense": state[0],
+            "defense": state[1],
+            "offense_tier": int(get_rating_tiers(state[0])),
+            "defense_tier": int(get_rating_tiers(state[1]))
+        }
+        for franchise, state in engine.ratings.items()
+        if state[2] == latest
+    ])
+    print(dataframe.sort_values("offense", ascending=False).to_string(
+        index=False
+    ))
+
+def massey_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore massey subcommand
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    # Solve every season's ratings in one sparse system
+    dimension = TeamDimension()
+    tables = []
+    for year, scores in load_seasons(kind="raw"):
+        tables.append(GameTable.from_box_score_list(scores, year, dimension))
+    table = GameTable.concat(tables)
+    ratings = MasseyRatings.fit(table, dimension, ridge=args.ridge)
+    if args.file is not None:
+        write_output_json(ratings, args.file)
+
+    # Print the ratings of the requested season's teams
+    year = max(ratings.season_means) if args.year is None else args.year
+    if year not in ratings.season_means:
+        raise argparse.ArgumentError(
+            None, f"argument -y/--year: Season not found: {year}"
+        )
+    team_ids = numpy.flatnonzero(dimension.get_seasons() == year)
+    print(
+        f"{year} mean score: {ratings.season_means[year]:.2f}, " + \
+        f"home advantage: {ratings.home_advantage:.2f}"
+    )
+    dataframe = pandas.DataFrame({
+        "team": [ dimension.teams[team_id][1] for team_id in team_ids ],
+        "offense": ratings.offense[team_ids],
+        "defense": ratings.defense[team_ids],
+        "offense_tier": get_rating_tiers(ratings.offense[team_ids]),
+        "defense_tier": get_rating_tiers(ratings.defense[team_ids])
+    })
+    print(dataframe.sort_values("offense", ascending=False).to_string(
+        index=False
+    ))
+
 def label_boxscores(args: argparse.Namespace) -> None:
     """
     Execute the boxscore label subcommand
@@ -168,77 +397,75 @@ def label_boxscores(args: argparse.Namespace) -> None:
     Returns:
     None
     """
-    # Initialize the offense & defense dataframes
-    offense_dataframe = pandas.read_json("./data/preprocessed/offense.json")
-    offense_dataframe = offense_dataframe.sort_values(["mean", "std"], ascending=True)
-    offense_dataframe = offense_dataframe.query('count > 5')
-    offense_dataframe = offense_dataframe.dropna()
-    defense_dataframe = pandas.read_json("./data/preprocessed/defense.json")
-    defense_dataframe = defense_dataframe.sort_values(["mean", "std"], ascending=False)
-    defense_dataframe = defense_dataframe.query('count > 5')
-    defense_dataframe = defense_dataframe.dropna()
-
-    # Cluster each using k-means clustering
-    offense_filtered = offense_dataframe[["mean", "50%"]]
-    offense_kmeans = KMeans(n_clusters=5)
-    offense_kmeans.fit(offense_filtered)
-    offense_dataframe['offense_overall'] = offense_kmeans.labels_
-    offense_dataframe['offense_overall'] = pandas.factorize(
-        offense_dataframe['offense_overall']
-    )[0] + 1
-    defense_filtered = defense_dataframe[["mean", "50%"]]
-    defense_kmeans = KMeans(n_clusters=5)
-    defense_kmeans.fit(defense_filtered)
-    defense_dataframe['defense_overall'] = defense_kmeans.labels_
-    defense_dataframe['defense_overall'] = pandas.factorize(
-        defense_dataframe['defense_overall']
-    )[0] + 1
-
-    # Sort by team name for labelling
-    offense_dataframe.sort_values("team")
-    defense_dataframe.sort_values("team")
+    # Load each year of scores into a game table keyed by team-season id
+    years = get_years("raw")
+    dimension = TeamDimension()
+    seasons = {}
+    for year, scores in load_seasons(years, kind="raw"):
+        seasons[year] = (
+            scores, GameTable.from_box_score_list(scores, year, dimension)
+        )
+
+    # Label each game with the home offense, home defense, away offense &
+    # away defense tiers, 0 marking teams without a tier
+    labels = {}
+    if args.ratings == "kmeans":
+        # Index the shared clusterings' tiers by team-season id
+        offense_clustering = SkillClustering.load_or_fit("offense")
+        defense_clustering = SkillClustering.load_or_fit("defense")
+        offense_tiers = dimension.lookup(offense_clustering.tiers)
+        defense_tiers = dimension.lookup(defense_clustering.tiers)
+        for year in years:
+            _, table = seasons[year]
+            labels[year] = numpy.stack([
+                offense_tiers[table["home_id"]],
+                defense_tiers[table["home_id"]],
+                offense_tiers[table["away_id"]],
+                defense_tiers[table["away_id"]]
+            ], axis=1)
+    elif args.ratings in [ "incremental", "massey" ]:
+        table = GameTable.concat([ seasons[year][1] for year in years ])
+        if args.ratings == "incremental":
+            # Stream all of history through the rating engine in date order
+            ratings = RatingEngine().process_table(table, dimension)
+            tiers = get_rating_tiers(ratings)
+        else:
+            # Solve every season's schedule-adjusted ratings at once
+            tiers = MasseyRatings.fit(table, dimension).get_game_tiers(table)
+        offsets = numpy.cumsum([ 0 ] + [ len(seasons[y][1]) for y in years ])
+        for year, lo, hi in zip(years, offsets[:-1], offsets[1:]):
+            labels[year] = tiers[lo:hi]
+    else:
+        raise Exception(f"Unrecognized ratings {args.ratings}")
 
     # Loop through each year
-    years = [
-        int(d.replace(".json", "")) for d in os.listdir("./data/raw")
-    ]
     for year in years:
         print(f"Labelling year {year}")
         labeled = []
+        scores, _ = seasons[year]
+
+        # Skip games with teams that have no tier
+        home_offense, home_defense, away_offense, away_defense = \
+            labels[year].T
+        clustered = (labels[year] > 0).all(axis=1)
 
-        # Load the year of scores
-        with open(f"./data/raw/{year}.json") as data:
-            scores = BoxScoreList(json.load(data))
-        
         # For each box score, label the box score
-        for box_score in scores.score_list:
-            home_team = f"{year} {box_score.get_home_team()}"
-            away_team = f"{year} {box_score.get_away_team()}"
-            hof = offense_dataframe.query(f"team.str.startswith('{home_team}')")
-            hdf = defense_dataframe.query(f"team.str.startswith('{home_team}')")
-            aof = offense_dataframe.query(f"team.str.startswith('{away_team}')")
-            adf = defense_dataframe.query(f"team.str.startswith('{away_team}')")
-            if len(hof) == 0 or len(hdf) == 0 or \
-                len(aof) == 0 or len(adf) == 0:
-                continue
-            home_offense_label = int(hof.iloc[0]["offense_overall"])
-            home_defense_label = int(hdf.iloc[0]["defense_overall"])
-            away_offense_label = int(aof.iloc[0]["offense_overall"])
-            away_defense_label = int(adf.iloc[0]["defense_overall"])
+        for i in numpy.flatnonzero(clustered):
             lbs = LabeledBoxScore(
-                box_score.score_obj,
-                home_offense=home_offense_label,
-                home_defense=home_defense_label,
-                away_offense=away_offense_label,
-                away_defense=away_defense_label
+                scores.score_list[i].score_obj,
+                home_offense=int(home_offense[i]),
+                home_defense=int(home_defense[i]),
+                away_offense=int(away_offense[i]),
+                away_defense=int(away_defense[i])
             )
             labeled.append(lbs)
         
         # Write the labeled scores
-        with open(f"./data/labeled/{year}.json", "w") as labeled_data:
-            labeled_data.write(
-                json.dumps(labeled, indent=4)
-            )
+        write_json(
+            labeled,
+            get_workspace_path("labeled", f"{year}.json"),
+            args.compress
+        )
 
 def aggregate_boxscores(args: argparse.Namespace) -> None:
     """
@@ -251,30 +478,12 @@ def aggregate_boxscores(args: argparse.Namespace) -> None:
     None
     """
     # Loop through each year
-    years = [
-        int(d.replace(".json", "")) for d in os.listdir("./data/raw")
-    ]
     training = []
     testing = []
     validation = []
-    for year in years:
+    for year, labeled in load_seasons(kind="labeled"):
         print(f"Aggregating year {year}")
-        with open(f"./data/labeled/{year}.json") as labeled_data:
-            labeled = json.load(labeled_data)
-        for score in labeled:
-            lbs = LabeledBoxScore(
-                {
-                    "date": score["date"],
-                    "home_team": score["home_team"],
-                    "home_score": score["home_score"],
-                    "away_team": score["away_team"],
-                    "away_score": score["away_score"]
-                },
-                score["home_offense"],
-                score["home_defense"],
-                score["away_offense"],
-                score["away_defense"]
-            )
+        for lbs in labeled:
             random_int = random.randint(0, 9)
             if random_int < 1:
                 validation.append(lbs)
@@ -282,12 +491,21 @@ def aggregate_boxscores(args: argparse.Namespace) -> None:
                 testing.append(lbs)
             else:
                 training.append(lbs)
-    with open("./data/processed/training.json", "w") as training_data:
-        training_data.write(json.dumps(training, indent=4))
-    with open("./data/processed/validation.json", "w") as validation_data:
-        validation_data.write(json.dumps(validation, indent=4))
-    with open("./data/processed/testing.json", "w") as testing_data:
-        testing_data.write(json.dumps(testing, indent=4))
+    write_json(
+        training,
+        get_workspace_path("processed", "training.json"),
+        args.compress
+    )
+    write_json(
+        validation,
+        get_workspace_path("processed", "validation.json"),
+        args.compress
+    )
+    write_json(
+        testing,
+        get_workspace_path("processed", "testing.json"),
+        args.compress
+    )
 
 def boxscore_frequency(args: argparse.Namespace) -> None:
     """
@@ -299,7 +517,9 @@ def boxscore_frequency(args: argparse.Namespace) -> None:
     Returns:
     None
     """
-    score_freq_df = pandas.read_json("./data/preprocessed/skill_diff_scores.json")
+    score_freq_df = pandas.DataFrame(
+        read_json(get_workspace_path("preprocessed", "skill_diff_scores.json"))
+    )
     freq = score_freq_df['score'].value_counts(normalize=False)
     freq = freq.sort_index()
     freq_obj = {}
@@ -308,14 +528,22 @@ def boxscore_frequency(args: argparse.Namespace) -> None:
     for i in range(80):
         if i not in freq_obj.keys():
             freq_obj[i] = 0
-    with open("./data/preprocessed/frequency.json", 'w') as freq_file:
-        freq_file.write(json.dumps(freq_obj, indent=4, sort_keys=True))
+    write_json(
+        freq_obj,
+        get_workspace_path("preprocessed", "frequency.json"),
+        args.compress,
+        sort_keys=True
+    )
 
 def boxscore_model_frequency(args: argparse.Namespace) -> None:
     """
     Execute the model frequency subcommand
     """
-    model_freq_df = pandas.read_json("./data/preprocessed/adj_model_frequency.json")
+    model_freq_df = pandas.DataFrame(
+        read_json(get_workspace_path(
+            "preprocessed", "adj_model_frequency.json"
+        ))
+    )
     matplotlib.pyplot.bar(model_freq_df['score'], model_freq_df['count'])
     matplotlib.pyplot.xlabel('Score')
     matplotlib.pyplot.ylabel('Frequency')
@@ -326,9 +554,21 @@ def boxscore_model_freq_mse(args: argparse.Namespace) -> None:
     """
     Calculate mean squared error between the models and the actual data
     """
-    real_freq_df = pandas.read_json("./data/preprocessed/real_frequency.json")
-    base_freq_df = pandas.read_json("./data/preprocessed/base_model_frequency.json")
-    adj_freq_df = pandas.read_json("./data/preprocessed/adj_model_frequency.json")
+    real_freq_df = pandas.DataFrame(
+        read_json(get_workspace_path(
+            "preprocessed", "real_frequency.json"
+        ))
+    )
+    base_freq_df = pandas.DataFrame(
+        read_json(get_workspace_path(
+            "preprocessed", "base_model_frequency.json"
+        ))
+    )
+    adj_freq_df = pandas.DataFrame(
+        read_json(get_workspace_path(
+            "preprocessed", "adj_model_frequency.json"
+        ))
+    )
     real_freq_df["frequency"] = real_freq_df["frequency"].str.rstrip("%").astype('float')
     base_freq_df["Frequency"] = base_freq_df["Frequency"].str.rstrip("%").astype('float')
     adj_freq_df["frequency"] = adj_freq_df["frequency"].str.rstrip("%").astype('float')
@@ -347,7 +587,9 @@ def boxscore_tie_frequency(args: argparse.Namespace) -> None:
     Returns:
     None
     """
-    score_df = pandas.read_json("./data/processed/training.json")
+    score_df = pandas.DataFrame(
+        read_json(get_workspace_path("processed", "training.json"))
+    )
     tie_df = score_df["home_score"] == score_df["away_score"]
     tie_freq = tie_df.value_counts()
     print(tie_freq)
@@ -364,7 +606,9 @@ def boxscore_tie_frequency_by_skill(args: argparse.Namespace) -> None:
     Returns:
     None
     """
-    score_df = pandas.read_json("./data/processed/training.json")
+    score_df = pandas.DataFrame(
+        read_json(get_workspace_path("processed", "training.json"))
+    )
     ha_diff = score_df["home_offense"] - score_df["away_defense"]
     ah_diff = score_df["away_offense"] - score_df["home_defense"]
     tie_df = score_df["home_score"] == score_df["away_score"]
@@ -401,3 +645,201 @@ def boxscore_tie_frequency_by_skill(args: argparse.Namespace) -> None:
     matplotlib.pyplot.scatter(tie_freq[["norm_diff"]], tie_freq[["proportion"]], color='g')
     matplotlib.pyplot.plot(tie_freq[["norm_diff"]], y_pred, color='b')
     matplotlib.pyplot.show()
+
+def export_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore export subcommand
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    tiers = EXPORT_TIERS if args.tier is None else [ args.tier ]
+    directory = args.directory if args.directory is not None \
+        else get_workspace_path("export")
+    for tier in tiers:
+        paths = export_tier(tier, args.format, directory)
+        print(f"Exported {len(paths)} {tier} files to {directory}")
+
+def head_to_head_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore head-to-head subcommand
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    # Build the matchups of a single season, or of every franchise's history
+    years = get_years("raw") if args.year is None else [ args.year ]
+    dimension = TeamDimension()
+    tables = []
+    for year, scores in load_seasons(years, kind="raw"):
+        tables.append(GameTable.from_box_score_list(scores, year, dimension))
+    table = GameTable.concat(tables)
+    if args.year is None:
+        matchups = MatchupMatrices.from_table(
+            table, dimension, franchise=True
+        )
+        names = dimension.franchises
+        team_id = dimension.franchise_ids.get(get_franchise_name(args.team))
+    else:
+        matchups = MatchupMatrices.from_table(table, dimension)
+        names = [ team for _, team in dimension.teams ]
+        team_id = dimension.team_ids.get((args.year, args.team))
+    if team_id is None:
+        raise argparse.ArgumentError(
+            None, f"argument -t/--team: Team not found: {args.team}"
+        )
+
+    # Summarize the team's row of each matrix, one opponent per column
+    row = { stat: matchups[stat][team_id] for stat in MATCHUP_STATS }
+    opponents = row["games"].indices
+    dataframe = pandas.DataFrame({
+        "opponent": [ names[opponent] for opponent in opponents ],
+        **{
+            stat: row[stat][0, opponents].toarray().ravel()
+            for stat in MATCHUP_STATS
+        }
+    })
+    dataframe["games"] = dataframe["games"].astype(int)
+    print(dataframe.sort_values(
+        ["games", "margin"], ascending=False
+    ).to_string(index=False))
+
+    # Schedule strength as the opponents' average margin per game
+    games = numpy.asarray(matchups["games"].sum(axis=1)).ravel()
+    margins = numpy.asarray(matchups["margin"].sum(axis=1)).ravel()
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        average_margins = margins / games
+    schedule = matchups.get_opponent_average(average_margins)[team_id]
+    print(f"Opponents' average margin per game: {schedule:.2f}")
+
+def index_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore index subcommand
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    for year in get_indexed_years(args.kind):
+        index = load_season_index(year, args.kind, write=True)
+        duplicates = len(index) - len(set(key for key, _ in index))
+        print(f"Indexed {len(index)} games of {year}, {duplicates} duplicates")
+
+def diff_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore diff subcommand
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    diffs = diff_datasets(args.old, args.new, args.kind, write=True)
+    markers = {
+        "added": "+",
+        "removed": "-",
+        "changed": "~",
+        "duplicates": "="
+    }
+    for year, diff in diffs.items():
+        print(f"{year}: " + ", ".join(
+            f"{len(keys)} {name}" for name, keys in diff.items()
+        ))
+        for name, keys in diff.items():
+            for key in keys:
+                print(f"  {markers[name]} {key}")
+
+    # Added, removed or changed games invalidate their season's labels
+    relabel = [
+        year for year, diff in diffs.items()
+        if diff["added"] or diff["removed"] or diff["changed"]
+    ]
+    print(f"Seasons needing relabeling: {relabel}")
+    if args.file is not None:
+        write_output_json(
+            { str(year): diff for year, diff in diffs.items() }, args.file
+        )
+
+def project_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore project subcommand
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    # Split the season into played games & the remaining schedule
+    scores = read_json(get_workspace_path("raw", f"{args.year}.json"))
+    box_scores = BoxScoreList(scores)
+    if args.schedule is not None:
+        played = box_scores.where()
+        remaining = read_json(args.schedule)
+    elif args.as_of is not None:
+        mask = box_scores.get_mask(date_between=(None, args.as_of))
+        played = box_scores.take(mask)
+        remaining = [
+            score for score, is_played in zip(scores, mask) if not is_played
+        ]
+    else:
+        raise Exception("Either a schedule or an as-of date is required")
+
+    # Rate each team by its latest labeled tiers as of the ratings season
+    ratings_year = args.year if args.ratings_year is None \
+        else args.ratings_year
+    labeled_years = [
+        year for year in get_years("labeled") if year <= ratings_year
+    ]
+    if len(labeled_years) == 0:
+        raise Exception(f"No labeled season as of {ratings_year}")
+    tiers = SeasonProjection.get_tiers(
+        read_json(get_workspace_path("labeled", f"{labeled_years[-1]}.json"))
+    )
+    models = ScoreModels.from_json(
+        README_SCORE_MODELS if args.models is None else read_json(args.models)
+    )
+
+    # Simulate the rest of the season & summarize the standings
+    projection = SeasonProjection(played, remaining, tiers, models)
+    result = projection.simulate(
+        n_replicates=args.replicates, n_workers=args.workers, seed=args.seed
+    )
+    print(
+        f"Simulated {len(remaining)} remaining games " + \
+        f"{args.replicates} times, rated by {labeled_years[-1]} tiers"
+    )
+    print(pandas.DataFrame(result.get_rows(args.top)).to_string(
+        index=False, float_format=lambda x: f"{x:.3f}"
+    ))
+    if args.file is not None:
+        write_output_json(result, args.file)
+
+def ingest_boxscores(args: argparse.Namespace) -> None:
+    """
+    Execute the boxscore ingest subcommand
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    output = args.output if args.output is not None \
+        else get_workspace_path("raw")
+    total = 0
+    for year, count in ingest_season_pages(
+            args.directory, output, args.years, args.compress, args.workers
+        ):
+        print(f"Ingested {count} box scores for {year}")
+        total += count
+    print(f"Ingested {total} box scores into {output}")
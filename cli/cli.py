@@ -1,5 +1,56 @@
 import argparse
-from typing import Type
+from typing import List, Type
+
+def get_non_negative_int(value: str) -> int:
+    """
+    Parses an integer CLI arg which can't be negative
+
+    Args:
+    value (str): The arg's text
+
+    Returns:
+    int: The parsed integer
+    """
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not an integer")
+    if parsed < 0:
+        raise argparse.ArgumentTypeError(f"{value} is negative")
+    return parsed
+
+def get_positive_int(value: str) -> int:
+    """
+    Parses an integer CLI arg which must be at least 1
+
+    Args:
+    value (str): The arg's text
+
+    Returns:
+    int: The parsed integer
+    """
+    parsed = get_non_negative_int(value)
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"{value} is less than 1")
+    return parsed
+
+def get_positive_float(value: str) -> float:
+    """
+    Parses a numeric CLI arg which must be greater than 0
+
+    Args:
+    value (str): The arg's text
+
+    Returns:
+    float: The parsed number
+    """
+    try:
+        parsed = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not a number")
+    if not parsed > 0:
+        raise argparse.ArgumentTypeError(f"{value} is not positive")
+    return parsed
 
 def set_labeled_subcommand(
         subparser: Type[argparse.ArgumentParser]
@@ -25,6 +76,14 @@ def set_labeled_subcommand(
         "skill-diff-scores",
         help="Aggregate the scores by skill differential"
     )
+    labeled_sds_subparser.add_argument(
+        "--compress",
+        dest="compress",
+        help="Compress the written data with gzip, the default, or zstd",
+        type=str,
+        nargs="?",
+        const="gzip"
+    )
 
     # Initialize the labeled skill-diff-scores subcommand parser
     labeled_sdsumm_subparser = labeled_subparser.add_parser(
@@ -45,6 +104,14 @@ def set_labeled_subcommand(
         action="store_true",
         default=False
     )
+    labeled_sdsumm_subparser.add_argument(
+        "--compress",
+        dest="compress",
+        help="Compress the written data with gzip, the default, or zstd",
+        type=str,
+        nargs="?",
+        const="gzip"
+    )
 
     # Initialize the labeled skill-diff-visualize subcommand parser
     labeled_sdvis_subparser = labeled_subparser.add_parser(
@@ -97,6 +164,168 @@ def set_labeled_subcommand(
         action="store_true",
         default=False
     )
+
+    # Initialize the labeled bootstrap subcommand parser
+    bootstrap_subparser = labeled_subparser.add_parser(
+        "bootstrap",
+        help="Bootstrap confidence intervals for the score regression models"
+    )
+    bootstrap_subparser.add_argument(
+        "--away",
+        dest="away",
+        help="Whether to bootstrap using away scores only",
+        action="store_true",
+        default=False
+    )
+    bootstrap_subparser.add_argument(
+        "-r", "--replicates",
+        dest="replicates",
+        help="The number of bootstrap replicates, at least 1",
+        type=get_positive_int,
+        default=2000
+    )
+    bootstrap_subparser.add_argument(
+        "-j", "--workers",
+        dest="workers",
+        help="The number of worker processes",
+        type=int
+    )
+    bootstrap_subparser.add_argument(
+        "-c", "--confidence",
+        dest="confidence",
+        help="The confidence level of the intervals",
+        type=float,
+        default=0.95
+    )
+    bootstrap_subparser.add_argument(
+        "-s", "--seed",
+        dest="seed",
+        help="The random seed",
+        type=int,
+        default=0
+    )
+    bootstrap_subparser.add_argument(
+        "-f", "--file",
+        dest="file",
+        help="The file in which to write the intervals as JSON",
+        type=str
+    )
+
+    # Initialize the labeled sample subcommand parser
+    sample_subparser = labeled_subparser.add_parser(
+        "sample",
+        help="Sample box scores from the empirical score distributions"
+    )
+    sample_subparser.add_argument(
+        "-n", "--count",
+        dest="count",
+        help="The number of box scores to sample",
+        type=int,
+        default=1000000
+    )
+    sample_subparser.add_argument(
+        "--joint",
+        dest="joint",
+        help="Whether to sample home & away scores jointly",
+        action="store_true",
+        default=False
+    )
+    sample_subparser.add_argument(
+        "-s", "--seed",
+        dest="seed",
+        help="The random seed",
+        type=int,
+        default=0
+    )
+    sample_subparser.add_argument(
+        "-f", "--file",
+        dest="file",
+        help="The file in which to write the score frequencies as JSON",
+        type=str
+    )
+
+    # Initialize the labeled joint subcommand parser
+    joint_subparser = labeled_subparser.add_parser(
+        "joint",
+        help="Summarize the joint home/away score distribution per skill pair"
+    )
+    joint_subparser.add_argument(
+        "--start-year",
+        dest="start_year",
+        help="The first season to build from",
+        type=int
+    )
+    joint_subparser.add_argument(
+        "--end-year",
+        dest="end_year",
+        help="The last season to build from",
+        type=int
+    )
+    joint_subparser.add_argument(
+        "--bandwidth",
+        dest="bandwidth",
+        help="The std in points of the kernel to smooth scores with",
+        type=float,
+        default=0.0
+    )
+    joint_subparser.add_argument(
+        "--prior",
+        dest="prior",
+        help="The pseudo-games of the pooled distribution to add per pair",
+        type=float,
+        default=0.0
+    )
+    joint_subparser.add_argument(
+        "-k", "--margin",
+        dest="margin",
+        help="The margin of victory whose probability to summarize",
+        type=int,
+        default=7
+    )
+    joint_subparser.add_argument(
+        "-f", "--file",
+        dest="file",
+        help="The file in which to write the joint distributions as JSON",
+        type=str
+    )
+
+    # Initialize the labeled fit-models subcommand parser
+    fit_subparser = labeled_subparser.add_parser(
+        "fit-models",
+        help="Fit all four score regression models from the labeled games"
+    )
+    fit_subparser.add_argument(
+        "--start-year",
+        dest="start_year",
+        help="The first season to fit on",
+        type=int
+    )
+    fit_subparser.add_argument(
+        "--end-year",
+        dest="end_year",
+        help="The last season to fit on",
+        type=int
+    )
+    fit_subparser.add_argument(
+        "--training",
+        dest="training",
+        help="Whether to fit on the aggregated training games only",
+        action="store_true",
+        default=False
+    )
+    fit_subparser.add_argument(
+        "--unweighted",
+        dest="unweighted",
+        help="Whether to weight every skill differential equally",
+        action="store_true",
+        default=False
+    )
+    fit_subparser.add_argument(
+        "-f", "--file",
+        dest="file",
+        help="The file in which to write the model coefficients as JSON",
+        type=str
+    )
     return subparser
 
 def set_boxscore_subcommand(
@@ -136,13 +365,71 @@ def set_boxscore_subcommand(
         help="The team for which to list box scores",
         type=str
     )
+    boxscore_list_parser.add_argument(
+        "--opponent",
+        dest="opponent",
+        help="The opponent against which to list box scores",
+        type=str
+    )
+    boxscore_list_parser.add_argument(
+        "--start-date",
+        dest="start_date",
+        help="The first date from which to list box scores, as MM/DD/YYYY",
+        type=str
+    )
+    boxscore_list_parser.add_argument(
+        "--end-date",
+        dest="end_date",
+        help="The last date from which to list box scores, as MM/DD/YYYY",
+        type=str
+    )
+    boxscore_list_parser.add_argument(
+        "--min-total",
+        dest="min_total",
+        help="The minimum combined score of the listed box scores",
+        type=int
+    )
+    boxscore_list_parser.add_argument(
+        "--margin-gt",
+        dest="margin_gt",
+        help="The margin of victory the listed box scores must exceed",
+        type=int
+    )
+    boxscore_list_parser.add_argument(
+        "--ties",
+        dest="tie",
+        help="Whether to list ties only",
+        action="store_const",
+        const=True
+    )
+    boxscore_list_parser.add_argument(
+        "--no-ties",
+        dest="tie",
+        help="Whether to exclude ties",
+        action="store_const",
+        const=False
+    )
     boxscore_list_parser.add_argument(
         "-o", "--output",
         dest="output",
-        help="The format in which to list the box scores",
+        help="The format in which to list the box scores: " + \
+            "default, json, table, csv, tsv or jsonl",
         type=str,
         default="default"
     )
+    boxscore_list_parser.add_argument(
+        "-l", "--limit",
+        dest="limit",
+        help="The maximum number of rows to output",
+        type=get_non_negative_int
+    )
+    boxscore_list_parser.add_argument(
+        "--offset",
+        dest="offset",
+        help="The number of leading rows to skip",
+        type=get_non_negative_int,
+        default=0
+    )
     boxscore_list_parser.add_argument(
         "-f", "--file",
         dest="file",
@@ -184,10 +471,24 @@ def set_boxscore_subcommand(
     boxscore_summarize_parser.add_argument(
         "-o", "--output",
         dest="output",
-        help="The format in which to summarize the box scores",
+        help="The format in which to summarize the box scores: " + \
+            "default, json, table, csv, tsv or jsonl",
         type=str,
         default="default"
     )
+    boxscore_summarize_parser.add_argument(
+        "-l", "--limit",
+        dest="limit",
+        help="The maximum number of rows to output",
+        type=get_non_negative_int
+    )
+    boxscore_summarize_parser.add_argument(
+        "--offset",
+        dest="offset",
+        help="The number of leading rows to skip",
+        type=get_non_negative_int,
+        default=0
+    )
     boxscore_summarize_parser.add_argument(
         "-f", "--file",
         dest="file",
@@ -195,6 +496,44 @@ def set_boxscore_subcommand(
         type=str
     )
 
+    # Initialize the boxscore weekly subcommand parser
+    boxscore_weekly_parser = boxscore_subparser.add_parser(
+        "weekly",
+        help="Summarize historic box scores by week of the season"
+    )
+    boxscore_weekly_parser.add_argument(
+        "--start-year",
+        dest="start_year",
+        help="The first season to summarize",
+        type=int
+    )
+    boxscore_weekly_parser.add_argument(
+        "--end-year",
+        dest="end_year",
+        help="The last season to summarize",
+        type=int
+    )
+    boxscore_weekly_parser.add_argument(
+        "--start-week",
+        dest="start_week",
+        help="The first week of each season to summarize",
+        type=int,
+        default=1
+    )
+    boxscore_weekly_parser.add_argument(
+        "--end-week",
+        dest="end_week",
+        help="The last week of each season to summarize",
+        type=int,
+        default=63
+    )
+    boxscore_weekly_parser.add_argument(
+        "-m", "--month",
+        dest="month",
+        help="The calendar month of each season to summarize",
+        type=int
+    )
+
     # Initialize the boxscore visualize subcommand parser
     boxscore_visualize_parser = boxscore_subparser.add_parser(
         "visualize",
@@ -214,24 +553,133 @@ def set_boxscore_subcommand(
         action="store_true",
         default=False
     )
+    boxscore_visualize_parser.add_argument(
+        "--max-points",
+        dest="max_points",
+        help="The most team-seasons to plot, sampled at random beyond it",
+        type=int
+    )
+    boxscore_visualize_parser.add_argument(
+        "--hexbin",
+        dest="hexbin",
+        help="Whether to plot a hexbin of the team-seasons rather than points",
+        action="store_true",
+        default=False
+    )
+
+    # Initialize the boxscore cluster subcommand parser
+    boxscore_cluster_parser = boxscore_subparser.add_parser(
+        "cluster",
+        help="Cluster historic offense & defense summaries into skill tiers"
+    )
+    boxscore_cluster_parser.add_argument(
+        "--offense",
+        dest="offense",
+        help="Whether to cluster only offense",
+        action="store_true",
+        default=False
+    )
+    boxscore_cluster_parser.add_argument(
+        "--defense",
+        dest="defense",
+        help="Whether to cluster only defense",
+        action="store_true",
+        default=False
+    )
+    boxscore_cluster_parser.add_argument(
+        "--refit",
+        dest="refit",
+        help="Whether to refit even if the persisted clustering is current",
+        action="store_true",
+        default=False
+    )
 
     # Initialize the boxscore label subcommand parser
     boxscore_label_parser = boxscore_subparser.add_parser(
         "label",
         help="Label historic box scores"
     )
+    boxscore_label_parser.add_argument(
+        "-r", "--ratings",
+        dest="ratings",
+        help="The ratings to label with: kmeans, incremental or massey",
+        type=str,
+        default="kmeans"
+    )
+    boxscore_label_parser.add_argument(
+        "--compress",
+        dest="compress",
+        help="Compress the written data with gzip, the default, or zstd",
+        type=str,
+        nargs="?",
+        const="gzip"
+    )
+
+    # Initialize the boxscore rate subcommand parser
+    boxscore_rate_parser = boxscore_subparser.add_parser(
+        "rate",
+        help="Update the incremental team ratings with any new box scores"
+    )
+    boxscore_rate_parser.add_argument(
+        "--reset",
+        dest="reset",
+        help="Whether to rate all of history from scratch",
+        action="store_true",
+        default=False
+    )
+
+    # Initialize the boxscore massey subcommand parser
+    boxscore_massey_parser = boxscore_subparser.add_parser(
+        "massey",
+        help="Solve schedule-adjusted least-squares team ratings"
+    )
+    boxscore_massey_parser.add_argument(
+        "-y", "--year",
+        dest="year",
+        help="The season for which to print ratings, defaults to the latest",
+        type=int
+    )
+    boxscore_massey_parser.add_argument(
+        "--ridge",
+        dest="ridge",
+        help="The ridge penalty on the ratings, in pseudo-games",
+        type=get_positive_float,
+        default=1.0
+    )
+    boxscore_massey_parser.add_argument(
+        "-f", "--file",
+        dest="file",
+        help="The file in which to write every season's ratings as JSON",
+        type=str
+    )
 
     # Initialize the boxscore aggregate subcommand parser
     boxscore_aggregate_parser = boxscore_subparser.add_parser(
         "aggregate",
         help="Aggregate labeled historic box scores"
     )
+    boxscore_aggregate_parser.add_argument(
+        "--compress",
+        dest="compress",
+        help="Compress the written data with gzip, the default, or zstd",
+        type=str,
+        nargs="?",
+        const="gzip"
+    )
 
     # Initialize the boxscore frequency subcommand parser
     boxscore_frequency_parser = boxscore_subparser.add_parser(
         "frequency",
         help="Get the frequency of historic box scores"
     )
+    boxscore_frequency_parser.add_argument(
+        "--compress",
+        dest="compress",
+        help="Compress the written data with gzip, the default, or zstd",
+        type=str,
+        nargs="?",
+        const="gzip"
+    )
 
     # Initialize the boxscore model-frequency subcommand parser
     boxscore_model_frequency_parser = boxscore_subparser.add_parser(
@@ -256,25 +704,297 @@ def set_boxscore_subcommand(
         "tie-frequency-by-skill",
         help="Get the frequency of historic ties"
     )
+
+    # Initialize the boxscore head-to-head subcommand parser
+    boxscore_head_to_head_parser = boxscore_subparser.add_parser(
+        "head-to-head",
+        help="Summarize a team's games against each of its opponents"
+    )
+    boxscore_head_to_head_parser.add_argument(
+        "-t", "--team",
+        dest="team",
+        help="The team for which to summarize games against each opponent",
+        type=str,
+        required=True
+    )
+    boxscore_head_to_head_parser.add_argument(
+        "-y", "--year",
+        dest="year",
+        help="The season to summarize, defaults to the franchise's history",
+        type=int
+    )
+
+    # Initialize the boxscore index subcommand parser
+    boxscore_index_parser = boxscore_subparser.add_parser(
+        "index",
+        help="Write the per-season game hash indexes alongside the data"
+    )
+    boxscore_index_parser.add_argument(
+        "-k", "--kind",
+        dest="kind",
+        help="The kind of season files to index, either raw or labeled",
+        type=str,
+        default="raw"
+    )
+
+    # Initialize the boxscore diff subcommand parser
+    boxscore_diff_parser = boxscore_subparser.add_parser(
+        "diff",
+        help="Compare two versions of a dataset through their hash indexes"
+    )
+    boxscore_diff_parser.add_argument(
+        "old",
+        help="The data directory of the old version, e.g. a backup of ./data",
+        type=str
+    )
+    boxscore_diff_parser.add_argument(
+        "--new",
+        dest="new",
+        help="The data directory of the new version, defaults to the " + \
+            "workspace's",
+        type=str,
+        default=None
+    )
+    boxscore_diff_parser.add_argument(
+        "-k", "--kind",
+        dest="kind",
+        help="The kind of season files to compare, either raw or labeled",
+        type=str,
+        default="raw"
+    )
+    boxscore_diff_parser.add_argument(
+        "-f", "--file",
+        dest="file",
+        help="The file in which to write the differences as JSON",
+        type=str
+    )
+
+    # Initialize the boxscore export subcommand parser
+    boxscore_export_parser = boxscore_subparser.add_parser(
+        "export",
+        help="Export the datasets as typed Arrow IPC or Parquet files"
+    )
+    boxscore_export_parser.add_argument(
+        "-t", "--tier",
+        dest="tier",
+        help="The dataset tier to export: raw, labeled, processed or " + \
+            "preprocessed, defaults to every tier",
+        type=str
+    )
+    boxscore_export_parser.add_argument(
+        "--format",
+        dest="format",
+        help="The export format: arrow or parquet",
+        type=str,
+        default="arrow"
+    )
+    boxscore_export_parser.add_argument(
+        "-d", "--directory",
+        dest="directory",
+        help="The directory in which to write the exported datasets, " + \
+            "defaults to the workspace's export directory",
+        type=str,
+        default=None
+    )
+
+    # Initialize the boxscore project subcommand parser
+    boxscore_project_parser = boxscore_subparser.add_parser(
+        "project",
+        help="Simulate the rest of a season into win & standings odds"
+    )
+    boxscore_project_parser.add_argument(
+        "-y", "--year",
+        dest="year",
+        help="The season to project",
+        type=int,
+        required=True
+    )
+    boxscore_project_parser.add_argument(
+        "--schedule",
+        dest="schedule",
+        help="A JSON list of the remaining games' home & away teams",
+        type=str
+    )
+    boxscore_project_parser.add_argument(
+        "--as-of",
+        dest="as_of",
+        help="Project from this MM/DD/YYYY date, the season's later games " + \
+            "being the remaining schedule",
+        type=str
+    )
+    boxscore_project_parser.add_argument(
+        "--ratings-year",
+        dest="ratings_year",
+        help="The labeled season whose tiers rate teams, defaults to the year",
+        type=int
+    )
+    boxscore_project_parser.add_argument(
+        "--models",
+        dest="models",
+        help="A JSON file of fitted score models, defaults to the README's",
+        type=str
+    )
+    boxscore_project_parser.add_argument(
+        "-r", "--replicates",
+        dest="replicates",
+        help="The number of simulated seasons, at least 1",
+        type=get_positive_int,
+        default=20000
+    )
+    boxscore_project_parser.add_argument(
+        "-j", "--workers",
+        dest="workers",
+        help="The number of worker processes",
+        type=int
+    )
+    boxscore_project_parser.add_argument(
+        "-s", "--seed",
+        dest="seed",
+        help="The random seed",
+        type=int,
+        default=0
+    )
+    boxscore_project_parser.add_argument(
+        "--top",
+        dest="top",
+        help="The number of leading standings positions to total odds of",
+        type=int,
+        default=7
+    )
+    boxscore_project_parser.add_argument(
+        "-f", "--file",
+        dest="file",
+        help="The file in which to write the projected distributions as JSON",
+        type=str
+    )
+
+    # Initialize the boxscore ingest subcommand parser
+    boxscore_ingest_parser = boxscore_subparser.add_parser(
+        "ingest",
+        help="Parse saved season pages, e.g. 2023.html, into raw season files"
+    )
+    boxscore_ingest_parser.add_argument(
+        "directory",
+        help="The directory of saved season pages",
+        type=str
+    )
+    boxscore_ingest_parser.add_argument(
+        "-o", "--output",
+        dest="output",
+        help="The directory in which to write the season files, " + \
+            "defaults to the workspace's raw directory",
+        type=str,
+        default=None
+    )
+    boxscore_ingest_parser.add_argument(
+        "-y", "--years",
+        dest="years",
+        help="The seasons to ingest, defaults to every saved page",
+        type=int,
+        nargs="+"
+    )
+    boxscore_ingest_parser.add_argument(
+        "-j", "--workers",
+        dest="workers",
+        help="The number of worker processes",
+        type=int
+    )
+    boxscore_ingest_parser.add_argument(
+        "--compress",
+        dest="compress",
+        help="Compress the written data with gzip, the default, or zstd",
+        type=str,
+        nargs="?",
+        const="gzip"
+    )
+    return subparser
+
+def set_batch_subcommand(
+        subparser: Type[argparse.ArgumentParser]
+    ) -> Type[argparse.ArgumentParser]:
+    """
+    Adds the batch subcommand parser & specifies its arguments
+
+    Args:
+    subparser (argparse.ArgumentParser): The subparsers on the parent parser
+
+    Returns:
+    argparse.ArgumentParser: The mutated argument parser
+    """
+    # Initialize the batch subcommand parser
+    batch_parser = subparser.add_parser(
+        "batch",
+        help="Run a file of commands in one process, passing the data " + \
+            "files earlier commands write to later ones in memory"
+    )
+    batch_parser.add_argument(
+        "file",
+        help="The file of commands, one per line as they would be " + \
+            "passed to main.py, e.g. boxscore aggregate; blank lines " + \
+            "& lines starting with # are skipped",
+        type=str
+    )
+    batch_parser.add_argument(
+        "--in-memory",
+        dest="in_memory",
+        help="Keep the data files the commands write in memory only, " + \
+            "rather than also writing them to disk",
+        action="store_true",
+        default=False
+    )
     return subparser
 
-def get_cli_args() -> Type[argparse.Namespace]:
+def get_cli_parser() -> Type[argparse.ArgumentParser]:
     """
-    Parse the CLI args and return as an argparse naespace
+    Builds the CLI's argument parser, through which bad args are reported
 
     Args:
     None
 
     Returns:
-    argparse.Namespace: The parsed CLI args
+    argparse.ArgumentParser: The CLI's argument parser
     """
     # Initialize the parent command parser and add subparsers
     parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-w", "--workspace",
+        dest="workspaces",
+        help="The root directory of a workspace to run in, e.g. one " + \
+            "league's data, repeatable, defaults to ./data",
+        type=str,
+        action="append"
+    )
+    parser.add_argument(
+        "--workspaces-root",
+        dest="workspaces_root",
+        help="A directory of workspaces to run in, each subdirectory " + \
+            "with a raw directory being one",
+        type=str
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        dest="jobs",
+        help="The number of workspaces to run in at once, defaults to " + \
+            "the CPUs",
+        type=int
+    )
     subparsers = parser.add_subparsers(dest="command")
 
     # Add the boxscore subcommand to the parent parser
     subparsers = set_boxscore_subcommand(subparsers)
     subparsers = set_labeled_subcommand(subparsers)
+    subparsers = set_batch_subcommand(subparsers)
+
+    return parser
 
-    # Parse the CLI args and return
-    return parser.parse_args()
+def get_cli_args(argv: List[str] = None) -> Type[argparse.Namespace]:
+    """
+    Parse the CLI args and return as an argparse naespace
+
+    Args:
+    argv (list): The args to parse, defaults to the process's
+
+    Returns:
+    argparse.Namespace: The parsed CLI args
+    """
+    return get_cli_parser().parse_args(argv)
@@ -1,16 +1,27 @@
 import argparse
-import json
 import matplotlib.pyplot
+import numpy
 import pandas
+from boxscore.bootstrap import bootstrap_score_models, get_skill_diff_games
+from boxscore.boxscore import LabeledBoxScore
+from boxscore.joint import JointScoreDistribution
+from boxscore.loader import get_years, load_labeled_columns
+from boxscore.models import ScoreModelAccumulator
+from boxscore.plotting import get_grouped_counts, plot_box_counts
+from boxscore.sampler import ScoreSampler, get_skill_diffs
+from boxscore.skill import SKILL_DIFF_OFFSET, SKILL_DIFF_BINS
+from boxscore.storage import read_json, write_json
+from boxscore.workspace import get_workspace_path
+from cli.render import write_output_json
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
+from typing import Dict
 
-def get_skill_differential_score_summary() -> None:
+def get_skill_differential_score_summary(args: argparse.Namespace) -> None:
     """
     Compute the scoring summary for each skill differential
     """
-    with open("./data/processed/training.json") as training_data:
-        scores = json.load(training_data)
+    scores = read_json(get_workspace_path("processed", "training.json"))
     summaries = []
     for score in scores:
         # Calculate the differentials for each team
@@ -26,8 +37,11 @@ def get_skill_differential_score_summary() -> None:
             "score": score["away_score"],
             "is_home": False
         })
-    with open("./data/preprocessed/skill_diff_scores.json", "w") as skill_diff_data:
-        skill_diff_data.write(json.dumps(summaries, indent=4))
+    write_json(
+        summaries,
+        get_workspace_path("preprocessed", "skill_diff_scores.json"),
+        args.compress
+    )
 
 def summarize_skill_differential_score_summary(
         args: argparse.Namespace
@@ -35,9 +49,11 @@ def summarize_skill_differential_score_summary(
     """
     Summarize the scoring for each skill differential
     """
-    with open("./data/preprocessed/testing_skill_diff_scores.json") as skill_diff_data:
-        skill_diffs = json.load(skill_diff_data)
-    diff_df = pandas.read_json(json.dumps(skill_diffs))
+    diff_df = pandas.DataFrame(
+        read_json(get_workspace_path(
+            "preprocessed", "testing_skill_diff_scores.json"
+        ))
+    )
     diff_df["offense_defense_differential"] = (diff_df["offense_defense_differential"] + 4) / 8
     dest_filename = ""
     if args.home:
@@ -55,8 +71,28 @@ def summarize_skill_differential_score_summary(
             "std_score": summary.iloc[i][2]
         }
         summaries.append(summary_dict)
-    with open(f"./data/preprocessed/testing_{dest_filename}.json", "w") as out_data:
-        out_data.write(json.dumps(summaries, indent=4))
+    write_json(
+        summaries,
+        get_workspace_path("preprocessed", f"testing_{dest_filename}.json"),
+        args.compress
+    )
+
+def get_skill_differential_scores() -> Dict[str, numpy.ndarray]:
+    """
+    Load the per-side skill differential scores as columnar arrays
+    """
+    scores = read_json(get_workspace_path(
+        "preprocessed", "skill_diff_scores.json"
+    ))
+    return {
+        "diff": numpy.array([
+            s["offense_defense_differential"] for s in scores
+        ], dtype=numpy.int64),
+        "score": numpy.array([
+            s["score"] for s in scores
+        ], dtype=numpy.int64),
+        "is_home": numpy.array([ s["is_home"] for s in scores ], dtype=bool)
+    }
 
 def visualize_skill_differential_score_summary(
         args: argparse.Namespace
@@ -64,17 +100,24 @@ def visualize_skill_differential_score_summary(
     """
     Visualize the scoring for each skill differential
     """
-    with open("./data/preprocessed/skill_diff_scores.json") as skill_diff_data:
-        skill_diffs = json.load(skill_diff_data)
-    diff_df = pandas.read_json(json.dumps(skill_diffs))
+    scores = get_skill_differential_scores()
     title = "Score summaries by offense-defense skill differential"
+    keep = numpy.ones(len(scores["score"]), dtype=bool)
     if args.home:
-        diff_df = diff_df.query("is_home == True")
+        keep = scores["is_home"]
         title += " (home offenses only)"
     elif args.away:
-        diff_df = diff_df.query("is_home == False")
+        keep = ~scores["is_home"]
         title += " (away offenses only)"
-    ax = diff_df.boxplot(column="score", by="offense_defense_differential")
+    counts = get_grouped_counts(
+        scores["diff"][keep] + SKILL_DIFF_OFFSET,
+        scores["score"][keep],
+        SKILL_DIFF_BINS
+    )
+    ax = matplotlib.pyplot.gca()
+    plot_box_counts(ax, counts, [
+        str(diff - SKILL_DIFF_OFFSET) for diff in range(SKILL_DIFF_BINS)
+    ])
     ax.set_title(title)
     ax.set_xlabel("Offense-defense skill differential")
     ax.set_ylabel("Scoring summaries")
@@ -84,10 +127,12 @@ def visualize_home_away_score_summary() -> None:
     """
     Visualize the scoring for home teams versus away teams
     """
-    with open("./data/preprocessed/skill_diff_scores.json") as skill_diff_data:
-        skill_diffs = json.load(skill_diff_data)
-    diff_df = pandas.read_json(json.dumps(skill_diffs))
-    ax = diff_df.boxplot(column="score", by="is_home")
+    scores = get_skill_differential_scores()
+    counts = get_grouped_counts(
+        scores["is_home"].astype(numpy.int64), scores["score"], 2
+    )
+    ax = matplotlib.pyplot.gca()
+    plot_box_counts(ax, counts, [ "Away", "Home" ])
     ax.set_title("Score summaries for home versus away teams")
     ax.set_xlabel("Home/away")
     ax.set_ylabel("Scoring summaries")
@@ -101,7 +146,11 @@ def train_mean_score_regression_model(args: argparse.Namespace) -> None:
     filename_prefix = "home"
     if args.away:
         filename_prefix = "away"
-    summ_df = pandas.read_json(f"./data/preprocessed/{filename_prefix}.json")
+    summ_df = pandas.DataFrame(
+        read_json(get_workspace_path(
+            "preprocessed", f"{filename_prefix}.json"
+        ))
+    )
 
     # Train a linear regression model for the mean scores
     mean_model = LinearRegression()
@@ -109,7 +158,11 @@ def train_mean_score_regression_model(args: argparse.Namespace) -> None:
     print(f"y = {mean_model.coef_}x + {mean_model.intercept_}")
 
     # Test the linear regression model using the test data
-    test_df = pandas.read_json(f"./data/preprocessed/testing_{filename_prefix}.json")
+    test_df = pandas.DataFrame(
+        read_json(get_workspace_path(
+            "preprocessed", f"testing_{filename_prefix}.json"
+        ))
+    )
     y_pred = mean_model.predict(test_df[["norm_diff"]])
     ax = matplotlib.pyplot.gca()
     ax.set_title(f"Mean {filename_prefix} score over normalized skill differential (linreg)")
@@ -127,7 +180,11 @@ def train_std_score_regression_model(args: argparse.Namespace) -> None:
     filename_prefix = "home"
     if args.away:
         filename_prefix = "away"
-    summ_df = pandas.read_json(f"./data/preprocessed/{filename_prefix}.json")
+    summ_df = pandas.DataFrame(
+        read_json(get_workspace_path(
+            "preprocessed", f"{filename_prefix}.json"
+        ))
+    )
 
     # Train a linear regression model for the score stdev
     pf = PolynomialFeatures(degree=2)
@@ -139,7 +196,11 @@ def train_std_score_regression_model(args: argparse.Namespace) -> None:
     print(f"intr: {std_model.intercept_}")
 
     # Test the linear regression model using the test data
-    test_df = pandas.read_json(f"./data/preprocessed/testing_{filename_prefix}.json")
+    test_df = pandas.DataFrame(
+        read_json(get_workspace_path(
+            "preprocessed", f"testing_{filename_prefix}.json"
+        ))
+    )
     y_pred = std_model.predict(pf.fit_transform(test_df[["norm_diff"]]))
     matplotlib.pyplot.scatter(summ_df[["norm_diff"]], summ_df[["std_score"]], color='g')
     matplotlib.pyplot.plot(summ_df[["norm_diff"]], y_pred, color='b')
@@ -147,3 +208,110 @@ def train_std_score_regression_model(args: argparse.Namespace) -> None:
     matplotlib.pyplot.xlabel('Normalized skill differential (offense versus defense)')
     matplotlib.pyplot.ylabel(f'Standard deviation of {filename_prefix} score')
     matplotlib.pyplot.show()
+
+def bootstrap_score_regression_models(args: argparse.Namespace) -> None:
+    """
+    Bootstrap confidence intervals & out-of-bag error for the mean and std
+    score regression models by resampling the training games
+    """
+    games = read_json(get_workspace_path("processed", "training.json"))
+    bins, scores = get_skill_diff_games(games, away=args.away)
+    result = bootstrap_score_models(
+        bins,
+        scores,
+        n_replicates=args.replicates,
+        n_workers=args.workers,
+        confidence=args.confidence,
+        seed=args.seed
+    )
+    print(result)
+    if args.file is not None:
+        write_output_json(result, args.file)
+
+def sample_box_score_frequency(args: argparse.Namespace) -> None:
+    """
+    Sample box scores from the empirical score distributions of the
+    training games and report the frequency of each sampled score
+    """
+    games = read_json(get_workspace_path("processed", "training.json"))
+    sampler = ScoreSampler.from_games(games, joint=args.joint)
+
+    # Draw skill differentials from the training games, then their scores
+    rng = numpy.random.default_rng(args.seed)
+    home_diffs, away_diffs = get_skill_diffs(games)
+    picks = rng.integers(0, len(games), size=args.count)
+    home_scores, away_scores = sampler.sample_box_scores(
+        home_diffs[picks], away_diffs[picks], rng
+    )
+
+    # Tally the frequency of each score, as in real_frequency.json
+    counts = numpy.bincount(
+        numpy.concatenate([ home_scores, away_scores ]),
+        minlength=sampler.n_scores
+    )
+    frequencies = [
+        {
+            "score": score,
+            "count": int(count),
+            "frequency": f"{100 * count / counts.sum():.4f}%"
+        }
+        for score, count in enumerate(counts)
+    ]
+    ties = float((home_scores == away_scores).mean())
+    print(f"Sampled {args.count} box scores, tie probability {ties:.4f}")
+    if args.file is not None:
+        write_output_json(frequencies, args.file)
+    else:
+        print(pandas.DataFrame(frequencies).to_string(index=False))
+
+def fit_score_regression_models(args: argparse.Namespace) -> None:
+    """
+    Fit the mean & std score regression models of both sides in one pass
+    over the labeled games, without any intermediate summary files
+    """
+    accumulator = ScoreModelAccumulator()
+    if args.training:
+        accumulator.add_games(LabeledBoxScore.from_json_list(
+            read_json(get_workspace_path("processed", "training.json"))
+        ))
+    else:
+        years = get_years("labeled")
+        if args.start_year is not None:
+            years = [ year for year in years if year >= args.start_year ]
+        if args.end_year is not None:
+            years = [ year for year in years if year <= args.end_year ]
+        accumulator.add_columns(load_labeled_columns(years))
+    models = accumulator.solve(weighted=not args.unweighted)
+    print(models)
+    if args.file is not None:
+        write_output_json(models, args.file)
+
+def summarize_joint_score_distribution(args: argparse.Namespace) -> None:
+    """
+    Build the joint home/away score distribution of each pair of skill
+    differentials and summarize its win, tie & margin probabilities
+    """
+    years = get_years("labeled")
+    if args.start_year is not None:
+        years = [ year for year in years if year >= args.start_year ]
+    if args.end_year is not None:
+        years = [ year for year in years if year <= args.end_year ]
+    joint = JointScoreDistribution.from_columns(
+        load_labeled_columns(years), args.bandwidth, args.prior
+    )
+    home_diffs, away_diffs = numpy.divmod(
+        numpy.arange(SKILL_DIFF_BINS ** 2), SKILL_DIFF_BINS
+    )
+    dataframe = pandas.DataFrame({
+        "home_diff": home_diffs - SKILL_DIFF_OFFSET,
+        "away_diff": away_diffs - SKILL_DIFF_OFFSET,
+        "games": joint.games.astype(int),
+        "home_win": joint.get_margin_probability(home_diffs, away_diffs, 1),
+        "tie": joint.get_tie_probability(home_diffs, away_diffs),
+        f"margin_{args.margin}": joint.get_margin_probability(
+            home_diffs, away_diffs, args.margin, absolute=True
+        )
+    })
+    print(dataframe[dataframe["games"] > 0].to_string(index=False))
+    if args.file is not None:
+        write_output_json(joint, args.file)
@@ -0,0 +1,210 @@
+import contextlib
+import csv
+import itertools
+import json
+import sys
+from boxscore.storage import evict_cached, \
+                             get_compression, \
+                             holds_writes_in_memory, \
+                             open_data, \
+                             write_json
+from typing import Dict, Any, ContextManager, Iterable, Iterator, TextIO
+
+# The output formats which are rendered incrementally, row by row
+STREAMING_FORMATS = [ "table", "csv", "tsv", "jsonl" ]
+
+# The number of rows buffered to size the columns of a fixed-width table
+TABLE_SAMPLE_ROWS = 256
+
+def open_output(file: str = None) -> ContextManager[TextIO]:
+    """
+    Opens the CLI output stream, either a file, compressed according to its
+    extension, or stdout. Text written to a file can't go through the data
+    cache, so it replaces any cached copy of the file and is refused while a
+    batch holds its writes in memory.
+
+    Args:
+    file (str): The file to write to, or None for stdout
+
+    Returns:
+    ContextManager: The context in which the output stream is open
+    """
+    if file is not None:
+        if holds_writes_in_memory():
+            raise Exception(
+                f"Can't hold {file} in memory, only JSON output files, " + \
+                "run the batch without --in-memory"
+            )
+        evict_cached(file)
+        return open_data(file, "w")
+    return contextlib.nullcontext(sys.stdout)
+
+def write_output_json(obj: Any, file: str) -> None:
+    """
+    Writes a command's JSON output file, compressed according to its
+    extension, through the data cache so that later commands of a batch
+    read it back
+
+    Args:
+    obj (Any): The JSON-serializable output
+    file (str): The file to write to
+
+    Returns:
+    None
+    """
+    write_json(obj, file, get_compression(file))
+
+def flatten_row(row: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Flattens nested dicts in a row into prefixed columns
+
+    Args:
+    row (dict): The row, possibly holding nested dicts
+    prefix (str): The prefix of the row's columns
+
+    Returns:
+    dict: The flattened row
+    """
+    flat = {}
+    for key, value in row.items():
+        if isinstance(value, dict):
+            flat.update(flatten_row(value, f"{prefix}{key}_"))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+def format_cell(value: Any) -> str:
+    """
+    Formats a single cell of a fixed-width table
+
+    Args:
+    value (Any): The cell value
+
+    Returns:
+    str: The formatted cell
+    """
+    if value is None:
+        return "NaN"
+    if isinstance(value, float):
+        return f"{value:.6f}".rstrip("0").rstrip(".")
+    return str(value)
+
+def write_table(rows: Iterator[Dict[str, Any]], out: TextIO) -> None:
+    """
+    Writes rows as a fixed-width table. The column widths are sized from a
+    bounded sample of the first rows, and wider values later on simply push
+    their row out of alignment rather than being buffered.
+
+    Args:
+    rows (Iterator): The flat rows to write
+    out (TextIO): The stream to write to
+
+    Returns:
+    None
+    """
+    sample = list(itertools.islice(rows, TABLE_SAMPLE_ROWS))
+    if len(sample) == 0:
+        return
+    columns = list(sample[0].keys())
+    widths = [
+        max(
+            [ len(column) ] + \
+            [ len(format_cell(row.get(column))) for row in sample ]
+        )
+        for column in columns
+    ]
+    out.write("  ".join(
+        column.rjust(width) for column, width in zip(columns, widths)
+    ) + "\n")
+    for row in itertools.chain(sample, rows):
+        out.write("  ".join(
+            format_cell(row.get(column)).rjust(width)
+            for column, width in zip(columns, widths)
+        ) + "\n")
+
+def write_delimited(
+        rows: Iterator[Dict[str, Any]], out: TextIO, delimiter: str
+    ) -> None:
+    """
+    Writes rows as delimiter-separated values with a header row
+
+    Args:
+    rows (Iterator): The flat rows to write
+    out (TextIO): The stream to write to
+    delimiter (str): The delimiter, e.g. a comma or a tab
+
+    Returns:
+    None
+    """
+    writer = None
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(
+                out,
+                fieldnames=list(row.keys()),
+                delimiter=delimiter,
+                extrasaction="ignore",
+                lineterminator="\n"
+            )
+            writer.writeheader()
+        writer.writerow(row)
+
+def write_json_lines(rows: Iterator[Dict[str, Any]], out: TextIO) -> None:
+    """
+    Writes rows as JSON Lines, one JSON object per line
+
+    Args:
+    rows (Iterator): The rows to write
+    out (TextIO): The stream to write to
+
+    Returns:
+    None
+    """
+    for row in rows:
+        out.write(json.dumps(row) + "\n")
+
+def slice_rows(
+        rows: Iterable[Any], limit: int = None, offset: int = 0
+    ) -> Iterator[Any]:
+    """
+    Lazily skips the leading rows and stops after the limit, so that every
+    output format pages its rows the same way
+
+    Args:
+    rows (Iterable): The rows, possibly lazily generated
+    limit (int): The maximum number of rows to keep, or None for all
+    offset (int): The number of leading rows to skip
+
+    Returns:
+    Iterator: The kept rows
+    """
+    stop = None if limit is None else (offset or 0) + limit
+    return itertools.islice(rows, offset or 0, stop)
+
+def render_rows(
+        rows: Iterable[Dict[str, Any]], out: TextIO, output: str
+    ) -> None:
+    """
+    Renders rows to a stream incrementally, so that only a bounded number of
+    rows is ever held in memory
+
+    Args:
+    rows (Iterable): The rows to render, possibly lazily generated
+    out (TextIO): The stream to write to
+    output (str): The output format, one of table, csv, tsv or jsonl
+
+    Returns:
+    None
+    """
+    if output == "jsonl":
+        write_json_lines(rows, out)
+        return
+    rows = ( flatten_row(row) for row in rows )
+    if output == "table":
+        write_table(rows, out)
+    elif output == "csv":
+        write_delimited(rows, out, ",")
+    elif output == "tsv":
+        write_delimited(rows, out, "\t")
+    else:
+        raise Exception(f"Unrecognized output format {output}")
@@ -1,25 +1,47 @@
 import argparse
+import shlex
+from boxscore.storage   import  set_data_cache
+from boxscore.workspace import  Workspace, \
+                                find_workspaces, \
+                                set_workspace, \
+                                run_in_workspaces
 from cli.boxscore   import  list_boxscores, \
                             summarize_boxscores, \
+                            weekly_boxscores, \
                             visualize_boxscores, \
+                            cluster_boxscores, \
+                            rate_boxscores, \
+                            massey_boxscores, \
                             label_boxscores, \
                             aggregate_boxscores, \
                             boxscore_frequency, \
                             boxscore_model_frequency, \
                             boxscore_model_freq_mse, \
                             boxscore_tie_frequency, \
-                            boxscore_tie_frequency_by_skill
-from cli.cli        import  get_cli_args
+                            boxscore_tie_frequency_by_skill, \
+                            export_boxscores, \
+                            head_to_head_boxscores, \
+                            index_boxscores, \
+                            diff_boxscores, \
+                            project_boxscores, \
+                            ingest_boxscores
+from cli.cli        import  get_cli_args, \
+                            get_cli_parser
 from cli.labeled    import  get_skill_differential_score_summary, \
                             summarize_skill_differential_score_summary, \
                             visualize_skill_differential_score_summary, \
                             visualize_home_away_score_summary, \
                             train_mean_score_regression_model, \
-                            train_std_score_regression_model
+                            train_std_score_regression_model, \
+                            bootstrap_score_regression_models, \
+                            sample_box_score_frequency, \
+                            fit_score_regression_models, \
+                            summarize_joint_score_distribution
 
-def main(args: argparse.Namespace) -> None:
+def run_command(args: argparse.Namespace) -> None:
     """
-    Execute the football database box score EDA CLI
+    Execute a football database box score EDA CLI command in the current
+    workspace
 
     Args:
     args (argparse.Namespace): The CLI args
@@ -32,8 +54,16 @@ def main(args: argparse.Namespace) -> None:
             list_boxscores(args)
         elif args.subcommand == "summarize":
             summarize_boxscores(args)
+        elif args.subcommand == "weekly":
+            weekly_boxscores(args)
         elif args.subcommand == "visualize":
             visualize_boxscores(args)
+        elif args.subcommand == "cluster":
+            cluster_boxscores(args)
+        elif args.subcommand == "rate":
+            rate_boxscores(args)
+        elif args.subcommand == "massey":
+            massey_boxscores(args)
         elif args.subcommand == "label":
             label_boxscores(args)
         elif args.subcommand == "aggregate":
@@ -48,13 +78,27 @@ def main(args: argparse.Namespace) -> None:
             boxscore_tie_frequency(args)
         elif args.subcommand == "tie-frequency-by-skill":
             boxscore_tie_frequency_by_skill(args)
+        elif args.subcommand == "head-to-head":
+            head_to_head_boxscores(args)
+        elif args.subcommand == "index":
+            index_boxscores(args)
+        elif args.subcommand == "diff":
+            diff_boxscores(args)
+        elif args.subcommand == "export":
+            export_boxscores(args)
+        elif args.subcommand == "project":
+            project_boxscores(args)
+        elif args.subcommand == "ingest":
+            ingest_boxscores(args)
         else:
             raise Exception(
                 f"Unrecognized boxscore subcommand {args.subcommand}"
             )
+    elif args.command == "batch":
+        run_batch(args)
     elif args.command == "labeled":
         if args.subcommand == "skill-diff-scores":
-            get_skill_differential_score_summary()
+            get_skill_differential_score_summary(args)
         elif args.subcommand == "skill-diff-summary":
             summarize_skill_differential_score_summary(args)
         elif args.subcommand == "skill-diff-visualize":
@@ -65,6 +109,14 @@ def main(args: argparse.Namespace) -> None:
             train_mean_score_regression_model(args)
         elif args.subcommand == "std-score-train":
             train_std_score_regression_model(args)
+        elif args.subcommand == "bootstrap":
+            bootstrap_score_regression_models(args)
+        elif args.subcommand == "sample":
+            sample_box_score_frequency(args)
+        elif args.subcommand == "fit-models":
+            fit_score_regression_models(args)
+        elif args.subcommand == "joint":
+            summarize_joint_score_distribution(args)
         else:
             raise Exception(
                 f"Unrecognized labeled subcommand {args.subcommand}"
@@ -74,5 +126,66 @@ def main(args: argparse.Namespace) -> None:
             f"Unrecognized command {args.command}"
         )
 
+def run_batch(args: argparse.Namespace) -> None:
+    """
+    Execute the batch command, running a file of commands one after another
+    in this process. Every command is parsed before any runs, and the data
+    files each command reads or writes are cached so that later commands
+    reuse them rather than parsing them again.
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    with open(args.file) as batch_data:
+        lines = [
+            line.strip() for line in batch_data
+            if line.strip() != "" and not line.strip().startswith("#")
+        ]
+    steps = []
+    for line in lines:
+        step_args = get_cli_args(shlex.split(line))
+        if step_args.command in [ None, "batch" ]:
+            raise Exception(f"Unrecognized batch command {line}")
+        if step_args.workspaces is not None or \
+                step_args.workspaces_root is not None:
+            raise Exception("Batch commands run in the batch's workspace")
+        steps.append((line, step_args))
+    set_data_cache(True, not args.in_memory)
+    try:
+        for line, step_args in steps:
+            print(f"Running {line}")
+            run_command(step_args)
+    finally:
+        set_data_cache(False)
+
+def main(args: argparse.Namespace) -> None:
+    """
+    Execute the football database box score EDA CLI, in each workspace given
+    concurrently if there are several
+
+    Args:
+    args (argparse.Namespace): The CLI args
+
+    Returns:
+    None
+    """
+    workspaces = [ Workspace(root) for root in args.workspaces or [] ]
+    if args.workspaces_root is not None:
+        workspaces += find_workspaces(args.workspaces_root)
+    if len(workspaces) > 1:
+        run_in_workspaces(workspaces, run_command, args, args.jobs)
+        return
+    if len(workspaces) == 1:
+        set_workspace(workspaces[0])
+    run_command(args)
+
 if __name__ == "__main__":
-    main(get_cli_args())
+    parser = get_cli_parser()
+    try:
+        main(parser.parse_args())
+    except argparse.ArgumentError as e:
+        # Report args found to be bad while running like unparseable ones
+        parser.error(str(e))
@@ -0,0 +1,121 @@
+import json
+import numpy
+import os
+import pytest
+from boxscore.storage import set_data_cache
+from boxscore.workspace import Workspace, set_workspace
+
+# The teams of the synthetic season, each playing every other home & away
+TEAMS = [
+    "Atlanta Falcons", "Buffalo Bills", "Chicago Bears",
+    "Dallas Cowboys", "Denver Broncos", "Green Bay Packers"
+]
+
+# The season of the synthetic box scores
+YEAR = 2023
+
+def get_box_scores(seed: int = 0):
+    """
+    Generates a synthetic season of box scores, in date order
+
+    Args:
+    seed (int): The random seed of the scores
+
+    Returns:
+    list: The box score dicts
+    """
+    rng = numpy.random.default_rng(seed)
+    scores = []
+    for i, (home, away) in enumerate(
+            (home, away) for home in TEAMS for away in TEAMS if home != away
+        ):
+        scores.append({
+            "date": f"{9 + i // 10:02d}/{1 + i % 10 * 2:02d}/{YEAR}",
+            "away_team": away,
+            "away_score": int(rng.integers(0, 40)),
+            "home_team": home,
+            "home_score": int(rng.integers(0, 40))
+        })
+    return scores
+
+def get_labeled_box_scores(seed: int = 0):
+    """
+    Generates a synthetic season of labeled box scores
+
+    Args:
+    seed (int): The random seed of the scores & tiers
+
+    Returns:
+    list: The labeled box score dicts
+    """
+    rng = numpy.random.default_rng(seed)
+    return [
+        {
+            **score,
+            "home_offense": int(rng.integers(1, 6)),
+            "home_defense": int(rng.integers(1, 6)),
+            "away_offense": int(rng.integers(1, 6)),
+            "away_defense": int(rng.integers(1, 6))
+        }
+        for score in get_box_scores(seed)
+    ]
+
+def get_side_summary(seed: int = 0):
+    """
+    Generates a synthetic offense or defense summary of team-seasons, as
+    written by summarize
+
+    Args:
+    seed (int): The random seed of the summaries
+
+    Returns:
+    list: The summary dicts
+    """
+    rng = numpy.random.default_rng(seed)
+    summaries = []
+    for i in range(40):
+        mean = float(rng.uniform(10, 35))
+        summaries.append({
+            "count": 16.0,
+            "mean": mean,
+            "std": 7.0,
+            "min": mean - 10,
+            "25%": mean - 5,
+            "50%": mean + float(rng.normal(0, 2)),
+            "75%": mean + 5,
+            "max": mean + 10,
+            "team": f"{1980 + i} {TEAMS[i % len(TEAMS)]}"
+        })
+    return summaries
+
+def write_file(path: str, obj) -> None:
+    """
+    Writes a JSON file, creating its directory
+
+    Args:
+    path (str): The file
+    obj (Any): The JSON-serializable object
+
+    Returns:
+    None
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as data:
+        json.dump(obj, data, indent=4)
+
+@pytest.fixture
+def workspace(tmp_path):
+    """
+    A synthetic workspace holding one raw & labeled season & the offense and
+    defense summaries, set as the current workspace for the test
+    """
+    root = str(tmp_path / "data")
+    write_file(f"{root}/raw/{YEAR}.json", get_box_scores())
+    write_file(f"{root}/labeled/{YEAR}.json", get_labeled_box_scores())
+    write_file(f"{root}/preprocessed/offense.json", get_side_summary(1))
+    write_file(f"{root}/preprocessed/defense.json", get_side_summary(2))
+    workspace = Workspace(root)
+    set_workspace(workspace)
+    yield workspace
+    set_workspace(Workspace())
+    set_data_cache(False)
@@ -0,0 +1,129 @@
+import numpy
+import pandas
+import pytest
+from boxscore.bootstrap import SKILL_DIFF_BINS, \
+                               bootstrap_score_models, \
+                               fit_score_models, \
+                               get_norm_diffs, \
+                               get_skill_diff_games, \
+                               summarize_bins
+from boxscore.regression import evaluate_polynomial, fit_polynomial
+from cli.cli import get_cli_args
+from conftest import get_labeled_box_scores
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import PolynomialFeatures
+
+def get_games(n: int = 500, seed: int = 0):
+    """
+    Generates the skill differential bin & score of some games
+    """
+    rng = numpy.random.default_rng(seed)
+    bins = rng.integers(0, SKILL_DIFF_BINS, n).astype(numpy.int8)
+    scores = (10 + 2 * bins + rng.integers(0, 20, n)).astype(numpy.int16)
+    return bins, scores
+
+def fit_sklearn(x, y, degree, weights=None):
+    """
+    Fits a polynomial with sklearn, returning its coefficients in ascending
+    powers
+    """
+    features = PolynomialFeatures(degree).fit_transform(x[:, None])
+    model = LinearRegression(fit_intercept=False)
+    model.fit(features, y, sample_weight=weights)
+    return model.coef_
+
+@pytest.mark.parametrize("degree", [ 1, 2 ])
+def test_fit_polynomial_matches_sklearn(degree):
+    rng = numpy.random.default_rng(degree)
+    x = numpy.linspace(0, 1, 9)
+    y = rng.normal(20, 5, (3, 9))
+    weights = rng.integers(1, 50, (3, 9)).astype(float)
+    coef = fit_polynomial(x, y, degree, weights)
+    assert coef.shape == (3, degree + 1)
+    for batch in range(3):
+        numpy.testing.assert_allclose(
+            coef[batch], fit_sklearn(x, y[batch], degree, weights[batch])
+        )
+        numpy.testing.assert_allclose(
+            fit_polynomial(x, y[batch], degree),
+            fit_sklearn(x, y[batch], degree)
+        )
+
+def test_fit_polynomial_ignores_missing_targets():
+    x = numpy.linspace(0, 1, 9)
+    y = 3.0 + 2.0 * x
+    y[[0, 4]] = numpy.nan
+    numpy.testing.assert_allclose(fit_polynomial(x, y, 1), [ 3.0, 2.0 ])
+    numpy.testing.assert_allclose(
+        evaluate_polynomial(numpy.array([ 3.0, 2.0 ]), x), 3.0 + 2.0 * x
+    )
+
+def test_skill_diff_games():
+    games = get_labeled_box_scores()
+    bins, scores = get_skill_diff_games(games, away=True)
+    assert list(bins) == [
+        g["away_offense"] - g["home_defense"] + 4 for g in games
+    ]
+    assert list(scores) == [ g["away_score"] for g in games ]
+
+def test_summarize_bins_matches_repeated_games():
+    bins, scores = get_games(200)
+    weights = numpy.random.default_rng(1).integers(0, 3, (2, len(bins)))
+    count, mean, std = summarize_bins(weights, bins, scores)
+    for replicate in range(2):
+        repeated = pandas.DataFrame({
+            "bin": numpy.repeat(bins, weights[replicate]),
+            "score": numpy.repeat(scores, weights[replicate])
+        }).groupby("bin")["score"]
+        expected = pandas.DataFrame({
+            "count": repeated.count(), "mean": repeated.mean(),
+            "std": repeated.std()
+        }).reindex(range(SKILL_DIFF_BINS))
+        numpy.testing.assert_allclose(
+            count[replicate], expected["count"].fillna(0)
+        )
+        numpy.testing.assert_allclose(mean[replicate], expected["mean"])
+        numpy.testing.assert_allclose(std[replicate], expected["std"])
+
+def test_score_models_fit_bin_summaries():
+    bins, scores = get_games()
+    mean_coef, std_coef = fit_score_models(
+        numpy.ones((1, len(bins))), bins, scores
+    )
+    summary = pandas.DataFrame({ "bin": bins, "score": scores }) \
+        .groupby("bin")["score"].agg([ "mean", "std" ])
+    x = get_norm_diffs()[summary.index]
+    numpy.testing.assert_allclose(
+        mean_coef[0], fit_sklearn(x, summary["mean"].to_numpy(), 1)
+    )
+    numpy.testing.assert_allclose(
+        std_coef[0], fit_sklearn(x, summary["std"].to_numpy(), 2)
+    )
+
+def test_bootstrap_is_reproducible_across_workers():
+    bins, scores = get_games()
+    result = bootstrap_score_models(
+        bins, scores, n_replicates=50, n_workers=1, seed=3, chunk_size=20
+    )
+    again = bootstrap_score_models(
+        bins, scores, n_replicates=50, n_workers=2, seed=3, chunk_size=20
+    )
+    assert len(result.replicates["mean_coef"]) == 50
+    for name in result.replicates:
+        numpy.testing.assert_array_equal(
+            result.replicates[name], again.replicates[name]
+        )
+
+    # The full-data estimates lie within their intervals
+    for name in [ "mean_coef", "std_coef" ]:
+        lower, upper = result.get_interval(name)
+        assert (lower <= result.estimates[name]).all()
+        assert (result.estimates[name] <= upper).all()
+
+def test_bootstrap_requires_a_replicate():
+    bins, scores = get_games(20)
+    with pytest.raises(ValueError):
+        bootstrap_score_models(bins, scores, n_replicates=0)
+    for replicates in [ "0", "-1", "x" ]:
+        with pytest.raises(SystemExit):
+            get_cli_args([ "labeled", "bootstrap", "-r", replicates ])
@@ -0,0 +1,173 @@
+import json
+import math
+import pandas
+import pytest
+from boxscore.boxscore import BoxScoreList, LabeledBoxScore, ScoreSummary
+from conftest import TEAMS, YEAR, get_box_scores, get_labeled_box_scores
+from jsonschema import ValidationError
+
+def get_describe(scores: list) -> dict:
+    """
+    Summarizes scores with pandas, as the summaries were before
+    """
+    return json.loads(pandas.Series(scores, dtype=float).describe().to_json())
+
+def test_score_summaries_match_pandas_describe():
+    for scores in [ [ 17 ], [ 3, 10 ], [ 0, 7, 7, 13, 24, 31, 38, 45, 6 ] ]:
+        obj = ScoreSummary.from_scores(scores).__json__()
+        expected = get_describe(scores)
+        assert list(obj) == list(expected)
+        for name, value in expected.items():
+            if value is None:
+                assert obj[name] is None
+            else:
+                assert obj[name] == pytest.approx(value)
+    empty = ScoreSummary.from_scores([])
+    assert empty.count == 0.0 and math.isnan(empty.mean)
+
+    # Summaries are compact records without an instance dict
+    with pytest.raises(AttributeError):
+        empty.__dict__
+    with pytest.raises(AttributeError):
+        empty.median = 3.0
+
+def test_season_summaries():
+    scores = get_box_scores()
+    summary = BoxScoreList(scores).to_box_score_season(YEAR).summarize()
+    offense = summary.get_offense_summary_json()
+    defense = summary.get_defense_summary_json()
+    assert [ obj["team"] for obj in offense ] == [
+        f"{YEAR} {team}" for team in TEAMS
+    ]
+    for team, offense_obj, defense_obj in zip(TEAMS, offense, defense):
+        points_for = [
+            s["home_score"] if s["home_team"] == team else s["away_score"]
+            for s in scores if team in (s["home_team"], s["away_team"])
+        ]
+        points_against = [
+            s["away_score"] if s["home_team"] == team else s["home_score"]
+            for s in scores if team in (s["home_team"], s["away_team"])
+        ]
+        for obj, points in [
+                (offense_obj, points_for), (defense_obj, points_against)
+            ]:
+            for name, value in get_describe(points).items():
+                assert obj[name] == pytest.approx(value)
+
+def matches(
+        s: dict,
+        team: str = None,
+        opponent: str = None,
+        start: str = None,
+        end: str = None,
+        min_total: int = None,
+        margin_gt: int = None,
+        tie: bool = None
+    ) -> bool:
+    """
+    Evaluates where() predicates on one box score dict by brute force
+    """
+    teams = (s["home_team"], s["away_team"])
+    date = pandas.Timestamp(s["date"])
+    margin = abs(s["home_score"] - s["away_score"])
+    return (team is None or team in teams) and \
+        (opponent is None or opponent in teams) and \
+        (team is None or opponent is None or team != opponent) and \
+        (start is None or date >= pandas.Timestamp(start)) and \
+        (end is None or date <= pandas.Timestamp(end)) and \
+        (min_total is None or \
+            s["home_score"] + s["away_score"] >= min_total) and \
+        (margin_gt is None or margin > margin_gt) and \
+        (tie is None or (margin == 0) == tie)
+
+def test_where_matches_brute_force():
+    scores = get_box_scores(3)
+    scores[4]["away_score"] = scores[4]["home_score"]
+    box_scores = BoxScoreList(scores)
+    queries = [
+        {},
+        { "team": TEAMS[1] },
+        { "opponent": TEAMS[2] },
+        { "team": TEAMS[0], "opponent": TEAMS[3] },
+        { "team": "Nowhere Nobodies" },
+        { "start": f"10/01/{YEAR}", "end": f"10/31/{YEAR}" },
+        { "end": f"09/09/{YEAR}", "min_total": 30 },
+        { "margin_gt": 14, "team": TEAMS[4] },
+        { "tie": True },
+        { "tie": False, "min_total": 40 }
+    ]
+    for query in queries:
+        predicates = dict(query)
+        start, end = predicates.pop("start", None), predicates.pop("end", None)
+        if start is not None or end is not None:
+            predicates["date_between"] = (start, end)
+        expected = [ s for s in scores if matches(s, **query) ]
+        for result in [
+                box_scores.where(**predicates),
+                box_scores.to_box_score_season(YEAR).where(**predicates)
+            ]:
+            assert [ s.score_obj for s in result.score_list ] == expected
+
+            # The view's columns are the matching slices of the original
+            columns = result.get_columns()
+            assert list(columns["home_score"]) == [
+                s["home_score"] for s in expected
+            ]
+            assert [ result.teams[i] for i in columns["away_id"] ] == [
+                s["away_team"] for s in expected
+            ]
+
+def test_take_and_team_scores():
+    scores = get_box_scores()
+    box_scores = BoxScoreList(scores)
+    taken = box_scores.take(box_scores.get_mask(team=TEAMS[2]))
+    assert taken.where(opponent=TEAMS[2]).score_list == taken.score_list
+    assert taken.get_team_scores(TEAMS[2]) == [
+        {
+            "offense": s["home_score"], "defense": s["away_score"]
+        } if s["home_team"] == TEAMS[2] else {
+            "offense": s["away_score"], "defense": s["home_score"]
+        }
+        for s in scores if TEAMS[2] in (s["home_team"], s["away_team"])
+    ]
+
+def test_labeled_box_scores_wrap_their_dicts():
+    scores = get_labeled_box_scores()
+    labeled = LabeledBoxScore.from_json_list(scores)
+    assert [ s.score_obj for s in labeled ] == scores
+    assert labeled[0].score_obj is scores[0]
+    assert labeled[0].__json__() is scores[0]
+    assert (labeled[0].home_offense, labeled[0].away_defense) == (
+        scores[0]["home_offense"], scores[0]["away_defense"]
+    )
+
+    # Labeling a raw box score copies it rather than mutating it
+    score = get_box_scores()[0]
+    relabeled = LabeledBoxScore(score, 1, 2, 3, 4)
+    assert "home_offense" not in score
+    assert relabeled.__json__() == {
+        **score, "home_offense": 1, "home_defense": 2,
+        "away_offense": 3, "away_defense": 4
+    }
+
+def test_labeled_schema_rejects_bad_tiers():
+    for field, value in [
+            ("home_offense", 0), ("away_defense", 6), ("home_defense", 2.5)
+        ]:
+        scores = get_labeled_box_scores()
+        scores[7][field] = value
+        valid, err = LabeledBoxScore.validate_list_static(scores)
+        assert not valid and field in err
+        assert not LabeledBoxScore.validate_static(scores[7])[0]
+        with pytest.raises(ValidationError):
+            LabeledBoxScore.from_json_list(scores)
+        with pytest.raises(ValidationError):
+            LabeledBoxScore.from_json(scores[7])
+
+        # Dicts validated as part of a list skip revalidation
+        assert LabeledBoxScore.from_json(
+            scores[7], check_schema=False
+        ).score_obj is scores[7]
+    extra = { **get_labeled_box_scores()[0], "week": 1 }
+    assert not LabeledBoxScore.validate_static(extra)[0]
+    assert LabeledBoxScore.validate_list_static([])[0]
@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+import os
+import pytest
+from boxscore.rating import RatingEngine
+from boxscore.storage import is_cached, read_json, set_data_cache
+from boxscore.workspace import Workspace, set_workspace
+from cli.cli import get_cli_args
+from conftest import YEAR, TEAMS, get_box_scores, write_file
+from main import run_command
+
+# Every output format of list & summarize
+OUTPUT_FORMATS = [ "default", "json", "table", "csv", "tsv", "jsonl" ]
+
+def run(capsys, argv) -> str:
+    """
+    Runs a CLI command in the current workspace, returning what it printed
+    """
+    capsys.readouterr()
+    run_command(get_cli_args(argv))
+    return capsys.readouterr().out
+
+def get_keys(output: str, format: str, key) -> list:
+    """
+    Extracts a key of each row printed in a format
+    """
+    lines = output.strip("\n").split("\n")
+    if format == "jsonl":
+        return [ key(json.loads(line)) for line in lines ]
+    if format == "json":
+        return [ key(row) for row in json.loads(output) ]
+    if format in [ "csv", "tsv" ]:
+        delimiter = "," if format == "csv" else "\t"
+        return [
+            key(row) for row in csv.DictReader(
+                io.StringIO(output), delimiter=delimiter
+            )
+        ]
+    return lines[1:] if format == "table" else lines
+
+@pytest.mark.parametrize("format", OUTPUT_FORMATS)
+def test_list_limit_offset(workspace, capsys, format):
+    output = run(capsys, [
+        "boxscore", "list", "-y", str(YEAR), "-o", format,
+        "-l", "2", "--offset", "3"
+    ])
+    expected = get_box_scores()[3:5]
+    rows = get_keys(output, format, lambda row: row["home_team"])
+    assert len(rows) == 2
+    if format in [ "default", "table" ]:
+        for row, score in zip(rows, expected):
+            assert score["home_team"] in row and score["away_team"] in row
+    else:
+        assert rows == [ score["home_team"] for score in expected ]
+
+@pytest.mark.parametrize("format", OUTPUT_FORMATS)
+def test_summarize_limit_offset(workspace, capsys, format):
+    everything = run(capsys, [
+        "boxscore", "summarize", "-y", str(YEAR), "-o", "jsonl"
+    ])
+    teams = get_keys(everything, "jsonl", lambda row: row["team"])
+    assert len(teams) == len(TEAMS)
+    output = run(capsys, [
+        "boxscore", "summarize", "-y", str(YEAR), "-o", format,
+        "-l", "2", "--offset", "1"
+    ])
+    if format in [ "default", "table" ]:
+        shown = [ team for team in teams if team in output ]
+    else:
+        shown = get_keys(output, format, lambda row: row["team"])
+    assert shown == teams[1:3]
+
+def test_batch_in_memory_read_after_write(workspace, capsys, tmp_path):
+    batch_path = str(tmp_path / "batch.txt")
+    with open(batch_path, "w") as batch:
+        batch.write("\n".join([
+            "# Split the labeled games, then summarize the training split",
+            "boxscore aggregate",
+            "",
+            "labeled skill-diff-scores",
+            "boxscore frequency"
+        ]))
+    output = run(capsys, [ "batch", "--in-memory", batch_path ])
+    assert output.count("Running ") == 3
+
+    # The later steps read what the earlier ones wrote, none of it on disk
+    assert not os.path.exists(workspace.get_path("processed"))
+    for name in [ "skill_diff_scores.json", "frequency.json" ]:
+        assert not os.path.exists(workspace.get_path("preprocessed", name))
+
+def test_batch_writes_through_by_default(workspace, capsys, tmp_path):
+    batch_path = str(tmp_path / "batch.txt")
+    with open(batch_path, "w") as batch:
+        batch.write("boxscore aggregate\nlabeled skill-diff-scores\n")
+    os.makedirs(workspace.get_path("processed"))
+    run(capsys, [ "batch", batch_path ])
+    games = []
+    for split in [ "training", "validation", "testing" ]:
+        with open(workspace.get_path("processed", f"{split}.json")) as data:
+            games += json.load(data)
+    assert len(games) == len(get_box_scores())
+    with open(
+            workspace.get_path("preprocessed", "skill_diff_scores.json")
+        ) as data:
+        assert len(json.load(data)) > 0
+
+def test_batch_rejects_unknown_commands(workspace, tmp_path):
+    batch_path = str(tmp_path / "batch.txt")
+    with open(batch_path, "w") as batch:
+        batch.write("boxscore aggregate\nbatch other.txt\n")
+    with pytest.raises(Exception, match="Unrecognized batch command"):
+        run_command(get_cli_args([ "batch", batch_path ]))
+    assert not os.path.exists(workspace.get_path("processed"))
+
+def test_batch_in_memory_holds_json_output_files(workspace, capsys, tmp_path):
+    batch_path = str(tmp_path / "batch.txt")
+    offense_path = workspace.get_path("preprocessed", "offense.json")
+    with open(batch_path, "w") as batch:
+        batch.write(
+            "boxscore summarize -o json --offense -f " + offense_path + \
+            "\nboxscore cluster --refit\n"
+        )
+    with open(offense_path) as data:
+        before = data.read()
+    run(capsys, [ "batch", "--in-memory", batch_path ])
+    with open(offense_path) as data:
+        assert data.read() == before
+    assert not os.path.exists(
+        workspace.get_path("preprocessed", "offense_clusters.json")
+    )
+
+def test_batch_in_memory_rejects_text_output_files(workspace, tmp_path):
+    batch_path = str(tmp_path / "batch.txt")
+    csv_path = str(tmp_path / "scores.csv")
+    with open(batch_path, "w") as batch:
+        batch.write(f"boxscore list -y {YEAR} -o csv -f {csv_path}\n")
+    with pytest.raises(Exception, match="without --in-memory"):
+        run_command(get_cli_args([ "batch", "--in-memory", batch_path ]))
+    assert not os.path.exists(csv_path)
+
+def test_output_files_replace_cached_copies(workspace, capsys):
+    offense_path = workspace.get_path("preprocessed", "offense.json")
+    set_data_cache(True)
+    stale = read_json(offense_path)
+    run(capsys, [
+        "boxscore", "summarize", "-o", "json", "--offense",
+        "-f", offense_path
+    ])
+    fresh = read_json(offense_path)
+    assert fresh != stale
+    assert len(fresh) == len(TEAMS)
+    with open(offense_path) as data:
+        assert json.load(data) == fresh
+
+    # Text output can't be cached, so it drops the cached copy
+    run(capsys, [
+        "boxscore", "list", "-y", str(YEAR), "-o", "csv", "-f", offense_path
+    ])
+    assert not is_cached(offense_path)
+
+def test_rate_empty_workspace(tmp_path, capsys):
+    set_workspace(Workspace(str(tmp_path / "empty")))
+    try:
+        output = run(capsys, [ "boxscore", "rate" ])
+    finally:
+        set_workspace(Workspace())
+    assert output == "No box scores to rate\n"
+
+def test_rate_resumes_state_without_ratings(workspace, capsys):
+    state_path = workspace.get_path("state", "ratings.json")
+    write_file(state_path, {
+        **RatingEngine().__json__(), "last_date": f"{YEAR - 1}-12-31"
+    })
+    output = run(capsys, [ "boxscore", "rate" ])
+    assert f"Rated {len(get_box_scores())} new games" in output
+    assert len(read_json(state_path)["ratings"]) == len(TEAMS)
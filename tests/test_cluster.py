@@ -0,0 +1,52 @@
+import os
+from boxscore.cluster import SkillClustering
+from boxscore.storage import read_json, write_json
+from conftest import get_side_summary
+
+def tamper_cache(workspace) -> str:
+    """
+    Marks the persisted offense clustering, keeping its input hash, so that
+    a load which reuses it can be told apart from a refit
+    """
+    cache_path = workspace.get_path("preprocessed", "offense_clusters.json")
+    cached = read_json(cache_path)
+    cached["centroids"] = [ -1.0 ] * len(cached["centroids"])
+    write_json(cached, cache_path)
+    return cache_path
+
+def test_cache_reused_while_summary_unchanged(workspace):
+    fitted = SkillClustering.load_or_fit("offense")
+    assert os.path.exists(
+        workspace.get_path("preprocessed", "offense_clusters.json")
+    )
+    tamper_cache(workspace)
+    loaded = SkillClustering.load_or_fit("offense")
+    assert list(loaded.centroids) == [ -1.0 ] * len(fitted.centroids)
+    assert loaded.tiers == fitted.tiers
+
+def test_cache_invalidated_by_changed_summary(workspace):
+    fitted = SkillClustering.load_or_fit("offense")
+    tamper_cache(workspace)
+    write_json(
+        get_side_summary(3), workspace.get_path("preprocessed", "offense.json")
+    )
+    refitted = SkillClustering.load_or_fit("offense")
+    assert refitted.input_hash != fitted.input_hash
+    assert -1.0 not in list(refitted.centroids)
+    assert read_json(
+        workspace.get_path("preprocessed", "offense_clusters.json")
+    )["input_hash"] == refitted.input_hash
+
+def test_cache_ignored_on_refit(workspace):
+    SkillClustering.load_or_fit("offense")
+    tamper_cache(workspace)
+    refitted = SkillClustering.load_or_fit("offense", refit=True)
+    assert -1.0 not in list(refitted.centroids)
+
+def test_cache_survives_compressing_the_summary(workspace):
+    SkillClustering.load_or_fit("offense")
+    tamper_cache(workspace)
+    summary_path = workspace.get_path("preprocessed", "offense.json")
+    write_json(read_json(summary_path), summary_path, "gzip")
+    loaded = SkillClustering.load_or_fit("offense")
+    assert -1.0 in list(loaded.centroids)
@@ -0,0 +1,91 @@
+import numpy
+import pandas
+from boxscore.dates import DateIndex, \
+                           get_date_seasons, \
+                           get_weeks, \
+                           parse_dates
+from cli.cli import get_cli_args
+from conftest import YEAR, get_box_scores
+from main import run_command
+
+def get_games(n: int = 400, seed: int = 0):
+    """
+    Generates the seasons & dates of games over three seasons, in no order
+    """
+    rng = numpy.random.default_rng(seed)
+    seasons = rng.integers(YEAR - 2, YEAR + 1, n).astype(numpy.int32)
+
+    # Each season runs from early September to early February
+    starts = numpy.array([
+        numpy.datetime64(f"{season}-09-05") for season in seasons
+    ])
+    dates = starts + rng.integers(0, 150, n).astype("timedelta64[D]")
+    return seasons, dates.astype("datetime64[D]")
+
+def test_parse_dates_and_seasons():
+    dates = parse_dates([ "09/10/2023", "12/31/2023", "01/14/2024" ])
+    assert list(dates.astype(str)) == [
+        "2023-09-10", "2023-12-31", "2024-01-14"
+    ]
+    assert list(get_date_seasons(dates)) == [ 2023, 2023, 2023 ]
+
+def test_weeks_start_on_the_tuesday_before_the_first_game():
+    # 2023-09-07 was a Thursday, so week 1 starts Tuesday 2023-09-05
+    dates = parse_dates([
+        "09/07/2023", "09/11/2023", "09/12/2023", "01/07/2024"
+    ])
+    seasons = numpy.full(len(dates), 2023)
+    assert list(get_weeks(seasons, dates)) == [ 1, 1, 2, 18 ]
+
+def test_date_index_queries_match_brute_force():
+    seasons, dates = get_games()
+    index = DateIndex(seasons, dates)
+    frame = pandas.DataFrame({
+        "season": seasons, "date": dates, "week": index.get_weeks()
+    })
+    numpy.testing.assert_array_equal(
+        index.get_weeks(), get_weeks(seasons, dates)
+    )
+
+    def check(selected, expected_mask):
+        # Selections are in date order & hold exactly the matching games
+        assert sorted(selected) == list(numpy.flatnonzero(expected_mask))
+        assert (numpy.diff(dates[selected]) >= numpy.timedelta64(0)).all()
+
+    check(
+        index.seasons_between(YEAR - 1, YEAR),
+        frame["season"].between(YEAR - 1, YEAR)
+    )
+    start, end = numpy.datetime64(f"{YEAR - 1}-11-01"), \
+        numpy.datetime64(f"{YEAR}-01-15")
+    check(
+        index.dates_between(start, end),
+        (frame["date"] >= start) & (frame["date"] <= end)
+    )
+    check(
+        index.weeks_between(3, 5, YEAR - 2, YEAR - 1),
+        frame["week"].between(3, 5) & frame["season"].between(
+            YEAR - 2, YEAR - 1
+        )
+    )
+    check(index.in_month(1), frame["date"].dt.month == 1)
+    check(
+        index.in_month(12, YEAR, YEAR),
+        (frame["date"].dt.month == 12) & (frame["season"] == YEAR)
+    )
+    assert len(index.dates_between(
+        numpy.datetime64("1900-01-01"), numpy.datetime64("1900-12-31")
+    )) == 0
+
+def test_cli_weekly(workspace, capsys):
+    run_command(get_cli_args([
+        "boxscore", "weekly", "--start-week", "1", "--end-week", "2"
+    ]))
+    output = capsys.readouterr().out
+    scores = get_box_scores()
+    seasons = numpy.full(len(scores), YEAR)
+    weeks = get_weeks(seasons, parse_dates([ s["date"] for s in scores ]))
+    rows = [ line.split() for line in output.strip().split("\n")[2:] ]
+    assert [ (int(row[0]), int(row[1])) for row in rows ] == [
+        (week, int((weeks == week).sum())) for week in [ 1, 2 ]
+    ]
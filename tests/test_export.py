@@ -0,0 +1,58 @@
+import pytest
+from boxscore.export import export_tier, read_dataset
+from boxscore.storage import read_json, write_json
+from conftest import YEAR
+
+pytest.importorskip("pyarrow")
+
+def populate_preprocessed(workspace) -> None:
+    """
+    Writes a summary of each shape alongside state which isn't a summary
+    """
+    write_json(
+        { "0": 3, "3": 10, "7": 12 },
+        workspace.get_path("preprocessed", "frequency.json")
+    )
+    write_json(
+        {
+            "('score', 'count')": { "0.0": 10.0, "0.5": 20.0 },
+            "('score', 'mean')": { "0.0": 12.5, "0.5": 21.0 }
+        },
+        workspace.get_path("preprocessed", "skill_diff_summaries.json"),
+        "gzip"
+    )
+    write_json(
+        { "side": "offense", "input_hash": "x", "centroids": [ 1.0 ] },
+        workspace.get_path("preprocessed", "offense_clusters.json")
+    )
+
+def test_preprocessed_round_trip(workspace):
+    populate_preprocessed(workspace)
+    paths = export_tier("preprocessed")
+    names = sorted(path.rsplit("/", 1)[-1] for path in paths)
+    assert names == [
+        "defense", "frequency", "offense", "skill_diff_summaries"
+    ]
+
+    offense = read_dataset("preprocessed", "offense").to_pandas()
+    summaries = read_json(workspace.get_path("preprocessed", "offense.json"))
+    assert list(offense["mean"]) == [ s["mean"] for s in summaries ]
+    assert list(offense["season"]) == [
+        int(s["team"][:4]) for s in summaries
+    ]
+    frequency = read_dataset("preprocessed", "frequency").to_pandas()
+    assert list(frequency["score"]) == [ 0, 3, 7 ]
+    assert list(frequency["count"]) == [ 3, 10, 12 ]
+    diffs = read_dataset("preprocessed", "skill_diff_summaries").to_pandas()
+    assert list(diffs["norm_diff"]) == [ 0.0, 0.5 ]
+    assert list(diffs["mean"]) == [ 12.5, 21.0 ]
+
+def test_partition_exported_in_both_formats_read_once(workspace):
+    export_tier("raw", "arrow")
+    export_tier("raw", "parquet")
+    games = len(read_json(workspace.get_path("raw", f"{YEAR}.json")))
+    assert len(read_dataset("raw")) == games
+    for format in [ "arrow", "parquet" ]:
+        table = read_dataset("raw", format=format)
+        assert len(table) == games
+        assert set(table.column("season").to_pylist()) == { YEAR }
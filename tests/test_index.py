@@ -0,0 +1,78 @@
+import os
+from boxscore.boxscore import BoxScore, LabeledBoxScore
+from boxscore.index import build_season_index, \
+                           diff_datasets, \
+                           diff_season_indexes, \
+                           get_index_path, \
+                           load_season_index
+from boxscore.storage import read_json, write_json
+from conftest import YEAR, get_box_scores, get_labeled_box_scores, write_file
+
+def test_hashes_ignore_formatting_but_not_content():
+    score = get_box_scores()[0]
+    rescraped = {
+        **score,
+        "home_team": f" {score['home_team']} ",
+        "away_team": score["away_team"].replace(" ", "  "),
+        "home_score": str(score["home_score"])
+    }
+    assert BoxScore.get_key_static(rescraped) == \
+        BoxScore.get_key_static(score)
+    assert BoxScore.hash_static(rescraped) == BoxScore.hash_static(score)
+    assert BoxScore.hash_static({
+        **score, "home_score": score["home_score"] + 1
+    }) != BoxScore.hash_static(score)
+
+    # Relabeling a game changes its labeled hash only
+    labeled = get_labeled_box_scores()[0]
+    relabeled = { **labeled, "home_offense": labeled["home_offense"] % 5 + 1 }
+    assert BoxScore.hash_static(relabeled) == BoxScore.hash_static(labeled)
+    assert LabeledBoxScore.hash_static(relabeled) != \
+        LabeledBoxScore.hash_static(labeled)
+    assert build_season_index([ labeled ], "labeled") == [ [
+        BoxScore.get_key_static(labeled), LabeledBoxScore.hash_static(labeled)
+    ] ]
+
+def test_diff_season_indexes():
+    scores = get_box_scores()
+    old = build_season_index(scores[:20])
+    changed = { **scores[5], "away_score": scores[5]["away_score"] + 3 }
+    new = build_season_index(
+        scores[:5] + [ changed ] + scores[7:25] + [ scores[10] ]
+    )
+    key = BoxScore.get_key_static
+    assert diff_season_indexes(old, new) == {
+        "added": [ key(s) for s in scores[20:25] ],
+        "removed": [ key(scores[6]) ],
+        "changed": [ key(scores[5]) ],
+        "duplicates": [ key(scores[10]) ]
+    }
+    assert not any(diff_season_indexes(new, new)[name] for name in [
+        "added", "removed", "changed"
+    ])
+
+def test_diff_datasets(workspace, tmp_path):
+    old_root = str(tmp_path / "old")
+    scores = get_box_scores()
+    write_file(f"{old_root}/raw/{YEAR}.json", scores[1:])
+    write_file(f"{old_root}/raw/{YEAR - 1}.json", scores)
+    diffs = diff_datasets(old_root)
+    assert sorted(diffs) == [ YEAR - 1, YEAR ]
+    assert diffs[YEAR]["added"] == [ BoxScore.get_key_static(scores[0]) ]
+    assert len(diffs[YEAR - 1]["removed"]) == len(scores)
+    assert diff_datasets(old_root, old_root) == {}
+
+def test_index_rebuilt_once_season_is_newer(workspace):
+    season_path = workspace.get_path("raw", f"{YEAR}.json")
+    index = load_season_index(YEAR, write=True)
+    assert len(index) == len(read_json(season_path))
+    index_path = get_index_path(YEAR)
+    assert os.path.exists(index_path)
+
+    # Drop a game & age the index behind the season file
+    write_json(read_json(season_path)[1:], season_path)
+    mtime = os.path.getmtime(season_path)
+    os.utime(index_path, (mtime - 10, mtime - 10))
+    rebuilt = load_season_index(YEAR, write=True)
+    assert rebuilt == index[1:]
+    assert os.path.getmtime(index_path) >= mtime
@@ -0,0 +1,72 @@
+import gzip
+import os
+import pytest
+from boxscore.ingest import format_date, \
+                            ingest_season_pages, \
+                            parse_season_page
+from boxscore.loader import load_season
+from boxscore.storage import read_json
+from cli.cli import get_cli_args
+from conftest import YEAR, get_box_scores
+from main import run_command
+
+def get_page(scores: list, unplayed: int = 0) -> str:
+    """
+    Renders box scores as a saved season page, with abbreviated team names
+    hidden on desktop & unplayed games at the end
+    """
+    rows = "".join(
+        "<tr>"
+        f"<td>Sun {s['date']}</td>"
+        f"<td>{s['away_team']}<span class=\"visible-xs\">AWY</span></td>"
+        f"<td>{s['away_score']}</td>"
+        f"<td><a href=\"#\">{s['home_team']}</a><br/></td>"
+        f"<td>{s['home_score']}</td>"
+        "</tr>"
+        for s in scores
+    ) + "".join(
+        f"<tr><td>Sun 01/0{i + 1}/{YEAR + 1}</td><td>{s['away_team']}</td>"
+        f"<td></td><td>{s['home_team']}</td><td></td></tr>"
+        for i, s in enumerate(scores[:unplayed])
+    )
+    return "<html><body><table>" \
+        "<tr><td>Standings</td></tr>" \
+        "<tr><th>Date</th><th>Visitor</th><th>Pts</th>" \
+        "<th>Home</th><th>Pts</th></tr>" \
+        f"{rows}</table></body></html>"
+
+def test_parse_season_page():
+    scores = get_box_scores()
+    assert parse_season_page(get_page(scores, unplayed=3), YEAR) == scores
+    assert parse_season_page("<table></table>", YEAR) == []
+
+def test_format_date():
+    assert format_date("Sun 9/7/23", YEAR) == f"09/07/{YEAR}"
+    assert format_date("Sun 1/7/24", YEAR) == f"01/07/{YEAR + 1}"
+    assert format_date("Week 1", YEAR) is None
+
+def test_ingest_season_pages(workspace, tmp_path, capsys):
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    (pages / f"{YEAR - 1}.html").write_text(get_page(get_box_scores(1)))
+    with gzip.open(pages / f"{YEAR - 2}.html.gz", "wt") as page:
+        page.write(get_page(get_box_scores(2)))
+    (pages / "notes.html").write_text(get_page(get_box_scores(3)))
+
+    output = str(tmp_path / "raw")
+    ingested = sorted(ingest_season_pages(str(pages), output, workers=2))
+    assert ingested == [ (YEAR - 2, 30), (YEAR - 1, 30) ]
+    assert read_json(f"{output}/{YEAR - 2}.json") == get_box_scores(2)
+
+    # The CLI ingests into the workspace's raw stage by default
+    run_command(get_cli_args([
+        "boxscore", "ingest", str(pages), "-y", str(YEAR - 1),
+        "--compress", "-j", "1"
+    ]))
+    assert "Ingested 30 box scores for" in capsys.readouterr().out
+    path = workspace.get_path("raw", f"{YEAR - 1}.json")
+    assert os.path.exists(f"{path}.gz")
+    assert [ s.score_obj for s in load_season(YEAR - 1).score_list ] == \
+        get_box_scores(1)
+    with pytest.raises(Exception, match="No saved pages"):
+        list(ingest_season_pages(str(pages), output, years=[ YEAR ]))
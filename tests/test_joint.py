@@ -0,0 +1,115 @@
+import json
+import numpy
+import pytest
+from boxscore.joint import JointScoreDistribution
+from boxscore.skill import SKILL_DIFF_BINS, \
+                           SKILL_DIFF_PAIRS, \
+                           get_joint_score_counts, \
+                           get_pair_index, \
+                           get_skill_diff_bins, \
+                           normalize_skill_diffs
+
+def get_columns(n: int = 2000, seed: int = 0):
+    """
+    Generates the score & tier columns of labeled games
+    """
+    rng = numpy.random.default_rng(seed)
+    columns = {
+        field: rng.integers(1, 6, n)
+        for field in [
+            "home_offense", "home_defense", "away_offense", "away_defense"
+        ]
+    }
+    columns["home_score"] = rng.integers(0, 12, n)
+    columns["away_score"] = rng.integers(0, 12, n)
+    return columns
+
+def get_pairs(columns):
+    """
+    Returns each game's home & away skill differential bins
+    """
+    return (
+        columns["home_offense"] - columns["away_defense"] + 4,
+        columns["away_offense"] - columns["home_defense"] + 4
+    )
+
+def test_skill_diff_bins():
+    bins = get_skill_diff_bins([ 1, 5, 3 ], [ 5, 1, 3 ])
+    assert list(bins) == [ 0, SKILL_DIFF_BINS - 1, 4 ]
+    assert list(normalize_skill_diffs(bins)) == [ 0.0, 1.0, 0.5 ]
+    assert list(get_pair_index([ 0, 8 ], [ 8, 0 ])) == [ 8, 72 ]
+    assert SKILL_DIFF_PAIRS == 81
+
+def test_joint_score_counts():
+    columns = get_columns()
+    home_diff, away_diff = get_pairs(columns)
+    counts = get_joint_score_counts(
+        home_diff, away_diff, columns["home_score"], columns["away_score"], 12
+    )
+    expected = numpy.zeros((SKILL_DIFF_PAIRS, 12, 12))
+    numpy.add.at(expected, (
+        home_diff * SKILL_DIFF_BINS + away_diff,
+        columns["home_score"],
+        columns["away_score"]
+    ), 1)
+    numpy.testing.assert_array_equal(counts, expected)
+
+def test_tie_and_margin_probabilities():
+    columns = get_columns()
+    home_diff, away_diff = get_pairs(columns)
+    joint = JointScoreDistribution.from_columns(columns)
+    margin = columns["home_score"] - columns["away_score"]
+    for h, a in [ (4, 4), (2, 6), (8, 0) ]:
+        games = (home_diff == h) & (away_diff == a)
+        if not games.any():
+            continue
+        assert joint.games[h * SKILL_DIFF_BINS + a] == games.sum()
+        assert joint.get_tie_probability([ h ], [ a ])[0] == \
+            pytest.approx((margin[games] == 0).mean())
+        for m in [ -3, 1, 5 ]:
+            assert joint.get_margin_probability([ h ], [ a ], m)[0] == \
+                pytest.approx((margin[games] >= m).mean())
+            assert joint.get_margin_probability(
+                [ h ], [ a ], abs(m), absolute=True
+            )[0] == pytest.approx((numpy.abs(margin[games]) >= abs(m)).mean())
+
+def test_smoothing_and_prior_keep_each_pair_a_distribution():
+    columns = get_columns(300)
+    raw = JointScoreDistribution.from_columns(columns)
+    smoothed = JointScoreDistribution.from_columns(
+        columns, bandwidth=2.0, prior=5.0
+    )
+    numpy.testing.assert_allclose(smoothed.pmfs.sum(axis=(1, 2)), 1.0)
+    numpy.testing.assert_array_equal(smoothed.games, raw.games)
+
+    # Pairs without games fall back onto every game pooled
+    empty = numpy.flatnonzero(raw.games == 0)
+    assert len(empty) > 0
+    pooled = raw.counts.sum(axis=0) / raw.counts.sum()
+    numpy.testing.assert_allclose(raw.pmfs[empty[0]], pooled)
+
+def test_samples_only_seen_score_pairs():
+    columns = get_columns(300)
+    home_diff, away_diff = get_pairs(columns)
+    joint = JointScoreDistribution.from_columns(columns)
+    h, a = home_diff[0], away_diff[0]
+    home, away = joint.sample(
+        numpy.full(500, h), numpy.full(500, a), numpy.random.default_rng(0)
+    )
+    games = (home_diff == h) & (away_diff == a)
+    seen = set(zip(
+        columns["home_score"][games].tolist(),
+        columns["away_score"][games].tolist()
+    ))
+    assert set(zip(home.tolist(), away.tolist())) <= seen
+
+def test_json_summarizes_each_pair():
+    columns = get_columns()
+    obj = json.loads(json.dumps(JointScoreDistribution.from_columns(columns)))
+    assert len(obj["pairs"]) == SKILL_DIFF_PAIRS
+    assert sum(pair["games"] for pair in obj["pairs"]) == 2000
+    for pair in obj["pairs"]:
+        assert sum(pair["margins"].values()) == pytest.approx(1.0)
+        assert pair["home_win"] == pytest.approx(sum(
+            p for m, p in pair["margins"].items() if int(m) > 0
+        ))
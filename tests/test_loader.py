@@ -0,0 +1,67 @@
+import numpy
+import pytest
+from boxscore.loader import get_years, \
+                            load_labeled_columns, \
+                            load_season, \
+                            load_seasons
+from boxscore.storage import write_json
+from conftest import YEAR, get_box_scores, get_labeled_box_scores
+from jsonschema import ValidationError
+
+def write_seasons(workspace, kind: str, years: list) -> None:
+    """
+    Writes a season file of a kind for each year, compressing every other
+    """
+    for i, year in enumerate(years):
+        scores = get_box_scores(year) if kind == "raw" \
+            else get_labeled_box_scores(year)
+        write_json(
+            scores,
+            workspace.get_path(kind, f"{year}.json"),
+            "gzip" if i % 2 else None
+        )
+
+def test_seasons_load_in_year_order(workspace):
+    years = [ YEAR - 3, YEAR - 2, YEAR - 1 ]
+    write_seasons(workspace, "raw", years)
+    assert get_years("raw") == years + [ YEAR ]
+
+    # A small window of loaders still yields every season in order
+    loaded = list(load_seasons(years[::-1] + [ YEAR ], workers=1))
+    assert [ year for year, _ in loaded ] == years[::-1] + [ YEAR ]
+    for year, scores in loaded:
+        assert str(scores) == str(load_season(year))
+        assert [ s.get_home_score() for s in scores.score_list ] == [
+            s["home_score"] for s in get_box_scores(
+                year if year != YEAR else 0
+            )
+        ]
+
+def test_labeled_seasons(workspace):
+    years = [ YEAR - 1, YEAR ]
+    write_seasons(workspace, "labeled", years[:1])
+    loaded = dict(load_seasons(kind="labeled"))
+    assert sorted(loaded) == years
+    assert [ s.home_offense for s in loaded[YEAR] ] == [
+        s["home_offense"] for s in get_labeled_box_scores()
+    ]
+
+    # The columns of every season are stacked in year order
+    columns = load_labeled_columns()
+    games = get_labeled_box_scores(YEAR - 1) + get_labeled_box_scores()
+    for field in [ "home_score", "away_score", "away_defense" ]:
+        numpy.testing.assert_array_equal(
+            columns[field], [ s[field] for s in games ]
+        )
+    assert len(load_labeled_columns([])["home_score"]) == 0
+
+def test_invalid_seasons_are_rejected(workspace):
+    scores = get_labeled_box_scores()
+    del scores[3]["home_offense"]
+    write_json(scores, workspace.get_path("labeled", f"{YEAR}.json"))
+    with pytest.raises(ValidationError):
+        load_labeled_columns()
+    with pytest.raises(ValidationError):
+        load_season(YEAR, "labeled")
+    with pytest.raises(Exception, match="Unrecognized season kind"):
+        get_years("preprocessed")
@@ -0,0 +1,123 @@
+import argparse
+import json
+import numpy
+import pytest
+from boxscore.massey import MasseyRatings
+from boxscore.table import GameTable
+from boxscore.team import TeamDimension
+from cli.cli import get_cli_args
+from conftest import TEAMS, YEAR
+from main import run_command
+
+# A four team league's ratings, centered on zero as the ridge centers them
+OFFENSE = numpy.array([ 3.0, -1.0, -2.0, 0.0 ])
+DEFENSE = numpy.array([ 1.0, 1.0, -2.0, 0.0 ])
+
+def get_league_table(
+        dimension: TeamDimension,
+        season: int,
+        mean: float = 20.0,
+        home_advantage: float = 2.0,
+        offense: numpy.ndarray = OFFENSE,
+        defense: numpy.ndarray = DEFENSE
+    ) -> GameTable:
+    """
+    Builds a double round robin whose scores the ratings explain exactly
+    """
+    ids = [ dimension.intern(season, team) for team in TEAMS[:len(offense)] ]
+    games = [
+        (home, away)
+        for home in range(len(ids)) for away in range(len(ids))
+        if home != away
+    ]
+    return GameTable({
+        "season": [ season ] * len(games),
+        "date": [ f"{season}-09-{1 + i:02d}" for i in range(len(games)) ],
+        "week": [ 1 ] * len(games),
+        "home_id": [ ids[home] for home, _ in games ],
+        "away_id": [ ids[away] for _, away in games ],
+        "home_score": [
+            mean + home_advantage / 2 + offense[home] - defense[away]
+            for home, away in games
+        ],
+        "away_score": [
+            mean - home_advantage / 2 + offense[away] - defense[home]
+            for home, away in games
+        ]
+    })
+
+def test_recovers_a_hand_solved_league():
+    dimension = TeamDimension()
+    table = get_league_table(dimension, YEAR)
+    ratings = MasseyRatings.fit(table, dimension, ridge=1e-6)
+    numpy.testing.assert_allclose(ratings.offense, OFFENSE, atol=1e-3)
+    numpy.testing.assert_allclose(ratings.defense, DEFENSE, atol=1e-3)
+    assert ratings.season_means[YEAR] == pytest.approx(20.0, abs=1e-3)
+    assert ratings.home_advantage == pytest.approx(2.0, abs=1e-3)
+
+def test_ridge_shrinks_ratings_toward_zero():
+    dimension = TeamDimension()
+    table = get_league_table(dimension, YEAR)
+    loose = MasseyRatings.fit(table, dimension, ridge=0.1)
+    tight = MasseyRatings.fit(table, dimension, ridge=10.0)
+    assert numpy.abs(tight.offense).sum() < numpy.abs(loose.offense).sum()
+    assert numpy.abs(loose.offense).sum() < numpy.abs(OFFENSE).sum()
+    numpy.testing.assert_allclose(tight.offense.sum(), 0.0, atol=1e-9)
+
+def test_seasons_decouple():
+    offense = OFFENSE[::-1].copy()
+    dimension = TeamDimension()
+    both = GameTable.concat([
+        get_league_table(dimension, YEAR - 1, 18.0),
+        get_league_table(dimension, YEAR, 24.0, 2.0, offense)
+    ])
+    ratings = MasseyRatings.fit(both, dimension, ridge=1e-6)
+    numpy.testing.assert_allclose(
+        ratings.offense, numpy.concatenate([ OFFENSE, offense ]), atol=1e-3
+    )
+    assert ratings.season_means[YEAR - 1] == pytest.approx(18.0, abs=1e-3)
+    assert ratings.season_means[YEAR] == pytest.approx(24.0, abs=1e-3)
+
+    # Shared ridge-penalized seasons match fitting each on its own
+    ratings = MasseyRatings.fit(both, dimension, ridge=2.0)
+    for season, mean in [ (YEAR - 1, 18.0), (YEAR, 24.0) ]:
+        alone_dimension = TeamDimension()
+        alone = MasseyRatings.fit(
+            get_league_table(
+                alone_dimension, season, mean, 2.0,
+                OFFENSE if season < YEAR else offense
+            ),
+            alone_dimension,
+            ridge=2.0
+        )
+        ids = numpy.flatnonzero(dimension.get_seasons() == season)
+        numpy.testing.assert_allclose(ratings.offense[ids], alone.offense)
+
+def test_game_tiers_and_json():
+    dimension = TeamDimension()
+    table = get_league_table(
+        dimension, YEAR, offense=OFFENSE * 2, defense=DEFENSE * 2
+    )
+    ratings = MasseyRatings.fit(table, dimension, ridge=1e-6)
+    tiers = ratings.get_game_tiers(table)
+    assert tiers.shape == (len(table), 4)
+    assert list(tiers[0]) == [ 5, 4, 2, 4 ]
+    obj = json.loads(json.dumps(ratings))
+    assert obj["season_means"] == { str(YEAR): pytest.approx(20.0, abs=1e-3) }
+    assert obj["ratings"][f"{YEAR} {TEAMS[0]}"]["offense"] == \
+        pytest.approx(6.0, abs=1e-3)
+
+def test_rejects_a_non_positive_ridge():
+    dimension = TeamDimension()
+    table = get_league_table(dimension, YEAR)
+    for ridge in [ 0.0, -1.0 ]:
+        with pytest.raises(ValueError):
+            MasseyRatings.fit(table, dimension, ridge=ridge)
+        with pytest.raises(SystemExit):
+            get_cli_args([ "boxscore", "massey", "--ridge", str(ridge) ])
+
+def test_cli_rejects_a_season_without_ratings(workspace):
+    with pytest.raises(argparse.ArgumentError, match="Season not found"):
+        run_command(get_cli_args([
+            "boxscore", "massey", "-y", str(YEAR - 1)
+        ]))
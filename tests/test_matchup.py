@@ -0,0 +1,109 @@
+import argparse
+import numpy
+import pytest
+from boxscore.boxscore import BoxScoreList
+from boxscore.matchup import MatchupMatrices
+from boxscore.table import GameTable
+from boxscore.team import TeamDimension
+from cli.cli import get_cli_args
+from conftest import TEAMS, YEAR
+from main import run_command
+
+# The games of two seasons, in which the Raiders relocate
+SEASONS = {
+    YEAR - 1: [
+        ("Oakland Raiders", "Denver Broncos", 24, 17),
+        ("Denver Broncos", "Oakland Raiders", 10, 13),
+        ("Denver Broncos", "Chicago Bears", 20, 20)
+    ],
+    YEAR: [
+        ("Las Vegas Raiders", "Denver Broncos", 7, 27),
+        ("Chicago Bears", "Las Vegas Raiders", 30, 3)
+    ]
+}
+
+def get_table(dimension: TeamDimension) -> GameTable:
+    """
+    Builds the game table of both seasons
+    """
+    return GameTable.concat([
+        GameTable.from_box_score_list(BoxScoreList([
+            {
+                "date": f"09/{1 + i:02d}/{season}",
+                "home_team": home,
+                "away_team": away,
+                "home_score": home_score,
+                "away_score": away_score
+            }
+            for i, (home, away, home_score, away_score) in enumerate(games)
+        ]), season, dimension)
+        for season, games in SEASONS.items()
+    ])
+
+def test_team_season_matrices():
+    dimension = TeamDimension()
+    matchups = MatchupMatrices.from_table(get_table(dimension), dimension)
+    raiders = dimension.get_team_id(YEAR - 1, "Oakland Raiders")
+    broncos = dimension.get_team_id(YEAR - 1, "Denver Broncos")
+    assert matchups.get_head_to_head(raiders, broncos) == {
+        "games": 2, "points_for": 37.0, "points_against": 27.0,
+        "margin": 10.0
+    }
+
+    # Each game is seen from both sides
+    games = matchups["games"].toarray()
+    numpy.testing.assert_array_equal(games, games.T)
+    numpy.testing.assert_array_equal(
+        matchups["points_for"].toarray(),
+        matchups["points_against"].T.toarray()
+    )
+    numpy.testing.assert_array_equal(
+        matchups["margin"].toarray(), -matchups["margin"].T.toarray()
+    )
+    assert games.sum() == 2 * sum(len(g) for g in SEASONS.values())
+
+    # Seasons don't meet, and restricting to one keeps its block
+    season = matchups.get_season(dimension, YEAR)
+    ids = numpy.flatnonzero(dimension.get_seasons() == YEAR)
+    numpy.testing.assert_array_equal(
+        season["games"].toarray(), games[ids][:, ids]
+    )
+    old_ids = numpy.flatnonzero(dimension.get_seasons() == YEAR - 1)
+    assert games[ids][:, old_ids].sum() == 0
+
+def test_franchise_matrices_sum_every_season():
+    dimension = TeamDimension()
+    matchups = MatchupMatrices.from_table(
+        get_table(dimension), dimension, franchise=True
+    )
+    raiders = dimension.franchise_ids["Las Vegas Raiders"]
+    broncos = dimension.franchise_ids["Denver Broncos"]
+    assert "Oakland Raiders" not in dimension.franchise_ids
+    assert matchups.get_head_to_head(raiders, broncos) == {
+        "games": 3, "points_for": 44.0, "points_against": 54.0,
+        "margin": -10.0
+    }
+
+def test_opponent_average():
+    dimension = TeamDimension()
+    matchups = MatchupMatrices.from_table(
+        get_table(dimension), dimension, franchise=True
+    )
+    values = numpy.arange(len(dimension.franchises), dtype=float)
+    games = matchups["games"].toarray()
+    expected = games @ values / games.sum(axis=1)
+    numpy.testing.assert_allclose(
+        matchups.get_opponent_average(values), expected
+    )
+
+def test_cli_head_to_head(workspace, capsys):
+    run_command(get_cli_args([
+        "boxscore", "head-to-head", "-t", TEAMS[0], "-y", str(YEAR)
+    ]))
+    output = capsys.readouterr().out
+    for team in TEAMS[1:]:
+        assert team in output
+    with pytest.raises(argparse.ArgumentError, match="Team not found"):
+        run_command(get_cli_args([
+            "boxscore", "head-to-head", "-t", "Nowhere Nobodies"
+        ]))
@@ -0,0 +1,138 @@
+import json
+import numpy
+import pandas
+from boxscore.bootstrap import get_norm_diffs
+from boxscore.boxscore import LabeledBoxScore
+from boxscore.models import README_SCORE_MODELS, \
+                            ScoreModelAccumulator, \
+                            ScoreModels
+from boxscore.regression import evaluate_polynomial
+from conftest import get_labeled_box_scores
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import PolynomialFeatures
+
+def get_columns(n: int = 3000, seed: int = 0):
+    """
+    Generates the score & tier columns of labeled games spanning every
+    skill differential, with scores rising with the differential
+    """
+    rng = numpy.random.default_rng(seed)
+    columns = {
+        field: rng.integers(1, 6, n)
+        for field in [
+            "home_offense", "home_defense", "away_offense", "away_defense"
+        ]
+    }
+    columns["home_score"] = 20 + 3 * (
+        columns["home_offense"] - columns["away_defense"]
+    ) + rng.integers(-10, 10, n)
+    columns["away_score"] = 18 + 3 * (
+        columns["away_offense"] - columns["home_defense"]
+    ) + rng.integers(-10, 10, n)
+    return columns
+
+def get_side_games(columns, away: bool):
+    """
+    Returns the normalized skill differential & score of one side per game
+    """
+    offense, defense, score = "home_offense", "away_defense", "home_score"
+    if away:
+        offense, defense, score = "away_offense", "home_defense", "away_score"
+    bins = columns[offense] - columns[defense] + 4
+    return pandas.DataFrame({
+        "norm_diff": get_norm_diffs()[bins], "score": columns[score]
+    })
+
+def fit_sklearn(x, y, degree, weights=None):
+    """
+    Fits a polynomial with sklearn, returning its coefficients in ascending
+    powers
+    """
+    features = PolynomialFeatures(degree).fit_transform(
+        numpy.asarray(x)[:, None]
+    )
+    model = LinearRegression(fit_intercept=False)
+    model.fit(features, y, sample_weight=weights)
+    return model.coef_
+
+def test_weighted_models_match_per_game_fits():
+    columns = get_columns()
+    accumulator = ScoreModelAccumulator()
+    accumulator.add_columns(columns)
+    models = accumulator.solve()
+    assert models.games == len(columns["home_score"])
+    for side in [ "home", "away" ]:
+        games = get_side_games(columns, side == "away")
+        mean_coef, std_coef = models.coefs[side]
+
+        # Weighting bin means by their counts fits every game
+        numpy.testing.assert_allclose(
+            mean_coef, fit_sklearn(games["norm_diff"], games["score"], 1)
+        )
+        bins = games.groupby("norm_diff")["score"].agg([ "count", "std" ])
+        numpy.testing.assert_allclose(std_coef, fit_sklearn(
+            bins.index, bins["std"], 2, bins["count"] - 1
+        ))
+
+def test_unweighted_models_fit_bin_summaries():
+    columns = get_columns()
+    accumulator = ScoreModelAccumulator()
+    accumulator.add_columns(columns)
+    models = accumulator.solve(weighted=False)
+    for side in [ "home", "away" ]:
+        bins = get_side_games(columns, side == "away") \
+            .groupby("norm_diff")["score"].agg([ "mean", "std" ])
+        mean_coef, std_coef = models.coefs[side]
+        numpy.testing.assert_allclose(
+            mean_coef, fit_sklearn(bins.index, bins["mean"], 1)
+        )
+        numpy.testing.assert_allclose(
+            std_coef, fit_sklearn(bins.index, bins["std"], 2)
+        )
+
+def test_streamed_batches_match_one_pass():
+    columns = get_columns()
+    whole = ScoreModelAccumulator()
+    whole.add_columns(columns)
+    streamed = ScoreModelAccumulator()
+    for start in range(0, len(columns["home_score"]), 700):
+        streamed.add_columns({
+            field: values[start:start + 700]
+            for field, values in columns.items()
+        })
+    for side in [ "home", "away" ]:
+        numpy.testing.assert_allclose(
+            streamed.moments[side], whole.moments[side]
+        )
+
+def test_labeled_games_match_their_columns():
+    games = get_labeled_box_scores()
+    from_games = ScoreModelAccumulator()
+    from_games.add_games([ LabeledBoxScore.from_json(g) for g in games ])
+    from_columns = ScoreModelAccumulator()
+    from_columns.add_columns(LabeledBoxScore.get_columns_static(games))
+    for away in [ False, True ]:
+        count, mean, _ = from_games.get_summary(away)
+        expected = get_side_games(
+            LabeledBoxScore.get_columns_static(games), away
+        ).groupby("norm_diff")["score"].agg([ "count", "mean" ])
+        present = count > 0
+        numpy.testing.assert_allclose(count[present], expected["count"])
+        numpy.testing.assert_allclose(mean[present], expected["mean"])
+        numpy.testing.assert_array_equal(
+            from_columns.get_summary(away)[0], count
+        )
+
+def test_models_round_trip_json():
+    models = ScoreModels.from_json(README_SCORE_MODELS)
+    loaded = ScoreModels.from_json(json.loads(json.dumps(models)))
+    x = get_norm_diffs()
+    for away in [ False, True ]:
+        mean, std = loaded.predict(x, away)
+        side = README_SCORE_MODELS["away" if away else "home"]
+        numpy.testing.assert_allclose(
+            mean, evaluate_polynomial(numpy.array(side["mean_coef"]), x)
+        )
+        numpy.testing.assert_allclose(
+            std, evaluate_polynomial(numpy.array(side["std_coef"]), x)
+        )
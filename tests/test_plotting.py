@@ -0,0 +1,66 @@
+import matplotlib.cbook
+import matplotlib.pyplot
+import numpy
+import pytest
+from boxscore.boxscore import ScoreSummary
+from boxscore.plotting import get_box_stats, \
+                              get_grouped_counts, \
+                              plot_box_counts, \
+                              plot_scatter
+
+def get_scores(n: int = 3000, seed: int = 0):
+    """
+    Generates the group & integer score of many games, with a few outliers
+    """
+    rng = numpy.random.default_rng(seed)
+    groups = rng.integers(0, 4, n)
+    scores = rng.poisson(20 + 3 * groups)
+    scores[:5] = 70
+    return groups, scores
+
+def test_grouped_counts():
+    groups, scores = get_scores()
+    counts = get_grouped_counts(groups, scores, 5)
+    assert counts.shape == (5, scores.max() + 1)
+    for group in range(4):
+        numpy.testing.assert_array_equal(
+            counts[group],
+            numpy.bincount(scores[groups == group], minlength=counts.shape[1])
+        )
+    assert counts[4].sum() == 0
+    assert get_grouped_counts([], [], 2).shape == (2, 1)
+
+def test_summaries_from_counts_match_the_scores():
+    groups, scores = get_scores()
+    counts = get_grouped_counts(groups, scores, 4)
+    for group in range(4):
+        expected = ScoreSummary.from_scores(scores[groups == group])
+        summary = ScoreSummary.from_counts(counts[group])
+        assert summary.__json__() == pytest.approx(expected.__json__())
+
+def test_box_stats_match_matplotlib():
+    groups, scores = get_scores()
+    counts = get_grouped_counts(groups, scores, 4)
+    for group in range(4):
+        stats = get_box_stats(counts[group], str(group))
+        expected = matplotlib.cbook.boxplot_stats(
+            scores[groups == group]
+        )[0]
+        for name in [ "mean", "med", "q1", "q3", "whislo", "whishi" ]:
+            assert stats[name] == pytest.approx(expected[name])
+
+        # Each distinct outlying score is drawn once
+        numpy.testing.assert_array_equal(
+            stats["fliers"], numpy.unique(expected["fliers"])
+        )
+
+def test_plots():
+    groups, scores = get_scores()
+    counts = get_grouped_counts(groups, scores, 5)
+    figure, ax = matplotlib.pyplot.subplots()
+    artists = plot_box_counts(ax, counts, [ "a", "b", "c", "d", "e" ])
+    assert len(artists["boxes"]) == 4
+    scatter = plot_scatter(ax, scores, groups, c=scores, max_points=100)
+    assert len(scatter.get_offsets()) == 100
+    assert len(plot_scatter(ax, scores, groups, hexbin=True).get_array()) > 0
+    matplotlib.pyplot.close(figure)
@@ -0,0 +1,125 @@
+import json
+import numpy
+import pytest
+from boxscore.boxscore import BoxScoreList
+from boxscore.models import ScoreModels
+from boxscore.projection import SeasonProjection
+from cli.cli import get_cli_args
+from conftest import TEAMS, YEAR, get_box_scores
+from main import run_command
+
+def get_models(
+        home_coef: list, away_coef: list, std: float = 0.0
+    ) -> ScoreModels:
+    """
+    Builds linear score models with a constant std, deterministic at zero
+    """
+    return ScoreModels.from_json({
+        "home": { "mean_coef": home_coef, "std_coef": [ std, 0.0, 0.0 ] },
+        "away": { "mean_coef": away_coef, "std_coef": [ std, 0.0, 0.0 ] }
+    })
+
+def split_season(n_played: int):
+    """
+    Splits the synthetic season into its played games & the remaining
+    schedule
+    """
+    scores = get_box_scores()
+    remaining = [
+        { "home_team": s["home_team"], "away_team": s["away_team"] }
+        for s in scores[n_played:]
+    ]
+    return BoxScoreList(scores[:n_played]), remaining, scores[:n_played]
+
+def get_records(played):
+    """
+    Tallies the wins, losses & ties of the played games per team
+    """
+    records = { team: [ 0, 0, 0 ] for team in TEAMS }
+    for s in played:
+        home, away = records[s["home_team"]], records[s["away_team"]]
+        if s["home_score"] > s["away_score"]:
+            home[0], away[1] = home[0] + 1, away[1] + 1
+        elif s["home_score"] < s["away_score"]:
+            home[1], away[0] = home[1] + 1, away[0] + 1
+        else:
+            home[2], away[2] = home[2] + 1, away[2] + 1
+    return records
+
+def test_home_teams_always_winning():
+    played, remaining, played_scores = split_season(12)
+    projection = SeasonProjection(
+        played, remaining, {}, get_models([ 30.0, 0.0 ], [ 10.0, 0.0 ])
+    )
+    result = projection.simulate(n_replicates=20, n_workers=1, chunk_size=8)
+    records = get_records(played_scores)
+    rows = { row["team"]: row for row in result.get_rows() }
+    for i, team in enumerate(projection.teams):
+        wins, losses, ties = records[team]
+        home_games = sum(g["home_team"] == team for g in remaining)
+        assert projection.wins[i] == wins
+        assert projection.losses[i] == losses
+        assert projection.ties[i] == ties
+        assert rows[team]["remaining"] == sum(
+            team in (g["home_team"], g["away_team"]) for g in remaining
+        )
+        assert rows[team]["expected_wins"] == wins + home_games
+        assert result.wins[i, wins + home_games] == 1.0
+    assert numpy.allclose(result.positions.sum(axis=0), 1.0)
+    assert numpy.allclose(result.positions.sum(axis=1), 1.0)
+
+def test_better_tiers_always_winning():
+    played, remaining, _ = split_season(0)
+    tiers = { team: [ 5 - i % 5, 3 ] for i, team in enumerate(TEAMS) }
+    projection = SeasonProjection(
+        played, remaining, tiers, get_models([ 0.0, 40.0 ], [ 0.0, 40.0 ])
+    )
+    result = projection.simulate(n_replicates=10, n_workers=1)
+    for i, team in enumerate(projection.teams):
+        expected = sum(
+            (g["home_team"] == team and \
+                tiers[g["home_team"]][0] > tiers[g["away_team"]][0]) or \
+            (g["away_team"] == team and \
+                tiers[g["away_team"]][0] > tiers[g["home_team"]][0])
+            for g in remaining
+        )
+        assert result.wins[i, expected] == 1.0
+
+def test_simulation_is_reproducible_across_workers():
+    played, remaining, _ = split_season(10)
+    projection = SeasonProjection(
+        played, remaining, {}, get_models([ 21.0, 0.0 ], [ 20.0, 0.0 ], 7.0)
+    )
+    first = projection.simulate(
+        n_replicates=300, n_workers=1, seed=4, chunk_size=100
+    )
+    second = projection.simulate(
+        n_replicates=300, n_workers=2, seed=4, chunk_size=100
+    )
+    numpy.testing.assert_array_equal(first.wins, second.wins)
+    numpy.testing.assert_array_equal(first.positions, second.positions)
+    obj = json.loads(json.dumps(first))
+    assert obj["replicates"] == 300
+    assert sum(obj["teams"][TEAMS[0]]["wins"].values()) == pytest.approx(1.0)
+
+def test_projection_requires_a_replicate():
+    played, remaining, _ = split_season(10)
+    projection = SeasonProjection(
+        played, remaining, {}, get_models([ 21.0, 0.0 ], [ 20.0, 0.0 ])
+    )
+    with pytest.raises(ValueError):
+        projection.simulate(n_replicates=0)
+    with pytest.raises(SystemExit):
+        get_cli_args([ "boxscore", "project", "-y", str(YEAR), "-r", "0" ])
+
+def test_cli_projects_the_rest_of_the_season(workspace, capsys):
+    as_of = get_box_scores()[11]["date"]
+    run_command(get_cli_args([
+        "boxscore", "project", "-y", str(YEAR), "--as-of", as_of,
+        "-r", "50", "-j", "1"
+    ]))
+    output = capsys.readouterr().out
+    n_remaining = len(get_box_scores()) - 12
+    assert f"Simulated {n_remaining} remaining games 50 times" in output
+    for team in TEAMS:
+        assert team in output
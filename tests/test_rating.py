@@ -0,0 +1,67 @@
+import json
+import numpy
+from boxscore.boxscore import BoxScoreList
+from boxscore.rating import NEUTRAL_RATING_TIER, \
+                            RatingEngine, \
+                            get_rating_tiers
+from boxscore.table import GameTable
+from boxscore.team import TeamDimension
+from conftest import YEAR, get_box_scores
+
+def get_game_day_scores():
+    """
+    Returns a season of box scores where several games share each date
+    """
+    scores = get_box_scores()
+    for i, score in enumerate(scores):
+        score["date"] = f"09/{1 + i // 4:02d}/{YEAR}"
+    return scores
+
+def get_table(scores, dimension):
+    """
+    Builds the game table of a season of box score dicts
+    """
+    return GameTable.from_box_score_list(BoxScoreList(scores), YEAR, dimension)
+
+def test_incremental_update_within_a_game_day():
+    scores = get_game_day_scores()
+    dimension = TeamDimension()
+    whole = RatingEngine()
+    whole.process_table(get_table(scores, dimension), dimension)
+
+    # Process the first half of a game day, then the rest of the season
+    dimension = TeamDimension()
+    engine = RatingEngine()
+    engine.process_table(get_table(scores[:6], dimension), dimension)
+    engine = RatingEngine.from_json(json.loads(json.dumps(engine)))
+    ratings = engine.process_table(get_table(scores, dimension), dimension)
+    assert numpy.isnan(ratings[:6, 0]).all()
+    assert not numpy.isnan(ratings[6:, 0]).any()
+    assert engine.ratings == whole.ratings
+    assert engine.mean_score == whole.mean_score
+
+def test_reprocessing_skips_every_game():
+    dimension = TeamDimension()
+    table = get_table(get_game_day_scores(), dimension)
+    engine = RatingEngine()
+    engine.process_table(table, dimension)
+    assert numpy.isnan(engine.process_table(table, dimension)).all()
+
+def test_state_without_game_keys_skips_its_last_date():
+    dimension = TeamDimension()
+    table = get_table(get_game_day_scores(), dimension)
+    engine = RatingEngine()
+    engine.process_table(table, dimension)
+    state = json.loads(json.dumps(engine))
+    del state["last_games"]
+    engine = RatingEngine.from_json(state)
+    assert numpy.isnan(engine.process_table(table, dimension)).all()
+
+def test_rating_tiers():
+    ratings = numpy.array([ -5.0, -2.0, 0.0, 2.0, 5.0 ])
+    assert list(get_rating_tiers(ratings)) == [ 1, 2, 3, 4, 5 ]
+    assert list(get_rating_tiers(
+        numpy.array([ numpy.nan, numpy.inf, -numpy.inf ])
+    )) == [ NEUTRAL_RATING_TIER ] * 3
+    assert int(get_rating_tiers(numpy.nan)) == NEUTRAL_RATING_TIER
+    assert int(get_rating_tiers(4.5)) == 5
@@ -0,0 +1,87 @@
+import numpy
+import pytest
+from boxscore.sampler import AliasTable, ScoreSampler, get_skill_diffs
+from boxscore.skill import SKILL_DIFF_BINS
+from conftest import get_labeled_box_scores
+
+def get_implied_pmfs(table: AliasTable) -> numpy.ndarray:
+    """
+    Returns the exact distribution an alias table draws from, per row
+    """
+    n_rows, n_outcomes = table.prob.shape
+    pmfs = table.prob.copy()
+    for row in range(n_rows):
+        numpy.add.at(pmfs[row], table.alias[row], 1.0 - table.prob[row])
+    return pmfs / n_outcomes
+
+def test_alias_table_draws_its_distributions():
+    rng = numpy.random.default_rng(0)
+    pmfs = rng.integers(0, 10, (6, 12)).astype(float)
+    pmfs[:, 0] += 1
+    table = AliasTable(pmfs)
+    numpy.testing.assert_allclose(
+        get_implied_pmfs(table), pmfs / pmfs.sum(axis=1, keepdims=True)
+    )
+
+def test_alias_table_sample_frequencies():
+    pmf = numpy.array([ 1.0, 2.0, 3.0, 0.0, 4.0 ])
+    table = AliasTable(numpy.vstack([ pmf, pmf[::-1] ]))
+    rng = numpy.random.default_rng(1)
+    n = 200000
+    for row, expected in [ (0, pmf), (1, pmf[::-1]) ]:
+        draws = table.sample(numpy.full(n, row), rng)
+        frequencies = numpy.bincount(draws, minlength=len(pmf)) / n
+        numpy.testing.assert_allclose(
+            frequencies, expected / expected.sum(), atol=0.005
+        )
+        assert frequencies[expected == 0].sum() == 0
+
+def test_alias_table_rejects_an_empty_distribution():
+    with pytest.raises(Exception, match="no mass"):
+        AliasTable([[ 1.0, 1.0 ], [ 0.0, 0.0 ]])
+
+def test_sampler_matches_empirical_scores():
+    games = get_labeled_box_scores()
+    sampler = ScoreSampler.from_games(games)
+    home_diff, away_diff = get_skill_diffs(games)
+    home_score = numpy.array([ g["home_score"] for g in games ])
+    implied = get_implied_pmfs(sampler.marginal)
+    for diff in range(SKILL_DIFF_BINS):
+        scores = home_score[home_diff == diff]
+
+        # Bins without games fall back onto every game's scores
+        if len(scores) == 0:
+            scores = home_score
+        expected = numpy.bincount(scores, minlength=sampler.n_scores)
+        numpy.testing.assert_allclose(
+            implied[diff], expected / expected.sum()
+        )
+
+def test_joint_sampler_draws_seen_score_pairs():
+    games = get_labeled_box_scores()
+    sampler = ScoreSampler.from_games(games, joint=True)
+    home_diff, away_diff = get_skill_diffs(games)
+    rng = numpy.random.default_rng(2)
+    i = 0
+    home, away = sampler.sample_box_scores(
+        numpy.full(1000, home_diff[i]), numpy.full(1000, away_diff[i]), rng
+    )
+    seen = {
+        (g["home_score"], g["away_score"])
+        for g, h, a in zip(games, home_diff, away_diff)
+        if h == home_diff[i] and a == away_diff[i]
+    }
+    assert set(zip(home.tolist(), away.tolist())) == seen
+
+def test_sampling_is_reproducible():
+    sampler = ScoreSampler.from_games(get_labeled_box_scores(), joint=True)
+    diffs = numpy.arange(SKILL_DIFF_BINS)
+    for joint in [ None, sampler.joint ]:
+        sampler.joint = joint
+        first = sampler.sample_box_scores(
+            diffs, diffs[::-1], numpy.random.default_rng(3)
+        )
+        second = sampler.sample_box_scores(
+            diffs, diffs[::-1], numpy.random.default_rng(3)
+        )
+        numpy.testing.assert_array_equal(first, second)
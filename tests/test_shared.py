@@ -0,0 +1,71 @@
+import numpy
+import os
+import pytest
+from boxscore.shared import SHARED_ALIGNMENT, SharedDataset
+from boxscore.table import GameTable
+from concurrent.futures import ProcessPoolExecutor
+
+def get_columns():
+    """
+    Returns columns of assorted dtypes & lengths
+    """
+    return {
+        "bins": numpy.arange(11, dtype=numpy.int8),
+        "scores": numpy.arange(7, dtype=numpy.int16) * 3,
+        "weights": numpy.linspace(0.0, 1.0, 5),
+        "pairs": numpy.arange(6, dtype=numpy.int64).reshape(3, 2)
+    }
+
+def sum_shared(handle):
+    """
+    Sums each column of a shared dataset from a worker process
+    """
+    return {
+        name: float(values.sum())
+        for name, values in SharedDataset.attach(handle).items()
+    }
+
+def test_attached_views_share_the_published_columns():
+    columns = get_columns()
+    with SharedDataset(columns) as dataset:
+        handle = dataset.get_handle()
+        views = SharedDataset.attach(handle)
+        for name, values in columns.items():
+            numpy.testing.assert_array_equal(views[name], values)
+            assert views[name].dtype == values.dtype
+            assert not views[name].flags.writeable
+        for column in handle["layout"]["columns"].values():
+            assert column["offset"] % SHARED_ALIGNMENT == 0
+        del views
+
+def test_workers_read_the_columns_in_place():
+    columns = get_columns()
+    with SharedDataset(columns) as dataset, \
+            ProcessPoolExecutor(max_workers=2) as executor:
+        sums = list(executor.map(sum_shared, [ dataset.get_handle() ] * 4))
+    for worker_sums in sums:
+        assert worker_sums == {
+            name: float(values.sum()) for name, values in columns.items()
+        }
+
+def test_closed_datasets_are_unlinked():
+    dataset = SharedDataset(get_columns())
+    handle = dataset.get_handle()
+    dataset.close()
+    with pytest.raises(FileNotFoundError):
+        SharedDataset.attach(handle)
+
+def test_memory_mapped_tables_outlive_their_dataset(tmp_path):
+    path = str(tmp_path / "games.bin")
+    table = GameTable({
+        "season": [ 2022, 2023 ],
+        "date": [ "2022-09-11", "2023-09-10" ],
+        "home_score": [ 20, 31 ]
+    })
+    with SharedDataset.from_table(table, path=path) as dataset:
+        handle = dataset.get_handle()
+    assert handle["name"] is None
+    assert os.path.exists(path)
+    attached = SharedDataset.attach_table(handle)
+    for name in table.columns:
+        numpy.testing.assert_array_equal(attached[name], table[name])
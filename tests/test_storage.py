@@ -0,0 +1,62 @@
+import gzip
+import os
+import pytest
+from boxscore.loader import get_years, load_season
+from boxscore.storage import data_exists, \
+                             find_data_path, \
+                             list_data_files, \
+                             read_json, \
+                             set_data_cache, \
+                             write_json
+from conftest import YEAR, get_box_scores
+
+@pytest.mark.parametrize("compress", [ "gzip", "zstd" ])
+def test_compressed_input_lookup(workspace, compress):
+    if compress == "zstd":
+        pytest.importorskip("zstandard")
+    path = workspace.get_path("raw", f"{YEAR}.json")
+    target = write_json(get_box_scores(), path, compress)
+
+    # The uncompressed copy is replaced, and lookups find the compressed one
+    assert not os.path.exists(path)
+    assert find_data_path(path) == target
+    assert data_exists(path)
+    assert read_json(path) == get_box_scores()
+    assert get_years("raw") == [ YEAR ]
+    assert len(load_season(YEAR).score_list) == len(get_box_scores())
+
+def test_uncompressed_lookup_prefers_plain_file(tmp_path):
+    path = str(tmp_path / "x.json")
+    with gzip.open(path + ".gz", "wt") as data:
+        data.write("[1]")
+    assert read_json(path) == [ 1 ]
+    write_json([ 2 ], path)
+    assert find_data_path(path) == path
+    assert not os.path.exists(path + ".gz")
+    assert read_json(path) == [ 2 ]
+
+def test_data_cache_read_after_write_in_memory(tmp_path):
+    path = str(tmp_path / "stage" / "x.json")
+    set_data_cache(True, write_through=False)
+    try:
+        write_json({ 1: (2, 3) }, path)
+
+        # Cached as it would be read back, without touching the disk
+        assert read_json(path) == { "1": [ 2, 3 ] }
+        assert read_json(path + ".gz") == { "1": [ 2, 3 ] }
+        assert not os.path.exists(path)
+        assert data_exists(path)
+        assert list_data_files(str(tmp_path / "stage")) == [ "x.json" ]
+    finally:
+        set_data_cache(False)
+    assert not data_exists(path)
+
+def test_data_cache_write_through(tmp_path):
+    path = str(tmp_path / "x.json")
+    set_data_cache(True)
+    try:
+        write_json([ 1, 2 ], path, "gzip")
+        assert read_json(path) == [ 1, 2 ]
+    finally:
+        set_data_cache(False)
+    assert read_json(path) == [ 1, 2 ]
@@ -0,0 +1,110 @@
+import numpy
+import pytest
+from boxscore.boxscore import BoxScoreList
+from boxscore.cluster import SkillClustering
+from boxscore.storage import read_json
+from boxscore.table import GameTable
+from boxscore.team import TeamDimension, \
+                          get_franchise_name, \
+                          parse_team_season
+from cli.cli import get_cli_args
+from conftest import TEAMS, YEAR, get_box_scores, write_file
+from main import run_command
+
+def test_interning_assigns_dense_ids():
+    dimension = TeamDimension()
+    assert dimension.intern(YEAR, TEAMS[0]) == 0
+    assert dimension.intern(YEAR, TEAMS[1]) == 1
+    assert dimension.intern(YEAR, TEAMS[0]) == 0
+    assert dimension.intern(YEAR - 1, TEAMS[0]) == 2
+    assert dimension.intern_team_season(f"{YEAR} {TEAMS[1]}") == 1
+    assert len(dimension) == 3
+    assert dimension.get_team(2) == (YEAR - 1, TEAMS[0])
+    assert dimension.get_team_season(1) == f"{YEAR} {TEAMS[1]}"
+    assert list(dimension.get_seasons()) == [ YEAR, YEAR, YEAR - 1 ]
+    with pytest.raises(KeyError, match="Team not found"):
+        dimension.get_team_id(YEAR, "Nowhere Nobodies")
+
+def test_relocated_teams_share_a_franchise():
+    assert get_franchise_name("Oakland Raiders") == "Las Vegas Raiders"
+    assert get_franchise_name(TEAMS[0]) == TEAMS[0]
+    assert parse_team_season("1995 St. Louis Rams") == (
+        1995, "St. Louis Rams"
+    )
+    dimension = TeamDimension()
+    oakland = dimension.intern(1995, "Oakland Raiders")
+    los_angeles = dimension.intern(1990, "Los Angeles Raiders")
+    las_vegas = dimension.intern(2020, "Las Vegas Raiders")
+    bears = dimension.intern(2020, "Chicago Bears")
+    franchises = dimension.get_franchise_ids()
+    assert franchises[oakland] == franchises[los_angeles] == \
+        franchises[las_vegas]
+    assert franchises[bears] != franchises[oakland]
+    assert dimension.franchises == [ "Las Vegas Raiders", "Chicago Bears" ]
+
+def test_lookup_indexes_values_by_team_id():
+    dimension = TeamDimension()
+    dimension.intern(YEAR, TEAMS[0])
+    dimension.intern(YEAR, TEAMS[1])
+    values = dimension.lookup({
+        f"{YEAR} {TEAMS[1]}": 4, f"{YEAR} {TEAMS[2]}": 2
+    })
+    assert list(values) == [ 0, 4, 2 ]
+    assert dimension.get_team_id(YEAR, TEAMS[2]) == 2
+
+def test_game_table_columns():
+    scores = get_box_scores()
+    dimension = TeamDimension()
+    table = GameTable.from_box_score_list(
+        BoxScoreList(scores), YEAR, dimension
+    )
+    assert len(table) == len(scores)
+    assert [ dimension.get_team_season(i) for i in table["home_id"] ] == [
+        f"{YEAR} {s['home_team']}" for s in scores
+    ]
+    assert [ dimension.get_team_season(i) for i in table["away_id"] ] == [
+        f"{YEAR} {s['away_team']}" for s in scores
+    ]
+    assert list(table["home_score"]) == [ s["home_score"] for s in scores ]
+    assert list(table["away_score"]) == [ s["away_score"] for s in scores ]
+    assert (table["season"] == YEAR).all()
+
+    # Stacking & taking games keeps every column aligned
+    stacked = GameTable.concat([ table, table ])
+    assert len(stacked) == 2 * len(scores)
+    index = numpy.array([ 3, len(scores) + 3, 7 ])
+    taken = stacked.take(index)
+    for name in table.columns:
+        numpy.testing.assert_array_equal(taken[name], stacked[name][index])
+
+def test_cli_label_joins_the_kmeans_tiers(workspace):
+    # Summarize every team but the last, whose games go unlabeled
+    for side, seed in [ ("offense", 1), ("defense", 2) ]:
+        rng = numpy.random.default_rng(seed)
+        write_file(workspace.get_path("preprocessed", f"{side}.json"), [
+            {
+                "count": 10.0, "mean": mean, "std": 7.0,
+                "min": mean - 10, "25%": mean - 5, "50%": mean,
+                "75%": mean + 5, "max": mean + 10,
+                "team": f"{YEAR} {team}"
+            }
+            for team, mean in zip(TEAMS[:-1], rng.uniform(10, 35, 5))
+        ])
+    run_command(get_cli_args([ "boxscore", "label" ]))
+    offense = SkillClustering.load_or_fit("offense")
+    defense = SkillClustering.load_or_fit("defense")
+    labeled = read_json(workspace.get_path("labeled", f"{YEAR}.json"))
+    expected = [
+        s for s in get_box_scores() if TEAMS[-1] not in (
+            s["home_team"], s["away_team"]
+        )
+    ]
+    assert len(labeled) == len(expected)
+    for game, score in zip(labeled, expected):
+        home = f"{YEAR} {score['home_team']}"
+        away = f"{YEAR} {score['away_team']}"
+        assert game["home_team"] == score["home_team"]
+        assert game["home_offense"] == offense.get_tier(home)
+        assert game["home_defense"] == defense.get_tier(home)
+        assert game["away_offense"] == offense.get_tier(away)
+        assert game["away_defense"] == defense.get_tier(away)
@@ -0,0 +1,52 @@
+import json
+import pytest
+from boxscore.workspace import Workspace, \
+                               find_workspaces, \
+                               get_workspace, \
+                               get_workspace_path
+from cli.cli import get_cli_args
+from conftest import YEAR, get_box_scores, write_file
+from main import main
+
+def test_workspace_paths(workspace):
+    assert get_workspace() is workspace
+    assert get_workspace_path("raw", f"{YEAR}.json") == \
+        f"{workspace.root}/raw/{YEAR}.json"
+    assert Workspace("leagues/nfl/").get_path("state") == "leagues/nfl/state"
+    assert Workspace("leagues/nfl/").name == "nfl"
+    with pytest.raises(Exception, match="Unrecognized workspace stage"):
+        workspace.get_path("scratch")
+
+def test_commands_run_in_each_workspace(workspace, tmp_path, capsys):
+    parent = tmp_path / "leagues"
+    for seed, name in enumerate([ "b", "a" ]):
+        write_file(
+            str(parent / name / "raw" / f"{YEAR}.json"),
+            get_box_scores(seed + 1)
+        )
+    (parent / "notes").mkdir()
+    assert [ w.name for w in find_workspaces(str(parent)) ] == [ "a", "b" ]
+
+    # Each workspace's output is printed in order under its own header
+    main(get_cli_args([
+        "--workspaces-root", str(parent), "-j", "2",
+        "boxscore", "list", "-y", str(YEAR), "-o", "json", "-l", "2"
+    ]))
+    sections = capsys.readouterr().out.split("== ")[1:]
+    assert [ section.split(" ")[0] for section in sections ] == [ "a", "b" ]
+    for section, seed in zip(sections, [ 2, 1 ]):
+        listed = json.loads(section.split("==\n", 1)[1])
+        assert listed == get_box_scores(seed)[:2]
+
+    # A workspace failing doesn't stop the others
+    for root in [ str(parent / "a"), workspace.root ]:
+        write_file(f"{root}/raw/{YEAR - 1}.json", get_box_scores())
+    with pytest.raises(Exception, match=r"Failed in workspaces \['b'\]"):
+        main(get_cli_args([
+            "-w", str(parent / "a"), "-w", workspace.root,
+            "-w", str(parent / "b"),
+            "boxscore", "list", "-y", str(YEAR - 1), "-o", "json"
+        ]))
+    output = capsys.readouterr().out
+    assert output.count("FileNotFoundError") == 1
+    assert output.count(get_box_scores()[0]["date"]) == 2